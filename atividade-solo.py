@@ -18,59 +18,291 @@ Autor: Estudante de Estágio
 Data: Outubro 2024
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import argparse
+from contextlib import redirect_stdout
+import copy
+import sys
+import io
 import time
 import json
 from datetime import datetime
+from driver_pool import DriverPool, PoolExhaustedError, ChromeBoot, LAUNCH_PROFILES, page_ready_state
+from readiness import Readiness
+from command_metrics import CommandMetrics, instrumented
+from locator_cache import LocatorCache, dom_fingerprint, MISSING
+from locator_ladder import LocatorLadder
+from element_snapshot import ElementSnapshot, ELEMENT_HELPERS_JS
 
+AMAZON_URL = "https://www.amazon.com.br"
+
+# Estatísticas de sucesso/latência dos localizadores candidatos (persistidas entre execuções)
+LOCATOR_STATS_FILE = "locator_stats.json"
+
+# Avalia vários seletores CSS/XPath de uma vez: conta os elementos no navegador e resume
+# no máximo sampleLimit deles, sem criar listas com todos os elementos encontrados.
+# Usa ELEMENT_HELPERS_JS (semântica de WebElement.text, get_attribute e is_displayed).
+SELECTOR_BATCH_SCRIPT = ELEMENT_HELPERS_JS + """
+const [queries, attrNames, requireText, sampleLimit = 1] = arguments;
+const scan = (query) => {
+    if (!query.xpath) {
+        const nodes = document.querySelectorAll(query.seletor);
+        return {size: nodes.length, at: (i) => nodes[i], elementsOnly: true};
+    }
+    const snapshot = document.evaluate(query.seletor, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return {size: snapshot.snapshotLength, at: (i) => snapshot.snapshotItem(i), elementsOnly: false};
+};
+const summarize = (el) => {
+    const rect = el.getBoundingClientRect();
+    const attributes = {};
+    attrNames.forEach((name) => { attributes[name] = attribute(el, name); });
+    const dataAttributes = {};
+    Array.from(el.attributes).forEach((attr) => {
+        if (attr.name.startsWith('data-')) { dataAttributes[attr.name] = attr.value; }
+    });
+    return {
+        tag_name: el.tagName.toLowerCase(),
+        texto: visibleText(el),
+        atributos: attributes,
+        atributos_data: dataAttributes,
+        visivel: displayed(el),
+        rect: {x: rect.left + window.scrollX, y: rect.top + window.scrollY, width: rect.width, height: rect.height}
+    };
+};
+return queries.map((query) => {
+    let found;
+    try { found = scan(query); } catch (e) { return {quantidade: 0, amostra: [], erro: String(e.message || e)}; }
+    const sample = [];
+    let count = 0;
+    if (found.elementsOnly && !requireText) {
+        // Sem filtro a contagem já vem pronta do NodeList
+        count = found.size;
+        for (let i = 0; i < Math.min(count, sampleLimit); i++) { sample.push(found.at(i)); }
+    } else {
+        for (let i = 0; i < found.size; i++) {
+            const el = found.at(i);
+            if (el.nodeType !== Node.ELEMENT_NODE || (requireText && visibleText(el) === '')) { continue; }
+            if (count < sampleLimit) { sample.push(el); }
+            count++;
+        }
+    }
+    return {quantidade: count, amostra: sample.map(summarize)};
+});
+"""
 class EcommerceMappingDemo:
-    def __init__(self, headless=False):
-        """Inicializa o navegador para demonstração de mapeamento"""
+    # Ordem oficial das estratégias (define a ordem de mapping_results)
+    STRATEGY_NAMES = [
+        'strategy_1_by_id',
+        'strategy_2_by_name',
+        'strategy_3_by_class_name',
+        'strategy_4_by_tag_name',
+        'strategy_5_by_css_selector',
+        'strategy_6_by_xpath',
+        'strategy_7_by_data_attributes',
+        'strategy_8_by_attribute_contains',
+        'strategy_9_by_pseudo_selectors',
+        'strategy_10_by_multiple_attributes',
+        'strategy_11_by_xpath_advanced',
+        'strategy_12_by_text_content',
+        'strategy_13_by_position_context'
+    ]
+    
+    # Estratégias que alteram a página (digitam, clicam) e precisam de sessão isolada
+    MUTATING_STRATEGIES = {'strategy_1_by_id'}
+    
+    # Estratégias que só consultam a página em lote (_evaluate_selectors), sem WebElements
+    BATCH_STRATEGIES = [STRATEGY_NAMES[3]] + STRATEGY_NAMES[5:]
+    
+    # Seletores testados pelas estratégias em lote
+    NAV_LINKS_XPATH = "//div[@id='nav-main']//a[contains(@class, 'nav-a')]"
+    # Atributos data-* (e de acessibilidade) mais comuns na Amazon
+    DATA_SELECTORS = [
+        "[data-nav-role]",
+        "[data-cy]",
+        "[aria-label]",
+        "[role]",
+        "[tabindex]"
+    ]
+    # (atributo, texto procurado, seletor) para atributos que contenham texto específico
+    ATTRIBUTE_SELECTORS = [
+        ("href", "amazon", "[href*='amazon']"),
+        ("class", "nav", "[class*='nav']"),
+        ("id", "search", "[id*='search']"),
+        ("placeholder", "pesquis", "[placeholder*='pesquis' i]"),
+        ("alt", "amazon", "[alt*='amazon' i]")
+    ]
+    PSEUDO_SELECTORS = [
+        ("Primeiro link da página", "a:first-of-type"),
+        ("Último item de lista", "li:last-child"),
+        ("Elementos pares", "div:nth-child(even)"),
+        ("Links com href", "a[href]:not([href=''])"),
+        ("Inputs habilitados", "input:not([disabled])")
+    ]
+    MULTI_SELECTORS = [
+        ("Botão de busca", "input[type='submit'][class*='nav']"),
+        ("Links de navegação", "a[class*='nav'][href]"),
+        ("Imagens com alt", "img[alt][src]"),
+        ("Inputs de texto", "input[type='text'][name]"),
+        ("Elementos visíveis", "div[style*='display'][class]")
+    ]
+    XPATH_SELECTORS = [
+        ("Elementos com texto específico", "//*[contains(text(), 'Amazon') or contains(text(), 'Prime')]"),
+        ("Links por posição", "//nav//a[position()<=3]"),
+        ("Elementos com classe específica", "//div[contains(@class, 'nav') and @id]"),
+        ("Elementos irmãos", "//input/following-sibling::*"),
+        ("Elementos pais de imagens", "//img/parent::*")
+    ]
+    TEXT_PATTERNS = [
+        ("Elementos com Login/Conta", "//*[contains(text(), 'Login') or contains(text(), 'Conta') or contains(text(), 'Entrar') or contains(text(), 'Olá')]"),
+        ("Texto de Preço", "//*[contains(text(), 'R$') or contains(text(), 'reais') or contains(text(), '%')]"),
+        ("Elementos de navegação", "//*[contains(text(), 'Livros') or contains(text(), 'Prime') or contains(text(), 'Casa')]"),
+        ("Títulos de Seção", "//*[self::h1 or self::h2 or self::h3 or self::span][normalize-space(text())]"),
+        ("Texto de Ofertas", "//*[contains(text(), 'oferta') or contains(text(), 'desconto') or contains(text(), 'off')]")
+    ]
+    POSITION_SELECTORS = [
+        ("Primeiro item do header", "header *:first-child, [role='banner'] *:first-child"),
+        ("Último item do footer", "footer *:last-child, [role='contentinfo'] *:last-child"),
+        ("Elementos centrais", "div:nth-child(even)"),
+        ("Primeiros links de cada nav", "nav a:first-of-type"),
+        ("Elementos após inputs", "input + *, input ~ *")
+    ]
+    
+    # Consulta de cada estratégia em lote (argumentos de _evaluate_selectors), usada tanto
+    # pelo Selenium quanto pelo backend CDP
+    BATCH_QUERIES = {
+        'strategy_4_by_tag_name': {
+            'queries': [(By.TAG_NAME, "img")], 'attributes': ('src', 'alt', 'width', 'height'), 'sample': 3},
+        'strategy_6_by_xpath': {
+            'queries': [(By.XPATH, NAV_LINKS_XPATH)], 'attributes': ('href', 'class'), 'sample': 5},
+        'strategy_7_by_data_attributes': {
+            'queries': [(By.CSS_SELECTOR, selector) for selector in DATA_SELECTORS]},
+        'strategy_8_by_attribute_contains': {
+            'queries': [(By.CSS_SELECTOR, selector) for _, _, selector in ATTRIBUTE_SELECTORS],
+            'attributes': [attr_name for attr_name, _, _ in ATTRIBUTE_SELECTORS]},
+        'strategy_9_by_pseudo_selectors': {
+            'queries': [(By.CSS_SELECTOR, selector) for _, selector in PSEUDO_SELECTORS], 'attributes': ['class']},
+        'strategy_10_by_multiple_attributes': {
+            'queries': [(By.CSS_SELECTOR, selector) for _, selector in MULTI_SELECTORS],
+            'attributes': ['id', 'class', 'name']},
+        'strategy_11_by_xpath_advanced': {
+            'queries': [(By.XPATH, xpath) for _, xpath in XPATH_SELECTORS]},
+        # Filtra no navegador apenas elementos que realmente têm texto visível
+        'strategy_12_by_text_content': {
+            'queries': [(By.XPATH, xpath) for _, xpath in TEXT_PATTERNS], 'require_text': True},
+        'strategy_13_by_position_context': {
+            'queries': [(By.CSS_SELECTOR, selector) for _, selector in POSITION_SELECTORS]},
+    }
+    
+    def __init__(self, headless=False, pool=None, url=AMAZON_URL, locator_cache=None, locator_ladder=None,
+                 offline=False, site_name=None, profile=None):
+        """Inicializa o navegador para demonstração de mapeamento (ou empresta uma sessão do pool)
+        
+        locator_cache (LocatorCache) permite compartilhar ou persistir em disco o cache de
+        resultados; por padrão cada instância tem um cache em memória.
+        locator_ladder (LocatorLadder) guarda as estatísticas dos localizadores candidatos;
+        por padrão são lidas e gravadas em LOCATOR_STATS_FILE.
+        offline=True não abre navegador (usado pelo backend assíncrono CDP).
+        site_name aparece nas mensagens e no relatório (padrão: domínio da URL).
+        profile escolhe o perfil de inicialização do Chrome ('default', 'lean' ou um dicionário,
+        ver driver_pool.LAUNCH_PROFILES); com pool vale o perfil do pool.
+        
+        Sem pool, o Chrome sobe numa thread de fundo enquanto o restante é preparado;
+        a primeira leitura de self.driver aguarda o navegador ficar pronto.
+        """
+        self._boot = ChromeBoot(headless, stealth=True, profile=profile) if not offline and pool is None else None
+        self._created_at = time.perf_counter()
+        self.startup = {}
+        
         print("🛒 DEMONSTRAÇÃO DE MAPEAMENTO DE ELEMENTOS E-COMMERCE")
         print("=" * 60)
         
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.service = Service()
-        self.driver = webdriver.Chrome(service=self.service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 15)
+        self.pool = pool
+        self.headless = headless
+        self.profile = pool.profile if pool is not None else profile
+        self.url = url
+        self.site_name = site_name or ('Amazon Brasil' if url == AMAZON_URL else urlsplit(url).netloc)
+        self._driver = None
+        self.metrics = CommandMetrics()
+        self.readiness = Readiness(None, timeout=15)
         self.mapping_results = []
+        self.last_run_seconds = None
+        self.locator_cache = locator_cache if locator_cache is not None else LocatorCache()
+        self.locator_ladder = locator_ladder if locator_ladder is not None else LocatorLadder(LOCATOR_STATS_FILE)
+        self.dom_fingerprint = None
         
-        print("🚀 Navegador iniciado com sucesso!")
+        if offline:
+            return
+        
+        if pool is not None:
+            self._attach_driver(pool.checkout())
+            print("🚀 Sessão do pool emprestada com sucesso!")
+        else:
+            print("🚀 Iniciando navegador em segundo plano...")
+    
+    @property
+    def driver(self):
+        """Sessão do navegador; a primeira leitura aguarda o Chrome iniciado em segundo plano"""
+        if self._boot is not None:
+            boot, self._boot = self._boot, None
+            self._attach_driver(boot.result())
+            self.startup['boot_chrome_s'] = round(boot.seconds, 3)
+            print(f"🚀 Navegador iniciado com sucesso! ({boot.seconds:.2f}s em segundo plano)")
+        return self._driver
+    
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
+    
+    def _attach_driver(self, driver):
+        """Instrumenta a sessão e prepara as esperas"""
+        self._driver = driver
+        self.metrics.instrument(driver)
+        self._prepare_session(driver)
+    
+    def _prepare_session(self, driver):
+        """Oculta navigator.webdriver e cria as esperas da sessão (principal ou de um worker)"""
+        # support.ui carrega selenium.webdriver.remote: importado aqui, depois do boot em segundo plano
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        self.wait = WebDriverWait(driver, 15)
+        self.readiness = Readiness(driver, timeout=15, ready_state=page_ready_state(self.profile),
+                                   report=self.readiness.report)
+    
+    def _record_first_navigation(self):
+        """Registra o tempo da criação (início do boot do Chrome) até a primeira navegação"""
+        if 'primeira_navegacao_s' in self.startup:
+            return
+        self.startup['primeira_navegacao_s'] = round(time.perf_counter() - self._created_at, 3)
+        print(f"⏱️  Primeira navegação {self.startup['primeira_navegacao_s']:.2f}s após a criação")
     
+    @instrumented
     def load_amazon_homepage(self):
-        """Carrega a página inicial da Amazon Brasil"""
+        """Carrega a página inicial do site (Amazon Brasil por padrão)"""
         try:
-            print("\n🌐 Carregando Amazon Brasil...")
-            self.driver.get("https://www.amazon.com.br")
+            print(f"\n🌐 Carregando {self.site_name}...")
+            self.driver.get(self.url)
+            self._record_first_navigation()
             
             # Aguarda o carregamento da página
+            from selenium.webdriver.support import expected_conditions as EC
             self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            print("✅ Amazon carregada com sucesso!")
+            print(f"✅ {self.site_name} carregado com sucesso!")
             
-            # Aguarda um pouco mais para garantir carregamento completo
-            time.sleep(3)
+            # Aguarda documento completo e rede ociosa (no máximo 15s)
+            self.readiness.page_loaded()
+            self.dom_fingerprint = dom_fingerprint(self.driver)
             return True
             
         except TimeoutException:
-            print("❌ Erro: Tempo limite para carregar a Amazon")
+            print(f"❌ Erro: Tempo limite para carregar {self.site_name}")
             return False
     
+    @instrumented
     def strategy_1_by_id(self):
         """Estratégia 1: Localização por ID"""
         print("\n🎯 ESTRATÉGIA 1: By.ID")
@@ -79,20 +311,21 @@ class EcommerceMappingDemo:
         try:
             # Tenta encontrar a barra de pesquisa por ID
             search_box = self.driver.find_element(By.ID, "twotabsearchtextbox")
+            snapshot = ElementSnapshot.capture(self.driver, search_box)
             
             result = {
                 'estrategia': 'By.ID',
                 'elemento': 'Barra de Pesquisa',
                 'localizador': 'twotabsearchtextbox',
                 'encontrado': True,
-                'tag_name': search_box.tag_name,
-                'texto_placeholder': search_box.get_attribute('placeholder'),
+                'tag_name': snapshot.tag_name,
+                'texto_placeholder': snapshot.get_attribute('placeholder'),
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
-            print(f"✅ Elemento encontrado: {search_box.tag_name}")
-            print(f"   ID: {search_box.get_attribute('id')}")
-            print(f"   Placeholder: {search_box.get_attribute('placeholder')}")
+            print(f"✅ Elemento encontrado: {snapshot.tag_name}")
+            print(f"   ID: {snapshot.get_attribute('id')}")
+            print(f"   Placeholder: {snapshot.get_attribute('placeholder')}")
             
             # Demonstração: digita algo na busca
             search_box.clear()
@@ -114,6 +347,7 @@ class EcommerceMappingDemo:
         
         self.mapping_results.append(result)
     
+    @instrumented
     def strategy_2_by_name(self):
         """Estratégia 2: Localização por NAME"""
         print("\n🎯 ESTRATÉGIA 2: By.NAME")
@@ -121,7 +355,7 @@ class EcommerceMappingDemo:
         
         try:
             # Procura por elementos com atributo name
-            search_field = self.driver.find_element(By.NAME, "field-keywords")
+            search_field = ElementSnapshot.capture(self.driver, self.driver.find_element(By.NAME, "field-keywords"))
             
             result = {
                 'estrategia': 'By.NAME',
@@ -151,33 +385,34 @@ class EcommerceMappingDemo:
         
         self.mapping_results.append(result)
     
+    @instrumented
     def strategy_3_by_class_name(self):
         """Estratégia 3: Localização por CLASS_NAME"""
         print("\n🎯 ESTRATÉGIA 3: By.CLASS_NAME")
         print("-" * 40)
         
         try:
-            # Procura por botões ou elementos com classes específicas
-            nav_elements = self.driver.find_elements(By.CLASS_NAME, "nav-line-1")
+            # Procura por botões ou elementos com classes específicas (contados no navegador)
+            nav_elements = self.find_bounded(By.CLASS_NAME, "nav-line-1", limit=1, attributes=('class',))
             
-            if nav_elements:
-                element = nav_elements[0]
+            if nav_elements['quantidade']:
+                element = nav_elements['primeiro']
                 result = {
                     'estrategia': 'By.CLASS_NAME',
                     'elemento': 'Elemento de Navegação',
                     'localizador': 'nav-line-1',
                     'encontrado': True,
-                    'quantidade_encontrada': len(nav_elements),
-                    'tag_name': element.tag_name,
-                    'texto': element.text,
-                    'classes': element.get_attribute('class'),
+                    'quantidade_encontrada': nav_elements['quantidade'],
+                    'tag_name': element['tag_name'],
+                    'texto': element['texto'],
+                    'classes': element['atributos']['class'],
                     'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
-                print(f"✅ {len(nav_elements)} elemento(s) encontrado(s)")
-                print(f"   Primeiro elemento: {element.tag_name}")
-                print(f"   Texto: '{element.text}'")
-                print(f"   Classes: {element.get_attribute('class')}")
+                print(f"✅ {nav_elements['quantidade']} elemento(s) encontrado(s)")
+                print(f"   Primeiro elemento: {element['tag_name']}")
+                print(f"   Texto: '{element['texto']}'")
+                print(f"   Classes: {element['atributos']['class']}")
             else:
                 raise NoSuchElementException()
                 
@@ -194,38 +429,36 @@ class EcommerceMappingDemo:
         
         self.mapping_results.append(result)
     
-    def strategy_4_by_tag_name(self):
+    @instrumented
+    def strategy_4_by_tag_name(self, batch=None):
         """Estratégia 4: Localização por TAG_NAME"""
         print("\n🎯 ESTRATÉGIA 4: By.TAG_NAME")
         print("-" * 40)
         
         try:
-            # Procura por todas as imagens na página
-            images = self.driver.find_elements(By.TAG_NAME, "img")
+            # Conta todas as imagens no navegador e traz só as 3 primeiras
+            if batch is None:
+                batch = self._query_batch('strategy_4_by_tag_name')
+            images = batch[0]
+            if images.get('erro'):
+                raise RuntimeError(images['erro'])
             
             result = {
                 'estrategia': 'By.TAG_NAME',
                 'elemento': 'Imagens',
                 'localizador': 'img',
                 'encontrado': True,
-                'quantidade_total': len(images),
+                'quantidade_total': images['quantidade'],
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
-            print(f"✅ {len(images)} imagens encontradas na página")
+            print(f"✅ {images['quantidade']} imagens encontradas na página")
             
             # Analisa as primeiras 3 imagens
             images_info = []
-            for i, img in enumerate(images[:3]):
-                img_info = {
-                    'posicao': i + 1,
-                    'src': img.get_attribute('src'),
-                    'alt': img.get_attribute('alt'),
-                    'width': img.get_attribute('width'),
-                    'height': img.get_attribute('height')
-                }
-                images_info.append(img_info)
-                print(f"   Imagem {i+1}: alt='{img.get_attribute('alt')}'")
+            for i, img in enumerate(images['amostra']):
+                images_info.append({'posicao': i + 1, **img['atributos']})
+                print(f"   Imagem {i+1}: alt='{img['atributos']['alt']}'")
             
             result['amostra_imagens'] = images_info
             
@@ -242,94 +475,93 @@ class EcommerceMappingDemo:
         
         self.mapping_results.append(result)
     
+    @instrumented
     def strategy_5_by_css_selector(self):
         """Estratégia 5: Localização por CSS_SELECTOR"""
         print("\n🎯 ESTRATÉGIA 5: By.CSS_SELECTOR")
         print("-" * 40)
         
+        # Candidatos em ordem declarada; a escada passa a tentar primeiro o que costuma funcionar
+        candidates = [
+            (By.CSS_SELECTOR, "input[type='submit'][value='Ir']"),
+            (By.CSS_SELECTOR, "#nav-search-submit-button")
+        ]
+        
         try:
-            # Usa seletor CSS complexo para encontrar botão de busca
-            search_button = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit'][value='Ir']")
+            element, (_, selector), attempts = self.locator_ladder.find(
+                self.driver, 'strategy_5_botao_busca', candidates)
+            search_button = ElementSnapshot.capture(self.driver, element)
             
             result = {
                 'estrategia': 'By.CSS_SELECTOR',
-                'elemento': 'Botão de Busca',
-                'localizador': "input[type='submit'][value='Ir']",
+                'elemento': 'Botão de Busca' if selector == candidates[0][1] else 'Botão de Busca (alternativo)',
+                'localizador': selector,
                 'encontrado': True,
                 'tag_name': search_button.tag_name,
+                'id': search_button.get_attribute('id'),
                 'type': search_button.get_attribute('type'),
                 'value': search_button.get_attribute('value'),
                 'classes': search_button.get_attribute('class'),
+                'tentativas': attempts,
+                'estatisticas_candidatos': self.locator_ladder.summary('strategy_5_botao_busca'),
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
-            print(f"✅ Elemento encontrado: {search_button.tag_name}")
-            print(f"   Type: {search_button.get_attribute('type')}")
-            print(f"   Value: {search_button.get_attribute('value')}")
-            print(f"   Classes: {search_button.get_attribute('class')}")
+            print(f"✅ Elemento encontrado com '{selector}' ({attempts} tentativa(s)): {search_button.tag_name}")
+            print(f"   Type: {result['type']}")
+            print(f"   Value: {result['value']}")
+            print(f"   Classes: {result['classes']}")
             
         except NoSuchElementException:
-            # Tenta um seletor alternativo
-            try:
-                search_button = self.driver.find_element(By.CSS_SELECTOR, "#nav-search-submit-button")
-                result = {
-                    'estrategia': 'By.CSS_SELECTOR',
-                    'elemento': 'Botão de Busca (alternativo)',
-                    'localizador': "#nav-search-submit-button",
-                    'encontrado': True,
-                    'tag_name': search_button.tag_name,
-                    'id': search_button.get_attribute('id'),
-                    'type': search_button.get_attribute('type'),
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                print(f"✅ Elemento encontrado (seletor alternativo): {search_button.tag_name}")
-                print(f"   ID: {search_button.get_attribute('id')}")
-            except NoSuchElementException:
-                result = {
-                    'estrategia': 'By.CSS_SELECTOR',
-                    'elemento': 'Botão de Busca',
-                    'localizador': "input[type='submit'][value='Ir']",
-                    'encontrado': False,
-                    'erro': 'Elemento não encontrado',
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                print("❌ Elemento não encontrado por CSS_SELECTOR")
+            result = {
+                'estrategia': 'By.CSS_SELECTOR',
+                'elemento': 'Botão de Busca',
+                'localizador': candidates[0][1],
+                'encontrado': False,
+                'erro': 'Elemento não encontrado',
+                'tentativas': len(candidates),
+                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            print("❌ Elemento não encontrado por CSS_SELECTOR")
         
         self.mapping_results.append(result)
     
-    def strategy_6_by_xpath(self):
+    @instrumented
+    def strategy_6_by_xpath(self, batch=None):
         """Estratégia 6: Localização por XPATH"""
         print("\n🎯 ESTRATÉGIA 6: By.XPATH")
         print("-" * 40)
         
         try:
-            # Usa XPath para encontrar links no menu de navegação
-            nav_links = self.driver.find_elements(By.XPATH, "//div[@id='nav-main']//a[contains(@class, 'nav-a')]")
+            # Usa XPath para encontrar links no menu de navegação (contados no navegador)
+            if batch is None:
+                batch = self._query_batch('strategy_6_by_xpath')
+            nav_links = batch[0]
             
-            if nav_links:
+            if nav_links['quantidade']:
                 result = {
                     'estrategia': 'By.XPATH',
                     'elemento': 'Links de Navegação',
-                    'localizador': "//div[@id='nav-main']//a[contains(@class, 'nav-a')]",
+                    'localizador': self.NAV_LINKS_XPATH,
                     'encontrado': True,
-                    'quantidade_encontrada': len(nav_links),
+                    'quantidade_encontrada': nav_links['quantidade'],
                     'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
-                print(f"✅ {len(nav_links)} links de navegação encontrados")
+                print(f"✅ {nav_links['quantidade']} links de navegação encontrados")
                 
                 # Lista os primeiros 5 links
                 links_info = []
-                for i, link in enumerate(nav_links[:5]):
+                for i, link in enumerate(nav_links['amostra']):
                     link_info = {
                         'posicao': i + 1,
-                        'texto': link.text.strip(),
-                        'href': link.get_attribute('href'),
-                        'classes': link.get_attribute('class')
+                        'texto': link['texto'],
+                        'href': link['atributos']['href'],
+                        'classes': link['atributos']['class']
                     }
                     links_info.append(link_info)
-                    if link.text.strip():
-                        print(f"   Link {i+1}: '{link.text.strip()}'")
+                    if link['texto']:
+                        print(f"   Link {i+1}: '{link['texto']}'")
                 
                 result['amostra_links'] = links_info
             else:
@@ -339,7 +571,7 @@ class EcommerceMappingDemo:
             result = {
                 'estrategia': 'By.XPATH',
                 'elemento': 'Links de Navegação',
-                'localizador': "//div[@id='nav-main']//a[contains(@class, 'nav-a')]",
+                'localizador': self.NAV_LINKS_XPATH,
                 'encontrado': False,
                 'erro': 'Elemento não encontrado',
                 'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -348,46 +580,88 @@ class EcommerceMappingDemo:
         
         self.mapping_results.append(result)
     
-    def strategy_7_by_data_attributes(self):
+    @staticmethod
+    def _to_query(by, selector):
+        """Converte um localizador do Selenium na consulta CSS/XPath do SELECTOR_BATCH_SCRIPT"""
+        if by == By.XPATH:
+            return {'xpath': True, 'seletor': selector}
+        if by in (By.CSS_SELECTOR, By.TAG_NAME):
+            return {'xpath': False, 'seletor': selector}
+        if by == By.CLASS_NAME:
+            return {'xpath': False, 'seletor': f".{selector}"}
+        raise ValueError(f"Localizador não suportado na avaliação em lote: {by}")
+    
+    @classmethod
+    def _selector_request(cls, queries, attributes=(), require_text=False, sample=1):
+        """Argumentos do SELECTOR_BATCH_SCRIPT para uma lista de localizadores"""
+        payload = [cls._to_query(by, selector) for by, selector in queries]
+        return (payload, list(attributes), require_text, max(1, sample))
+    
+    @classmethod
+    def batch_request(cls, name):
+        """Argumentos do SELECTOR_BATCH_SCRIPT da estratégia em lote name (ver BATCH_QUERIES)"""
+        return cls._selector_request(**cls.BATCH_QUERIES[name])
+    
+    @staticmethod
+    def _summarize_batch(results):
+        """Normaliza a resposta do SELECTOR_BATCH_SCRIPT (location/size e 'primeiro')"""
+        for result in results:
+            for element in result['amostra']:
+                rect = element.pop('rect')
+                element['location'] = {'x': round(rect['x']), 'y': round(rect['y'])}
+                element['size'] = {'height': int(rect['height']), 'width': int(rect['width'])}
+            result['primeiro'] = result['amostra'][0] if result['amostra'] else None
+        return results
+    
+    def _evaluate_selectors(self, queries, attributes=(), require_text=False, sample=1):
+        """Avalia uma lista de seletores (CSS, tag, classe ou XPath) em uma única chamada ao navegador
+        
+        Retorna, por seletor, a quantidade total encontrada (contada no navegador) e o resumo
+        de no máximo sample elementos em 'amostra' ('primeiro' é o primeiro deles).
+        Com require_text=True considera apenas elementos com texto visível.
+        """
+        request = self._selector_request(queries, attributes, require_text, sample)
+        return self._summarize_batch(self.driver.execute_script(SELECTOR_BATCH_SCRIPT, *request))
+    
+    def _query_batch(self, name):
+        """Avalia no navegador a consulta da estratégia em lote name"""
+        return self._evaluate_selectors(**self.BATCH_QUERIES[name])
+    
+    def find_bounded(self, by, selector, limit=3, attributes=(), require_text=False):
+        """Conta os elementos do localizador e resume no máximo limit deles (um comando WebDriver)
+        
+        Substitui find_elements quando só interessam len() e alguns exemplos: o custo não
+        depende de quantos elementos a página tem.
+        """
+        return self._evaluate_selectors([(by, selector)], attributes, require_text, sample=limit)[0]
+    
+    @instrumented
+    def strategy_7_by_data_attributes(self, batch=None):
         """Estratégia 7: Localização por Atributos Data-* (CSS Selector)"""
         print("\n🎯 ESTRATÉGIA 7: By DATA ATTRIBUTES")
         print("-" * 40)
         
-        # Procura por elementos com atributos data-* mais comuns na Amazon
-        data_selectors = [
-            "[data-nav-role]",
-            "[data-cy]",
-            "[aria-label]",
-            "[role]",
-            "[tabindex]"
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_7_by_data_attributes')
         
         found_elements = []
-        for selector in data_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    first_element = elements[0]
-                    element_info = {
-                        'seletor': selector,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'atributos_data': {attr: first_element.get_attribute(attr) 
-                                             for attr in first_element.get_property('attributes') 
-                                             if isinstance(first_element.get_property('attributes'), dict) and attr.startswith('data-')},
-                            'texto': first_element.text[:50] if first_element.text else 'Sem texto'
-                        }
+        for selector, evaluated in zip(self.DATA_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                element_info = {
+                    'seletor': selector,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'atributos_data': first_element['atributos_data'],
+                        'texto': first_element['texto'][:50] if first_element['texto'] else 'Sem texto'
                     }
-                    found_elements.append(element_info)
-                    print(f"✅ {len(elements)} elemento(s) encontrado(s) com {selector}")
-                    print(f"   Tag: {first_element.tag_name}")
-                else:
-                    raise NoSuchElementException()
-                    
-            except (NoSuchElementException, Exception):
+                }
+                found_elements.append(element_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) encontrado(s) com {selector}")
+                print(f"   Tag: {first_element['tag_name']}")
+            else:
                 element_info = {
                     'seletor': selector,
                     'encontrado': False,
@@ -401,53 +675,42 @@ class EcommerceMappingDemo:
             'estrategia': 'By.DATA_ATTRIBUTES',
             'elemento': 'Elementos com Data Attributes',
             'encontrados': len([elem for elem in found_elements if elem['encontrado']]),
-            'total_testados': len(data_selectors),
+            'total_testados': len(self.DATA_SELECTORS),
             'detalhes': found_elements,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_8_by_attribute_contains(self):
+    @instrumented
+    def strategy_8_by_attribute_contains(self, batch=None):
         """Estratégia 8: Localização por Atributos que Contêm Texto"""
         print("\n🎯 ESTRATÉGIA 8: By ATTRIBUTE CONTAINS")
         print("-" * 40)
         
-        # Testa seletores que procuram por atributos que contenham texto específico
-        attribute_selectors = [
-            ("href", "amazon", "[href*='amazon']"),
-            ("class", "nav", "[class*='nav']"),
-            ("id", "search", "[id*='search']"),
-            ("placeholder", "pesquis", "[placeholder*='pesquis' i]"),
-            ("alt", "amazon", "[alt*='amazon' i]")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_8_by_attribute_contains')
         
         found_by_attributes = []
-        for attr_name, search_text, selector in attribute_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    first_element = elements[0]
-                    attr_info = {
-                        'atributo': attr_name,
-                        'texto_procurado': search_text,
-                        'seletor': selector,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'valor_atributo': first_element.get_attribute(attr_name),
-                            'texto': first_element.text[:30] if first_element.text else 'Sem texto'
-                        }
+        for (attr_name, search_text, selector), evaluated in zip(self.ATTRIBUTE_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                attr_info = {
+                    'atributo': attr_name,
+                    'texto_procurado': search_text,
+                    'seletor': selector,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'valor_atributo': first_element['atributos'][attr_name],
+                        'texto': first_element['texto'][:30] if first_element['texto'] else 'Sem texto'
                     }
-                    found_by_attributes.append(attr_info)
-                    print(f"✅ {len(elements)} elemento(s) com {attr_name} contendo '{search_text}'")
-                    print(f"   Valor: {first_element.get_attribute(attr_name)}")
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+                }
+                found_by_attributes.append(attr_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) com {attr_name} contendo '{search_text}'")
+                print(f"   Valor: {first_element['atributos'][attr_name]}")
+            else:
                 attr_info = {
                     'atributo': attr_name,
                     'texto_procurado': search_text,
@@ -463,51 +726,41 @@ class EcommerceMappingDemo:
             'estrategia': 'By.ATTRIBUTE_CONTAINS',
             'elemento': 'Elementos por Atributos que Contêm Texto',
             'encontrados': len([attr for attr in found_by_attributes if attr['encontrado']]),
-            'total_testados': len(attribute_selectors),
+            'total_testados': len(self.ATTRIBUTE_SELECTORS),
             'detalhes': found_by_attributes,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_9_by_pseudo_selectors(self):
+    @instrumented
+    def strategy_9_by_pseudo_selectors(self, batch=None):
         """Estratégia 9: Localização por Pseudo-Seletores CSS"""
         print("\n🎯 ESTRATÉGIA 9: By PSEUDO SELECTORS")
         print("-" * 40)
         
-        pseudo_selectors = [
-            ("Primeiro link da página", "a:first-of-type"),
-            ("Último item de lista", "li:last-child"),
-            ("Elementos pares", "div:nth-child(even)"),
-            ("Links com href", "a[href]:not([href=''])"),
-            ("Inputs habilitados", "input:not([disabled])")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_9_by_pseudo_selectors')
         
         pseudo_results = []
-        for description, selector in pseudo_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    first_element = elements[0]
-                    pseudo_info = {
-                        'descricao': description,
-                        'seletor': selector,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'texto': first_element.text[:40] if first_element.text else 'Sem texto',
-                            'classes': first_element.get_attribute('class')
-                        }
+        for (description, selector), evaluated in zip(self.PSEUDO_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                pseudo_info = {
+                    'descricao': description,
+                    'seletor': selector,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'texto': first_element['texto'][:40] if first_element['texto'] else 'Sem texto',
+                        'classes': first_element['atributos']['class']
                     }
-                    pseudo_results.append(pseudo_info)
-                    print(f"✅ {len(elements)} elemento(s) - {description}")
-                    print(f"   Tag: {first_element.tag_name}, Texto: '{first_element.text[:30]}'")
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+                }
+                pseudo_results.append(pseudo_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) - {description}")
+                print(f"   Tag: {first_element['tag_name']}, Texto: '{first_element['texto'][:30]}'")
+            else:
                 pseudo_info = {
                     'descricao': description,
                     'seletor': selector,
@@ -522,54 +775,44 @@ class EcommerceMappingDemo:
             'estrategia': 'By.PSEUDO_SELECTORS',
             'elemento': 'Elementos por Pseudo-Seletores',
             'encontrados': len([p for p in pseudo_results if p['encontrado']]),
-            'total_testados': len(pseudo_selectors),
+            'total_testados': len(self.PSEUDO_SELECTORS),
             'detalhes': pseudo_results,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_10_by_multiple_attributes(self):
+    @instrumented
+    def strategy_10_by_multiple_attributes(self, batch=None):
         """Estratégia 10: Localização por Múltiplos Atributos Combinados"""
         print("\n🎯 ESTRATÉGIA 10: By MULTIPLE ATTRIBUTES")
         print("-" * 40)
         
-        multi_selectors = [
-            ("Botão de busca", "input[type='submit'][class*='nav']"),
-            ("Links de navegação", "a[class*='nav'][href]"),
-            ("Imagens com alt", "img[alt][src]"),
-            ("Inputs de texto", "input[type='text'][name]"),
-            ("Elementos visíveis", "div[style*='display'][class]")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_10_by_multiple_attributes')
         
         multi_results = []
-        for description, selector in multi_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    first_element = elements[0]
-                    multi_info = {
-                        'descricao': description,
-                        'seletor': selector,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'atributos': {
-                                'id': first_element.get_attribute('id'),
-                                'class': first_element.get_attribute('class'),
-                                'name': first_element.get_attribute('name')
-                            }
+        for (description, selector), evaluated in zip(self.MULTI_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                multi_info = {
+                    'descricao': description,
+                    'seletor': selector,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'atributos': {
+                            'id': first_element['atributos']['id'],
+                            'class': first_element['atributos']['class'],
+                            'name': first_element['atributos']['name']
                         }
                     }
-                    multi_results.append(multi_info)
-                    print(f"✅ {len(elements)} elemento(s) - {description}")
-                    print(f"   ID: {first_element.get_attribute('id')}")
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+                }
+                multi_results.append(multi_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) - {description}")
+                print(f"   ID: {first_element['atributos']['id']}")
+            else:
                 multi_info = {
                     'descricao': description,
                     'seletor': selector,
@@ -584,51 +827,41 @@ class EcommerceMappingDemo:
             'estrategia': 'By.MULTIPLE_ATTRIBUTES',
             'elemento': 'Elementos por Múltiplos Atributos',
             'encontrados': len([m for m in multi_results if m['encontrado']]),
-            'total_testados': len(multi_selectors),
+            'total_testados': len(self.MULTI_SELECTORS),
             'detalhes': multi_results,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_11_by_xpath_advanced(self):
+    @instrumented
+    def strategy_11_by_xpath_advanced(self, batch=None):
         """Estratégia 11: XPath Avançado com Condições"""
         print("\n🎯 ESTRATÉGIA 11: By XPATH ADVANCED")
         print("-" * 40)
         
-        xpath_selectors = [
-            ("Elementos com texto específico", "//*[contains(text(), 'Amazon') or contains(text(), 'Prime')]"),
-            ("Links por posição", "//nav//a[position()<=3]"),
-            ("Elementos com classe específica", "//div[contains(@class, 'nav') and @id]"),
-            ("Elementos irmãos", "//input/following-sibling::*"),
-            ("Elementos pais de imagens", "//img/parent::*")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_11_by_xpath_advanced')
         
         xpath_results = []
-        for description, xpath in xpath_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                
-                if elements:
-                    first_element = elements[0]
-                    xpath_info = {
-                        'descricao': description,
-                        'xpath': xpath,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'texto': first_element.text[:40] if first_element.text else 'Sem texto',
-                            'posicao': f"x:{first_element.location['x']}, y:{first_element.location['y']}"
-                        }
+        for (description, xpath), evaluated in zip(self.XPATH_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                xpath_info = {
+                    'descricao': description,
+                    'xpath': xpath,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'texto': first_element['texto'][:40] if first_element['texto'] else 'Sem texto',
+                        'posicao': f"x:{first_element['location']['x']}, y:{first_element['location']['y']}"
                     }
-                    xpath_results.append(xpath_info)
-                    print(f"✅ {len(elements)} elemento(s) - {description}")
-                    print(f"   Tag: {first_element.tag_name}")
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+                }
+                xpath_results.append(xpath_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) - {description}")
+                print(f"   Tag: {first_element['tag_name']}")
+            else:
                 xpath_info = {
                     'descricao': description,
                     'xpath': xpath,
@@ -643,57 +876,41 @@ class EcommerceMappingDemo:
             'estrategia': 'By.XPATH_ADVANCED',
             'elemento': 'Elementos por XPath Avançado',
             'encontrados': len([x for x in xpath_results if x['encontrado']]),
-            'total_testados': len(xpath_selectors),
+            'total_testados': len(self.XPATH_SELECTORS),
             'detalhes': xpath_results,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_12_by_text_content(self):
+    @instrumented
+    def strategy_12_by_text_content(self, batch=None):
         """Estratégia 12: Localização por Conteúdo de Texto"""
         print("\n🎯 ESTRATÉGIA 12: By TEXT CONTENT")
         print("-" * 40)
         
-        text_patterns = [
-            ("Elementos com Login/Conta", "//*[contains(text(), 'Login') or contains(text(), 'Conta') or contains(text(), 'Entrar') or contains(text(), 'Olá')]"),
-            ("Texto de Preço", "//*[contains(text(), 'R$') or contains(text(), 'reais') or contains(text(), '%')]"),
-            ("Elementos de navegação", "//*[contains(text(), 'Livros') or contains(text(), 'Prime') or contains(text(), 'Casa')]"),
-            ("Títulos de Seção", "//*[self::h1 or self::h2 or self::h3 or self::span][normalize-space(text())]"),
-            ("Texto de Ofertas", "//*[contains(text(), 'oferta') or contains(text(), 'desconto') or contains(text(), 'off')]")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_12_by_text_content')
         
         text_results = []
-        for description, xpath in text_patterns:
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-                
-                if elements:
-                    # Filtra elementos que realmente têm texto visível
-                    visible_elements = [elem for elem in elements if elem.text.strip()]
-                    
-                    if visible_elements:
-                        first_element = visible_elements[0]
-                        text_info = {
-                            'descricao': description,
-                            'xpath': xpath,
-                            'encontrado': True,
-                            'quantidade': len(visible_elements),
-                            'primeiro_elemento': {
-                                'tag_name': first_element.tag_name,
-                                'texto_completo': first_element.text,
-                                'texto_resumido': first_element.text[:50] + '...' if len(first_element.text) > 50 else first_element.text
-                            }
-                        }
-                        text_results.append(text_info)
-                        print(f"✅ {len(visible_elements)} elemento(s) - {description}")
-                        print(f"   Texto: '{first_element.text[:40]}'")
-                    else:
-                        raise NoSuchElementException()
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+        for (description, xpath), evaluated in zip(self.TEXT_PATTERNS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                text_info = {
+                    'descricao': description,
+                    'xpath': xpath,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'texto_completo': first_element['texto'],
+                        'texto_resumido': first_element['texto'][:50] + '...' if len(first_element['texto']) > 50 else first_element['texto']
+                    }
+                }
+                text_results.append(text_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) - {description}")
+                print(f"   Texto: '{first_element['texto'][:40]}'")
+            else:
                 text_info = {
                     'descricao': description,
                     'xpath': xpath,
@@ -708,52 +925,42 @@ class EcommerceMappingDemo:
             'estrategia': 'By.TEXT_CONTENT',
             'elemento': 'Elementos por Conteúdo de Texto',
             'encontrados': len([t for t in text_results if t['encontrado']]),
-            'total_testados': len(text_patterns),
+            'total_testados': len(self.TEXT_PATTERNS),
             'detalhes': text_results,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def strategy_13_by_position_context(self):
+    @instrumented
+    def strategy_13_by_position_context(self, batch=None):
         """Estratégia 13: Localização por Posição e Contexto"""
         print("\n🎯 ESTRATÉGIA 13: By POSITION CONTEXT")
         print("-" * 40)
         
-        position_selectors = [
-            ("Primeiro item do header", "header *:first-child, [role='banner'] *:first-child"),
-            ("Último item do footer", "footer *:last-child, [role='contentinfo'] *:last-child"),
-            ("Elementos centrais", "div:nth-child(even)"),
-            ("Primeiros links de cada nav", "nav a:first-of-type"),
-            ("Elementos após inputs", "input + *, input ~ *")
-        ]
+        if batch is None:
+            batch = self._query_batch('strategy_13_by_position_context')
         
         position_results = []
-        for description, selector in position_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    first_element = elements[0]
-                    position_info = {
-                        'descricao': description,
-                        'seletor': selector,
-                        'encontrado': True,
-                        'quantidade': len(elements),
-                        'primeiro_elemento': {
-                            'tag_name': first_element.tag_name,
-                            'posicao_na_tela': first_element.location,
-                            'tamanho': first_element.size,
-                            'visivel': first_element.is_displayed()
-                        }
+        for (description, selector), evaluated in zip(self.POSITION_SELECTORS, batch):
+            first_element = evaluated['primeiro']
+            if first_element:
+                position_info = {
+                    'descricao': description,
+                    'seletor': selector,
+                    'encontrado': True,
+                    'quantidade': evaluated['quantidade'],
+                    'primeiro_elemento': {
+                        'tag_name': first_element['tag_name'],
+                        'posicao_na_tela': first_element['location'],
+                        'tamanho': first_element['size'],
+                        'visivel': first_element['visivel']
                     }
-                    position_results.append(position_info)
-                    print(f"✅ {len(elements)} elemento(s) - {description}")
-                    print(f"   Posição: {first_element.location}")
-                else:
-                    raise NoSuchElementException()
-                    
-            except NoSuchElementException:
+                }
+                position_results.append(position_info)
+                print(f"✅ {evaluated['quantidade']} elemento(s) - {description}")
+                print(f"   Posição: {first_element['location']}")
+            else:
                 position_info = {
                     'descricao': description,
                     'seletor': selector,
@@ -768,59 +975,188 @@ class EcommerceMappingDemo:
             'estrategia': 'By.POSITION_CONTEXT',
             'elemento': 'Elementos por Posição e Contexto',
             'encontrados': len([p for p in position_results if p['encontrado']]),
-            'total_testados': len(position_selectors),
+            'total_testados': len(self.POSITION_SELECTORS),
             'detalhes': position_results,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         self.mapping_results.append(result)
     
-    def run_all_strategies(self):
-        """Executa todas as estratégias de mapeamento"""
+    def run_all_strategies(self, parallel_sessions=1):
+        """Executa todas as estratégias de mapeamento
+        
+        Com parallel_sessions > 1, as estratégias somente-leitura rodam em paralelo
+        em sessões extras e as que alteram a página ficam isoladas na sessão principal.
+        """
+        started = time.perf_counter()
+        self.metrics.reset()
         if not self.load_amazon_homepage():
             return False
         
         print("\n🔍 INICIANDO DEMONSTRAÇÃO DE TODAS AS ESTRATÉGIAS")
         print("=" * 60)
         
-        # Executa cada estratégia
-        strategies = [
-            self.strategy_1_by_id,
-            self.strategy_2_by_name,
-            self.strategy_3_by_class_name,
-            self.strategy_4_by_tag_name,
-            self.strategy_5_by_css_selector,
-            self.strategy_6_by_xpath,
-            self.strategy_7_by_data_attributes,
-            self.strategy_8_by_attribute_contains,
-            self.strategy_9_by_pseudo_selectors,
-            self.strategy_10_by_multiple_attributes,
-            self.strategy_11_by_xpath_advanced,
-            self.strategy_12_by_text_content,
-            self.strategy_13_by_position_context
-        ]
+        if parallel_sessions <= 1 or not self._run_strategies_concurrently(parallel_sessions - 1):
+            for name in self.STRATEGY_NAMES:
+                before = len(self.mapping_results)
+                try:
+                    self._run_strategy(name)
+                    if name in self.MUTATING_STRATEGIES:
+                        self.readiness.dom_quiet()  # Só espera quando a estratégia alterou a página
+                except Exception as e:
+                    print(f"❌ Erro na estratégia: {str(e)}")
+                self._attach_command_metrics(name, self.mapping_results[before:])
         
-        for strategy in strategies:
+        self.locator_cache.save()
+        self.locator_ladder.save()
+        self.last_run_seconds = time.perf_counter() - started
+        print(f"\n⏱️  Tempo total do mapeamento: {self.last_run_seconds:.1f}s")
+        return True
+    
+    def _run_strategy(self, name):
+        """Executa uma estratégia ou reaproveita o resultado do cache se a estrutura do DOM não mudou
+        
+        As estratégias que alteram a página sempre executam (a interação faz parte da demonstração).
+        """
+        cacheable = name not in self.MUTATING_STRATEGIES and self.dom_fingerprint is not None
+        if cacheable:
+            cached = self.locator_cache.get(self.url, self.dom_fingerprint, name)
+            if cached is not MISSING:
+                print(f"\n♻️  {name}: resultado reaproveitado do cache (DOM inalterado)")
+                results = copy.deepcopy(cached)
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                for result in results:
+                    result['cache'] = True
+                    result['timestamp'] = timestamp  # Horário desta execução, não o da original
+                self.mapping_results.extend(results)
+                return
+        
+        before = len(self.mapping_results)
+        getattr(self, name)()
+        for result in self.mapping_results[before:]:
+            result['metodo'] = name
+        if cacheable:
+            self.locator_cache.put(self.url, self.dom_fingerprint, name, copy.deepcopy(self.mapping_results[before:]))
+    
+    def _strategy_worker(self, driver):
+        """Cria uma cópia da demonstração que usa outra sessão e resultados próprios"""
+        worker = copy.copy(self)
+        worker.driver = driver
+        # Mesma preparação da sessão principal (stealth e readyState do perfil): resultados comparáveis
+        worker._prepare_session(driver)
+        worker.mapping_results = []
+        return worker
+    
+    def _run_strategy_group(self, names, driver, load_page):
+        """Executa um grupo de estratégias em uma sessão; retorna os resultados por estratégia"""
+        worker = self._strategy_worker(driver)
+        if load_page and not worker.load_amazon_homepage():
+            return {}
+        
+        results = {}
+        for name in names:
+            before = len(worker.mapping_results)
             try:
-                strategy()
-                time.sleep(2)  # Pausa entre estratégias
+                worker._run_strategy(name)
             except Exception as e:
-                print(f"❌ Erro na estratégia: {str(e)}")
+                print(f"❌ Erro na estratégia {name}: {str(e)}")
+            results[name] = worker.mapping_results[before:]
+            self._attach_command_metrics(name, results[name])
+        return results
+    
+    def _attach_command_metrics(self, name, results):
+        """Anexa a cada resultado os comandos WebDriver gastos pela estratégia"""
+        commands = self.metrics.scope_summary(name)
+        for result in results:
+            result['comandos_webdriver'] = commands
+    
+    def _run_strategies_concurrently(self, extra_sessions):
+        """Distribui as estratégias somente-leitura entre sessões extras na mesma URL
+        
+        Usa no máximo as sessões livres do pool (a sessão principal já ocupa uma vaga);
+        retorna False, sem executar nada, se nenhuma sessão extra estiver disponível.
+        """
+        mutating = [name for name in self.STRATEGY_NAMES if name in self.MUTATING_STRATEGIES]
+        read_only = [name for name in self.STRATEGY_NAMES if name not in self.MUTATING_STRATEGIES]
+        extra_sessions = min(extra_sessions, len(read_only))
+        if self.pool is not None:
+            extra_sessions = min(extra_sessions, self.pool.available())
+        if extra_sessions < 1:
+            print("⚠️  Nenhuma sessão extra livre no pool: estratégias na sessão principal")
+            return False
         
+        pool = self.pool or DriverPool(size=extra_sessions, headless=self.headless, stealth=True,
+                                       profile=self.profile)
+        drivers = []
+        try:
+            for _ in range(extra_sessions):
+                try:
+                    drivers.append(self.metrics.instrument(pool.checkout(timeout=5)))
+                except PoolExhaustedError:
+                    break  # Outro usuário do pool levou a sessão: segue com as obtidas
+            if not drivers:
+                print("⚠️  Nenhuma sessão extra livre no pool: estratégias na sessão principal")
+                return False
+            
+            groups = [read_only[i::len(drivers)] for i in range(len(drivers))]
+            print(f"⚡ {len(read_only)} estratégias somente-leitura em {len(groups)} sessão(ões) paralelas; "
+                  f"{len(mutating)} isolada(s) na sessão principal")
+            with ThreadPoolExecutor(max_workers=len(groups) + 1) as executor:
+                futures = [executor.submit(self._run_strategy_group, mutating, self.driver, False)]
+                futures += [executor.submit(self._run_strategy_group, group, driver, True)
+                            for group, driver in zip(groups, drivers)]
+                
+                results = {}
+                for future in futures:
+                    results.update(future.result())
+        finally:
+            for driver in drivers:
+                self.metrics.uninstrument(driver)
+                pool.checkin(driver)
+            if pool is not self.pool:
+                pool.close()
+        
+        # Mantém a ordem original das estratégias em mapping_results
+        for name in self.STRATEGY_NAMES:
+            self.mapping_results.extend(results.get(name, []))
         return True
     
+    async def run_batch_strategies_cdp(self, page, verbose=True):
+        """Executa as estratégias em lote (4 e 6-13) como corrotina sobre uma aba do backend CDP (cdp_async)
+        
+        As consultas de todas as estratégias (BATCH_QUERIES) são avaliadas na aba em paralelo
+        e cada estratégia monta seu resultado a partir da resposta recebida.
+        As estratégias 1-3 e 5 usam WebElements e continuam exigindo o Selenium.
+        """
+        import asyncio
+        
+        names = self.BATCH_STRATEGIES
+        answers = await asyncio.gather(*(page.execute_script(SELECTOR_BATCH_SCRIPT, *self.batch_request(name))
+                                         for name in names))
+        
+        # Sem await daqui em diante: o redirecionamento da saída não vaza para outras corrotinas
+        with redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            for name, answer in zip(names, answers):
+                before = len(self.mapping_results)
+                getattr(self, name)(batch=self._summarize_batch(answer))
+                for result in self.mapping_results[before:]:
+                    result['backend'] = 'cdp'
+        return self.mapping_results
+    
+    @staticmethod
+    def is_successful(result):
+        """Estratégia bem-sucedida: encontrou o elemento ou ao menos um dos seletores testados"""
+        return bool(result.get('encontrado', False) or
+                    result.get('encontrados', 0) > 0 or
+                    any(item.get('encontrado', False) for item in result.get('detalhes', [])))
+    
     def generate_report(self):
         """Gera relatório final da demonstração"""
         print("\n📊 RELATÓRIO FINAL DA DEMONSTRAÇÃO")
         print("=" * 60)
         
         # Conta estratégias bem-sucedidas considerando diferentes tipos de resultado
-        successful_strategies = 0
-        for result in self.mapping_results:
-            if (result.get('encontrado', False) or 
-                result.get('encontrados', 0) > 0 or
-                any(item.get('encontrado', False) for item in result.get('detalhes', []))):
-                successful_strategies += 1
+        successful_strategies = len([r for r in self.mapping_results if self.is_successful(r)])
         
         total_strategies = len(self.mapping_results)
         
@@ -829,12 +1165,7 @@ class EcommerceMappingDemo:
         
         print("\n📋 Resumo por Estratégia:")
         for i, result in enumerate(self.mapping_results, 1):
-            # Determina se a estratégia foi bem-sucedida
-            is_successful = (result.get('encontrado', False) or 
-                           result.get('encontrados', 0) > 0 or
-                           any(item.get('encontrado', False) for item in result.get('detalhes', [])))
-            
-            status = "✅" if is_successful else "❌"
+            status = "✅" if self.is_successful(result) else "❌"
             strategy_name = result.get('estrategia', 'Desconhecida')
             element_name = result.get('elemento', 'Elemento')
             
@@ -849,19 +1180,27 @@ class EcommerceMappingDemo:
         
         return True
     
+    def _report_metadata(self):
+        """Metadados comuns aos relatórios JSON e Parquet"""
+        return {
+            'site_testado': self.site_name,
+            'url': self.url,
+            'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'total_estrategias': len(self.mapping_results),
+            'estrategias_sucessos': len([r for r in self.mapping_results if r.get('encontrado', False)]),
+            'esperas': self.readiness.summary(),
+            'comandos_webdriver': self.metrics.summary(),
+            'cache_localizadores': dict(self.locator_cache.stats),
+            'inicializacao': dict(self.startup)
+        }
+    
     def save_results_to_json(self):
         """Salva os resultados em arquivo JSON"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"ecommerce_mapping_results_{timestamp}.json"
         
         report_data = {
-            'metadata': {
-                'site_testado': 'Amazon Brasil',
-                'url': 'https://www.amazon.com.br',
-                'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'total_estrategias': len(self.mapping_results),
-                'estrategias_sucessos': len([r for r in self.mapping_results if r.get('encontrado', False)])
-            },
+            'metadata': self._report_metadata(),
             'resultados': self.mapping_results
         }
         
@@ -870,36 +1209,249 @@ class EcommerceMappingDemo:
                 json.dump(report_data, f, indent=2, ensure_ascii=False)
             
             print(f"\n💾 Relatório salvo em: {filename}")
+            
+            metrics_file = self.metrics.write_openmetrics(f"ecommerce_mapping_metrics_{timestamp}.prom")
+            self.metrics.print_summary()
+            print(f"💾 Métricas OpenMetrics salvas em: {metrics_file}")
             return True
             
         except Exception as e:
             print(f"❌ Erro ao salvar relatório: {str(e)}")
             return False
     
+    def save_results_to_parquet(self, filename=None):
+        """Salva os resultados em Parquet: uma linha por estratégia (colunar e comprimido; requer pyarrow)"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"ecommerce_mapping_results_{timestamp}.parquet"
+        
+        try:
+            import columnar_store
+            columnar_store.write_mapping_report(self.mapping_results, filename, self._report_metadata())
+            print(f"💾 Relatório colunar salvo em: {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao salvar relatório Parquet: {str(e)}")
+            return False
+    
+    def save_results_to_history(self, history=None):
+        """Registra a execução no histórico SQLite (run_history.db por padrão)"""
+        from run_history import RunHistory
+        import sqlite3
+        
+        owned = history is None
+        history = history or RunHistory()
+        try:
+            run_id = history.record_mapping_run(self._report_metadata(), self.mapping_results)
+            print(f"🗃️  Execução #{run_id} registrada em: {history.path}")
+            return True
+        except sqlite3.Error as e:
+            print(f"❌ Erro ao registrar no histórico: {str(e)}")
+            return False
+        finally:
+            if owned:
+                history.close()
+    
     def close(self):
         """Fecha o navegador"""
+        if self.driver is None:
+            return
+        if self.pool is not None:
+            self.metrics.uninstrument(self.driver)
+            self.pool.checkin(self.driver)
+            self.driver = None
+            print("\n♻️  Sessão devolvida ao pool")
+            print("👋 Demonstração concluída!")
+            return
         print("\n🔒 Fechando navegador...")
         self.driver.quit()
         print("👋 Demonstração concluída!")
 
+async def map_pages_cdp(urls, concurrency=20, headless=True):
+    """Mapeia várias páginas em paralelo com as estratégias em lote (4 e 6-13) no backend assíncrono CDP
+    
+    Uma única thread controla até `concurrency` abas; retorna {url: mapping_results ou exceção}.
+    """
+    from cdp_async import CDPBrowser
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    # As estratégias em lote não usam a escada: uma só, em memória, sem reler LOCATOR_STATS_FILE por página
+    ladder = LocatorLadder()
+    async with await CDPBrowser.launch(headless=headless) as browser:
+        async def map_page(url):
+            async with semaphore:
+                page = await browser.new_page()
+                try:
+                    await page.goto(url)
+                    with redirect_stdout(io.StringIO()):
+                        demo = EcommerceMappingDemo(url=url, offline=True, locator_ladder=ladder)
+                    return await demo.run_batch_strategies_cdp(page, verbose=False)
+                finally:
+                    await page.close()
+        
+        results = await asyncio.gather(*(map_page(url) for url in urls), return_exceptions=True)
+    return dict(zip(urls, results))
+
+# Sessões Chrome de cada processo do mapeamento em lote, uma por perfil de inicialização
+# (reutilizadas entre os sites do processo)
+_worker_pools = {}
+_worker_headless = True
+
+def _init_batch_worker(headless):
+    """Inicializa um processo do lote; as sessões são criadas no primeiro site de cada perfil"""
+    global _worker_headless
+    _worker_headless = headless
+
+def _worker_pool(profile):
+    """Pool de uma única sessão Chrome do processo para o perfil indicado"""
+    key = json.dumps(profile, sort_keys=True)
+    if key not in _worker_pools:
+        import multiprocessing.util
+        with redirect_stdout(io.StringIO()):
+            pool = DriverPool(size=1, headless=_worker_headless, stealth=True, profile=profile)
+        # Processos do multiprocessing não executam atexit; Finalize fecha a sessão na saída
+        multiprocessing.util.Finalize(pool, pool.close, exitpriority=10)
+        _worker_pools[key] = pool
+    return _worker_pools[key]
+
+def check_expectations(results, expected):
+    """Compara o sucesso de cada estratégia (por nome do método) com o esperado para o site"""
+    obtained = {result.get('metodo'): EcommerceMappingDemo.is_successful(result) for result in results}
+    return {
+        name: {'esperado': want, 'obtido': obtained.get(name), 'ok': obtained.get(name) == want}
+        for name, want in expected.items()
+    }
+
+def _map_site(target):
+    """Mapeia um site no processo trabalhador e devolve o resultado serializável"""
+    started = time.perf_counter()
+    site = {'url': target['url'], 'nome': target.get('nome'), 'perfil': target.get('perfil'), 'ok': False}
+    demo = None
+    try:
+        with redirect_stdout(io.StringIO()):
+            demo = EcommerceMappingDemo(pool=_worker_pool(target.get('perfil')), url=target['url'],
+                                        site_name=target.get('nome'))
+            site['nome'] = demo.site_name
+            site['ok'] = demo.run_all_strategies()
+    except Exception as e:
+        site['erro'] = str(e)
+    finally:
+        if demo is not None:
+            with redirect_stdout(io.StringIO()):
+                demo.close()
+    
+    results = demo.mapping_results if demo is not None else []
+    site.update({
+        'segundos': round(time.perf_counter() - started, 2),
+        'estrategias_sucessos': len([r for r in results if EcommerceMappingDemo.is_successful(r)]),
+        'expectativas': check_expectations(results, target.get('esperados', {})),
+        'comandos_webdriver': demo.metrics.total_commands if demo is not None else 0,
+        'resultados': results
+    })
+    return site
+
+def run_batch_mapping(targets, workers=4, headless=True, filename=None, history=None):
+    """Mapeia vários sites em paralelo num pool de processos (uma sessão Chrome por processo)
+    
+    targets: lista de URLs ou de dicionários {'url', 'nome', 'perfil', 'esperados': {metodo: bool}};
+    'perfil' é o perfil de inicialização do Chrome para o site (ver driver_pool.LAUNCH_PROFILES).
+    Grava um relatório agregado com os resultados de todos os sites e retorna o relatório;
+    com history (RunHistory) cada site também vira uma execução no histórico SQLite.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    targets = [{'url': target} if isinstance(target, str) else target for target in targets]
+    workers = max(1, min(workers, len(targets)))
+    print(f"🏭 Mapeamento em lote: {len(targets)} site(s) em {workers} processo(s)")
+    
+    started = time.perf_counter()
+    sites = [None] * len(targets)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(headless,)) as executor:
+        futures = {executor.submit(_map_site, target): i for i, target in enumerate(targets)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                sites[i] = future.result()
+            except Exception as e:
+                sites[i] = {'url': targets[i]['url'], 'nome': targets[i].get('nome'), 'ok': False, 'erro': str(e),
+                            'expectativas': {}, 'resultados': []}
+            site = sites[i]
+            failed = [name for name, check in site['expectativas'].items() if not check['ok']]
+            status = "✅" if site['ok'] and not failed else "❌"
+            print(f"  {status} {site['nome'] or site['url']}: {site.get('estrategias_sucessos', 0)} estratégias "
+                  f"com sucesso, {len(failed)} expectativa(s) não atendida(s)")
+    
+    report = {
+        'metadata': {
+            'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'total_sites': len(sites),
+            'sites_ok': len([site for site in sites if site['ok']]),
+            'expectativas_nao_atendidas': sum(1 for site in sites for check in site['expectativas'].values()
+                                              if not check['ok']),
+            'processos': workers,
+            'segundos_total': round(time.perf_counter() - started, 2)
+        },
+        'sites': sites
+    }
+    
+    filename = filename or f"ecommerce_batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Relatório agregado salvo em: {filename} ({report['metadata']['segundos_total']:.1f}s)")
+    
+    if history is not None:
+        for site in sites:
+            history.record_mapping_run({'site_testado': site['nome'], 'url': site['url'], 'perfil': site.get('perfil'),
+                                        'data_execucao': report['metadata']['data_execucao'],
+                                        'arquivo_lote': filename}, site['resultados'])
+        print(f"🗃️  {len(sites)} execução(ões) registrada(s) em {history.path}")
+    return report
+
 def main():
     """Função principal da demonstração"""
+    parser = argparse.ArgumentParser(description="Mapeamento de elementos HTML (Amazon ou lote de sites)")
+    parser.add_argument('--sites', help="JSON com a lista de sites para o mapeamento em lote")
+    parser.add_argument('--workers', type=int, default=4, help="processos simultâneos no modo lote")
+    parser.add_argument('--show-browser', action='store_true', help="abre o navegador visível no modo lote")
+    parser.add_argument('--sessions', type=int, default=1,
+                        help="sessões Chrome para as estratégias somente-leitura (1 = tudo na sessão principal)")
+    parser.add_argument('--parquet', action='store_true', help="também salva o relatório em Parquet (requer pyarrow)")
+    parser.add_argument('--profile', choices=list(LAUNCH_PROFILES), default='default',
+                        help="perfil de inicialização do Chrome (no lote, padrão dos sites sem 'perfil')")
+    args = parser.parse_args()
+    
+    if args.sites:
+        with open(args.sites, encoding='utf-8') as f:
+            targets = json.load(f)
+        targets = [{'url': target} if isinstance(target, str) else target for target in targets]
+        for target in targets:
+            target.setdefault('perfil', args.profile)
+        from run_history import RunHistory
+        with RunHistory() as history:
+            run_batch_mapping(targets, workers=args.workers, headless=not args.show_browser, history=history)
+        return
+    
     print("🎯 ATIVIDADE SOLO - MAPEAMENTO DE ELEMENTOS HTML")
     print("Site: Amazon Brasil (E-commerce)")
     print("Estratégias: 13 diferentes métodos de localização")
     print("=" * 60)
     
     # Inicializa a classe de demonstração
-    demo = EcommerceMappingDemo(headless=False)
+    demo = EcommerceMappingDemo(headless=False, profile=args.profile)
     
     try:
         # Executa todas as estratégias
-        if demo.run_all_strategies():
+        if demo.run_all_strategies(parallel_sessions=args.sessions):
             # Gera relatório final
             demo.generate_report()
             
             # Salva resultados em JSON
             demo.save_results_to_json()
+            if args.parquet:
+                demo.save_results_to_parquet()
+            demo.save_results_to_history()
             
             print("\n🎉 DEMONSTRAÇÃO CONCLUÍDA COM SUCESSO!")
             print("Todos os métodos de mapeamento foram testados.")
@@ -1,38 +1,693 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import argparse
+import sys
+import tracemalloc
+import threading
+import gzip
 import csv
 import json
 from datetime import datetime
+import time
+from driver_pool import ChromeBoot, apply_request_blocking, page_ready_state
+from readiness import Readiness
+from command_metrics import CommandMetrics, instrumented
+
+CHALLENGE_URL = "https://the-internet.herokuapp.com/challenging_dom"
+
+# Marca o documento atual e inicia a navegação sem bloquear (a aba carrega em segundo plano).
+# Se só o fragmento muda não há documento novo nem evento load: não marca, a aba já está pronta
+START_NAVIGATION_SCRIPT = """
+const target = new URL(arguments[0], location.href);
+const fragmentOnly = target.href.includes('#') && target.href.split('#')[0] === location.href.split('#')[0];
+window.__crawlerPreviousPage = !fragmentOnly;
+window.location.href = target.href;
+"""
+
+# Nova página pronta: documento substituído, carregado e com a tabela presente
+PAGE_READY_SCRIPT = """
+return !window.__crawlerPreviousPage && document.readyState === 'complete' && !!document.querySelector('table');
+"""
+
+# Link da próxima página (href absoluto) ou null
+NEXT_PAGE_SCRIPT = """
+const link = document.querySelector(arguments[0]);
+return link && link.href ? link.href : null;
+"""
+
+# Coleta cabeçalhos, células e botões da tabela em uma única chamada ao navegador
+TABLE_EXTRACTION_SCRIPT = """
+const table = document.querySelector('table');
+if (!table) { return null; }
+const text = (el) => (el.innerText || '').trim();
+const thead = table.querySelector('thead');
+const tbody = table.querySelector('tbody');
+const headers = thead ? Array.from(thead.querySelectorAll('th'), text) : [];
+// Com keepHandles cada linha leva também os elementos da linha e dos links (para os cliques)
+const keepHandles = arguments[0];
+const rows = tbody ? Array.from(tbody.querySelectorAll('tr'), (tr) => {
+    const cells = Array.from(tr.querySelectorAll('td'));
+    const actionCell = cells[cells.length - 1];
+    const links = actionCell ? Array.from(actionCell.querySelectorAll('a')) : null;
+    const row = {
+        cells: cells.slice(0, -1).map(text),
+        buttons: links ? links.map((a) => [text(a), a.getAttribute('href') === null ? null : a.href]) : null
+    };
+    if (keepHandles) { Object.assign(row, {element: tr, links: links}); }
+    return row;
+}) : [];
+return {headers: headers, rows: rows};
+"""
+
+# Observa o tbody com um MutationObserver e devolve só as linhas alteradas desde a última chamada.
+# Se o observer não existe (primeira chamada ou página recarregada) ou linhas foram
+# adicionadas/removidas, devolve a tabela inteira (completo=true) para o diff em Python.
+TABLE_WATCH_SCRIPT = """
+const [timeoutMs, installOnly, done] = arguments;
+const text = (el) => (el.innerText || '').trim();
+const readRow = (tr) => {
+    const cells = Array.from(tr.querySelectorAll('td'));
+    const actionCell = cells[cells.length - 1];
+    return {
+        cells: cells.slice(0, -1).map(text),
+        buttons: actionCell ? Array.from(actionCell.querySelectorAll('a'), (a) => [
+            text(a), a.getAttribute('href') === null ? null : a.href
+        ]) : null
+    };
+};
+const tbody = document.querySelector('table tbody');
+if (!tbody) { return done(null); }
+let state = window.__tableWatch;
+let reset = false;
+if (!state || state.tbody !== tbody) {
+    if (state) { state.observer.disconnect(); }
+    state = window.__tableWatch = {tbody: tbody, dirty: new Set(), structural: false, notify: null};
+    state.observer = new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            if (m.target === tbody && m.type === 'childList') { state.structural = true; continue; }
+            const node = m.target.nodeType === Node.ELEMENT_NODE ? m.target : m.target.parentElement;
+            const row = node && node.closest('tr');
+            if (row && row.parentElement === tbody) { state.dirty.add(row); }
+        }
+        if (state.notify) { state.notify(); }
+    });
+    state.observer.observe(tbody, {subtree: true, childList: true, attributes: true, characterData: true});
+    reset = !installOnly;
+}
+if (installOnly) { return done({completo: false, total: tbody.rows.length, linhas: []}); }
+const collect = () => {
+    const rows = Array.from(tbody.rows);
+    const full = reset || state.structural;
+    const changed = full ? rows.map((tr, index) => [tr, index])
+        : Array.from(state.dirty, (tr) => [tr, rows.indexOf(tr)]).filter(([, index]) => index >= 0);
+    state.dirty.clear();
+    state.structural = false;
+    return {
+        completo: full,
+        total: rows.length,
+        linhas: changed.map(([tr, index]) => Object.assign({indice: index}, readRow(tr)))
+    };
+};
+if (reset || state.structural || state.dirty.size || timeoutMs <= 0) { return done(collect()); }
+const timer = setTimeout(() => { state.notify = null; done(collect()); }, timeoutMs);
+// Agrupa mutações em sequência (ex.: várias células da mesma linha) numa única resposta
+state.notify = () => { clearTimeout(timer); state.notify = null; setTimeout(() => done(collect()), 50); };
+"""
+
+# Executa uma lista de cliques [linha, ação] dentro da página: linhas e botões localizados uma
+# vez por lote; um clique que leva a outro documento encerra o lote (o restante vai no próximo)
+ACTION_PLAN_SCRIPT = """
+const [operations] = arguments;
+const page = (url) => url.split('#')[0];
+const here = page(location.href);
+const buttons = new Map();
+let rows = [];
+const resolveRows = () => {
+    const tbody = document.querySelector('table tbody');
+    rows = tbody ? Array.from(tbody.rows) : [];
+    buttons.clear();
+};
+const rowButtons = (tr) => {
+    if (!buttons.has(tr)) {
+        const actionCell = tr.cells[tr.cells.length - 1];
+        buttons.set(tr, actionCell ? Array.from(actionCell.querySelectorAll('a')) : []);
+    }
+    return buttons.get(tr);
+};
+resolveRows();
+const results = [];
+for (const [linha, acao] of operations) {
+    let tr = rows[linha - 1];
+    // Tabela redesenhada por um clique anterior: localiza as linhas de novo
+    if (tr && !tr.isConnected) { resolveRows(); tr = rows[linha - 1]; }
+    if (!tr) {
+        results.push({ok: false, erro: `Linha ${linha} não existe (máximo: ${rows.length})`});
+        continue;
+    }
+    const wanted = acao.toLowerCase();
+    const button = rowButtons(tr).find((a) => a.href && a.href.toLowerCase().includes(wanted));
+    if (!button) {
+        results.push({ok: false, erro: `Botão '${acao}' não encontrado na linha ${linha}`});
+        continue;
+    }
+    button.click();
+    if (page(button.href) !== here) {
+        results.push({ok: true, href: button.href, navegou: true});
+        break;
+    }
+    results.push({ok: true, href: button.href});
+}
+return results;
+"""
+
+# Operações por execute_script no executor de planos de ações
+ACTION_PLAN_CHUNK = 500
+
+class TableHTMLParser(HTMLParser):
+    """Parser em processo da primeira tabela de um HTML (sem WebElements)"""
+    
+    IGNORED_TAGS = ('script', 'style')
+    
+    def __init__(self, base_url=CHALLENGE_URL):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.headers = []
+        self.rows = []
+        self._table_depth = 0
+        self._done = False
+        self._section = None
+        self._ignored = 0
+        self._text = None
+        self._cells = None
+        self._anchor = None
+        self._resolved = {}
+    
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag in self.IGNORED_TAGS:
+            self._ignored += 1
+        elif tag == 'table':
+            self._table_depth += 1
+        elif self._table_depth != 1:
+            return
+        elif tag in ('thead', 'tbody', 'tfoot'):
+            self._close_row()
+            self._section = tag
+        elif tag == 'tr':
+            # </td> e </tr> são opcionais no HTML: a próxima linha fecha a anterior
+            self._close_row()
+            if self._section not in ('thead', 'tfoot'):
+                # <tr> direto na <table> conta como corpo (o navegador cria o tbody implícito)
+                self._cells = []
+        elif tag == 'th' and self._section == 'thead':
+            self._close_cell()
+            self._text = []
+        elif tag == 'td' and self._cells is not None:
+            self._close_cell()
+            self._text = []
+            self._cells.append({'text': '', 'anchors': []})
+        elif tag == 'a' and self._cells:
+            href = dict(attrs).get('href')
+            if href is not None and href not in self._resolved:
+                self._resolved[href] = urljoin(self.base_url, href)
+            self._anchor = {'text': [], 'href': self._resolved.get(href)}
+    
+    def handle_endtag(self, tag):
+        if self._done:
+            return
+        if tag in self.IGNORED_TAGS:
+            self._ignored = max(0, self._ignored - 1)
+        elif tag == 'table':
+            if self._table_depth == 1:
+                self._close_row()
+            self._table_depth -= 1
+            self._done = self._table_depth == 0
+        elif self._table_depth != 1:
+            return
+        elif tag in ('thead', 'tbody', 'tfoot'):
+            self._close_row()
+            self._section = None
+        elif tag in ('th', 'td'):
+            self._close_cell()
+        elif tag == 'a' and self._anchor is not None:
+            self._cells[-1]['anchors'].append((self._collapse(self._anchor['text']), self._anchor['href']))
+            self._anchor = None
+        elif tag == 'tr':
+            self._close_row()
+    
+    def _close_cell(self):
+        """Fecha a célula aberta (cabeçalho do thead ou célula da linha atual), se houver"""
+        if self._text is None:
+            return
+        text = self._collapse(self._text)
+        self._text = None
+        if self._cells is None:
+            self.headers.append(text)
+        else:
+            self._cells[-1]['text'] = text
+    
+    def _close_row(self):
+        """Fecha a célula e a linha do corpo abertas, se houver"""
+        self._close_cell()
+        if self._cells is None:
+            return
+        if not self._cells:
+            raise IndexError("Linha sem células")
+        cell_texts = [cell['text'] for cell in self._cells[:-1]]
+        self.rows.append((cell_texts, self._cells[-1]['anchors']))
+        self._cells = None
+    
+    def handle_data(self, data):
+        if self._done or self._ignored or self._table_depth != 1:
+            return
+        if self._text is not None:
+            self._text.append(data)
+        if self._anchor is not None:
+            self._anchor['text'].append(data)
+    
+    @staticmethod
+    def _collapse(chunks):
+        return ' '.join(''.join(chunks).split())
+
+def parse_table_html(html, base_url=CHALLENGE_URL):
+    """Extrai cabeçalhos e linhas da primeira tabela de um HTML"""
+    parser = TableHTMLParser(base_url)
+    parser.feed(html)
+    parser.close()
+    if not parser.headers and not parser.rows:
+        raise NoSuchElementException("Tabela não encontrada no HTML")
+    return parser.headers, parser.rows
+
+def extract_html_snapshots(paths, base_url=CHALLENGE_URL):
+    """Reextrai snapshots HTML salvos, sem navegador; gera (arquivo, linhas) por arquivo"""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            headers, rows = parse_table_html(f.read(), base_url)
+        yield path, [ChallengeDOM._build_row(i, headers, cell_texts, buttons)
+                     for i, (cell_texts, buttons) in enumerate(rows, 1)]
+
+class RowContext:
+    """Dados comuns a todas as linhas de uma extração (colunas e timestamp)"""
+    
+    __slots__ = ('columns', 'slots', 'timestamp', '_actions')
+    
+    def __init__(self, headers, timestamp=None):
+        self.columns = tuple(sys.intern(header) for header in headers[:-1])  # Ignora a coluna "Action"
+        # Nome -> posições das células; cabeçalhos repetidos viram uma chave só, como em _build_row
+        # (ordem da primeira ocorrência, valor da última)
+        self.slots = {}
+        for index, name in enumerate(self.columns):
+            self.slots.setdefault(name, []).append(index)
+        self.timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._actions = {}
+    
+    def actions(self, buttons):
+        """Retorna (rótulos, edit_href, delete_href) compartilhado entre linhas com os mesmos botões"""
+        key = tuple(buttons)
+        shared = self._actions.get(key)
+        if shared is None:
+            edit_href = delete_href = None
+            for _, href in buttons:
+                if 'edit' in href:
+                    edit_href = sys.intern(href)
+                elif 'delete' in href:
+                    delete_href = sys.intern(href)
+            labels = tuple(sys.intern(label) for label, _ in buttons)
+            shared = self._actions[key] = (labels, edit_href, delete_href)
+        return shared
+    
+    def build(self, i, cell_texts, buttons):
+        """Cria a linha compacta equivalente a ChallengeDOM._build_row"""
+        return CompactRow(self, i, tuple(cell_texts[:len(self.columns)]), self.actions(buttons))
+
+class CompactRow(Mapping):
+    """Linha com __slots__ e campos constantes compartilhados, exposta como dicionário somente-leitura"""
+    
+    __slots__ = ('context', 'linha', 'cells', 'shared_actions')
+    
+    def __init__(self, context, linha, cells, shared_actions):
+        self.context = context
+        self.linha = linha
+        self.cells = cells
+        self.shared_actions = shared_actions
+    
+    def __getitem__(self, key):
+        if key == 'linha':
+            return self.linha
+        if key == 'timestamp':
+            return self.context.timestamp
+        if key == 'botoes_disponiveis':
+            return list(self.shared_actions[0])
+        if key == 'edit_href':
+            return self.shared_actions[1]
+        if key == 'delete_href':
+            return self.shared_actions[2]
+        indexes = [index for index in self.context.slots.get(key, ()) if index < len(self.cells)]
+        if not indexes:
+            raise KeyError(key)
+        return self.cells[indexes[-1]]
+    
+    def _columns(self):
+        return [name for name, indexes in self.context.slots.items() if indexes[0] < len(self.cells)]
+    
+    def __iter__(self):
+        yield 'linha'
+        yield 'timestamp'
+        yield from self._columns()
+        yield 'botoes_disponiveis'
+        yield 'edit_href'
+        yield 'delete_href'
+    
+    def __len__(self):
+        return len(self._columns()) + 5
+    
+    def __repr__(self):
+        return f"CompactRow({dict(self)!r})"
+
+def measure_row_memory(rows=100_000, columns=6):
+    """Compara a memória por linha (dict vs CompactRow) numa tabela sintética"""
+    headers = [f"Coluna{j}" for j in range(columns)] + ['Action']
+    
+    def synthetic_row(i):
+        # Strings novas por linha, como chegam do WebDriver ou do parser
+        cells = [f"Valor{j}_{i}" for j in range(columns)]
+        buttons = [('edit', f"{CHALLENGE_URL}#edit"), ('delete', f"{CHALLENGE_URL}#delete")]
+        return cells, buttons
+    
+    results = {}
+    for name in ('dict', 'compact'):
+        tracemalloc.start()
+        if name == 'dict':
+            data = [ChallengeDOM._build_row(i, headers, *synthetic_row(i)) for i in range(1, rows + 1)]
+        else:
+            context = RowContext(headers)
+            data = [context.build(i, *synthetic_row(i)) for i in range(1, rows + 1)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = round(current / rows, 1)
+        del data
+    
+    print(f"🧮 Memória por linha ({rows} linhas): dict={results['dict']} bytes, compacta={results['compact']} bytes")
+    return results
+
+class LazyRows:
+    """Linhas lidas sob demanda: len() é conhecido antes de ler cada linha"""
+    
+    def __init__(self, items, reader):
+        self.items = items
+        self.reader = reader
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return map(self.reader, self.items)
+
+class RowHandles:
+    """Cache dos WebElements de cada linha (a linha e os links de ação com seus hrefs)
+    
+    Preenchido por extract_table_data e reaproveitado por click_button, que assim não
+    percorre a tabela inteira a cada clique. Uma linha obsoleta (página redesenhada) é
+    descartada e localizada de novo sozinha. stats conta acertos, falhas e re-resoluções.
+    """
+    
+    def __init__(self):
+        self.stats = {'acertos': 0, 'falhas': 0, 'reresolucoes': 0}
+        self._rows = {}
+    
+    def store(self, linha, row, links):
+        """Guarda a linha e seus links como [(href, elemento), ...]"""
+        self._rows[linha] = (row, links)
+    
+    def get(self, linha):
+        """(linha, links) guardados, ou None se a linha não está no cache"""
+        handle = self._rows.get(linha)
+        self.stats['acertos' if handle is not None else 'falhas'] += 1
+        return handle
+    
+    def invalidate(self, linha=None):
+        """Descarta uma linha do cache (ou todas, sem linha)"""
+        if linha is None:
+            self._rows.clear()
+        else:
+            self._rows.pop(linha, None)
+    
+    def __len__(self):
+        return len(self._rows)
+
+def row_writer(filename, fmt='jsonl', append=False):
+    """Gerador-consumidor que grava cada linha recebida via send() imediatamente
+    
+    Formatos: 'jsonl' (um objeto JSON por linha) ou 'csv'. Com append=True acrescenta
+    ao arquivo existente (o cabeçalho CSV só é escrito em arquivo vazio).
+    """
+    if fmt not in ('jsonl', 'csv'):
+        raise ValueError(f"Formato de streaming inválido: {fmt} (opções: jsonl, csv)")
+    
+    with open(filename, 'a' if append else 'w', newline='', encoding='utf-8') as outfile:
+        csv_writer = None
+        written = 0
+        while True:
+            row = yield written
+            if fmt == 'jsonl':
+                outfile.write(json.dumps(row, ensure_ascii=False, default=dict) + '\n')
+            else:
+                if csv_writer is None:
+                    csv_writer = csv.DictWriter(outfile, fieldnames=list(row.keys()))
+                    if outfile.tell() == 0:
+                        csv_writer.writeheader()
+                csv_writer.writerow(row)
+            # Cada linha vai para o disco na hora: sobrevive a uma falha no meio da extração
+            outfile.flush()
+            written += 1
+
+def _action_operation(item):
+    """(linha, ação) de uma operação dada como par [linha, ação] ou {'linha', 'acao'}"""
+    if isinstance(item, Mapping):
+        linha, acao = item.get('linha'), item.get('acao')
+    else:
+        linha, acao = item
+    if not acao:
+        raise ValueError(f"Operação sem ação: {item!r}")
+    return int(linha), str(acao)
+
+def load_action_plan(filename):
+    """Lê um plano de ações (linha, ação) de um arquivo JSON, JSON Lines ou CSV
+    
+    JSON: lista de [linha, ação] ou de {"linha": 2, "acao": "edit"}; JSON Lines: uma
+    operação por linha; CSV: colunas 'linha' e 'acao'.
+    """
+    with open(filename, newline='', encoding='utf-8') as f:
+        if filename.endswith('.csv'):
+            items = list(csv.DictReader(f))
+        elif filename.endswith('.jsonl'):
+            items = [json.loads(line) for line in f if line.strip()]
+        else:
+            items = json.load(f)
+    return [_action_operation(item) for item in items]
+
+class KeepAliveHTTPClient:
+    """Cliente HTTP com pool de conexões persistentes (keep-alive) por host"""
+    
+    def __init__(self, timeout=10, max_idle_per_host=4):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.connections_opened = 0
+        self._idle = {}
+        self._lock = threading.Lock()
+    
+    def _checkout(self, key, fresh=False):
+        """Conexão ociosa do host (reused=True) ou uma nova; fresh=True sempre abre uma nova"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle and not fresh:
+                return idle.pop(), True
+            self.connections_opened += 1
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout), False
+    
+    def _checkin(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+    
+    def _request(self, url):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = {'Accept-Encoding': 'gzip', 'Connection': 'keep-alive', 'User-Agent': 'ChallengeDOM/1.0'}
+        
+        conn, reused = self._checkout(key)
+        try:
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                conn.close()
+                if not reused:
+                    raise
+                # Conexão ociosa fechada pelo servidor: tenta de novo com uma conexão nova
+                conn, _ = self._checkout(key, fresh=True)
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            # Nenhuma conexão com resposta pela metade volta ao pool
+            conn.close()
+            raise
+        
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        
+        if response.getheader('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return response, body
+    
+    def get(self, url, max_redirects=5):
+        """Faz um GET seguindo redirecionamentos; retorna (status, url_final, texto)"""
+        for _ in range(max_redirects + 1):
+            response, body = self._request(url)
+            location = response.getheader('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            charset = response.headers.get_content_charset() or 'utf-8'
+            return response.status, url, body.decode(charset, errors='replace')
+        raise http.client.HTTPException(f"Redirecionamentos demais para {url}")
+    
+    def close(self):
+        """Fecha todas as conexões ociosas"""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle = {}
 
 class ChallengeDOM:
-    def __init__(self, headless=False):
-        """Inicializa o navegador com configurações otimizadas"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        
-        self.service = Service()
-        self.driver = webdriver.Chrome(service=self.service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
+    BACKENDS = ('elements', 'script', 'html', 'http')
+
+    def __init__(self, headless=False, backend='elements', offline=False, url=CHALLENGE_URL, http_client=None,
+                 pool=None, compact_rows=False, profile=None, cache_row_handles=None):
+        """Inicializa o navegador com configurações otimizadas
+        
+        offline=True não abre navegador; backend='http' busca a página via HTTP keep-alive, sem Selenium.
+        Com pool (DriverPool), a sessão é emprestada do pool e devolvida em close().
+        compact_rows=True guarda self.data como CompactRow (visão de dicionário, menos memória).
+        profile escolhe o perfil de inicialização do Chrome ('default', 'lean' ou um dicionário,
+        ver driver_pool.LAUNCH_PROFILES); com pool vale o perfil do pool.
+        cache_row_handles=True faz a extração guardar os elementos de todas as linhas para os
+        cliques; é o padrão no backend 'elements', onde eles já existem. Nos outros backends
+        cada linha é localizada no primeiro clique e guardada a partir daí.
+        
+        Sem pool, o Chrome sobe numa thread de fundo enquanto o restante é preparado;
+        a primeira leitura de self.driver aguarda o navegador ficar pronto.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de extração inválido: {backend} (opções: {self.BACKENDS})")
+        
+        browser = not offline and backend != 'http'
+        self._boot = ChromeBoot(headless, profile=profile) if browser and pool is None else None
+        self._created_at = time.perf_counter()
+        self.startup = {}
+        
         self.data = []
+        self.headers = []
+        self.watching = False
+        self.backend = backend
+        self.compact_rows = compact_rows
+        # No backend 'elements' os WebElements já existem: guardá-los não custa nada
+        self.cache_row_handles = backend == 'elements' if cache_row_handles is None else cache_row_handles
+        self.url = url
+        self.metrics = CommandMetrics()
+        self.last_extraction_commands = 0
+        self.row_handles = RowHandles()
+        self._driver = None
+        self.pool = pool
+        self.profile = pool.profile if pool is not None else profile
+        self.http_client = None
+        self.page_html = None
+        self.page_url = None
+        
+        if offline:
+            print("📂 Modo offline: extração apenas de HTML salvo")
+            return
+        
+        if backend == 'http':
+            self.http_client = http_client or KeepAliveHTTPClient()
+            print("⚡ Modo leve: página obtida via HTTP, sem navegador")
+            return
+        
+        if pool is not None:
+            self._attach_driver(pool.checkout())
+            print("🚀 Sessão do pool emprestada com sucesso!")
+        else:
+            print("🚀 Iniciando navegador em segundo plano...")
+    
+    @property
+    def driver(self):
+        """Sessão do navegador; a primeira leitura aguarda o Chrome iniciado em segundo plano"""
+        if self._boot is not None:
+            boot, self._boot = self._boot, None
+            self._attach_driver(boot.result())
+            self.startup['boot_chrome_s'] = round(boot.seconds, 3)
+            print(f"🚀 Navegador iniciado com sucesso! ({boot.seconds:.2f}s em segundo plano)")
+        return self._driver
+    
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
+    
+    def _attach_driver(self, driver):
+        """Prepara as esperas e instrumenta a sessão"""
+        # support.ui carrega selenium.webdriver.remote: importado aqui, depois do boot em segundo plano
+        from selenium.webdriver.support.ui import WebDriverWait
         
-        print("🚀 Navegador iniciado com sucesso!")
+        self._driver = driver
+        self.wait = WebDriverWait(driver, 10)
+        self.readiness = Readiness(driver, timeout=10, ready_state=page_ready_state(self.profile))
+        self.metrics.instrument(driver)
     
+    def _record_first_navigation(self):
+        """Registra o tempo da criação (início do boot do Chrome) até a primeira navegação"""
+        if 'primeira_navegacao_s' in self.startup:
+            return
+        self.startup['primeira_navegacao_s'] = round(time.perf_counter() - self._created_at, 3)
+        print(f"⏱️  Primeira navegação {self.startup['primeira_navegacao_s']:.2f}s após a criação")
+    
+    @property
+    def command_count(self):
+        """Total de comandos WebDriver enviados por esta instância"""
+        return self.metrics.total_commands
+    
+    @instrumented
     def load_page(self):
         """Carrega a página e aguarda elementos estarem prontos"""
+        if self.backend == 'http':
+            return self._fetch_page()
+        
         try:
             print("🌐 Carregando página...")
-            self.driver.get("https://the-internet.herokuapp.com/challenging_dom")
+            self.driver.get(self.url)
+            self._record_first_navigation()
+            self.row_handles.invalidate()  # Novo documento: os elementos guardados ficaram obsoletos
             
             # Aguarda a tabela carregar
+            from selenium.webdriver.support import expected_conditions as EC
             self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table")))
             print("✅ Página carregada com sucesso!")
             return True
@@ -40,88 +695,624 @@ class ChallengeDOM:
             print("❌ Erro: Tempo limite para carregar a página")
             return False
     
+    def _fetch_page(self):
+        """Baixa o HTML da página pelo cliente HTTP keep-alive"""
+        try:
+            print("🌐 Baixando página via HTTP...")
+            status, final_url, html = self.http_client.get(self.url)
+            self._record_first_navigation()
+            if status != 200:
+                print(f"❌ Erro: HTTP {status} ao carregar {final_url}")
+                return False
+            
+            self.page_html = html
+            self.page_url = final_url
+            print("✅ Página carregada com sucesso!")
+            return True
+        except (OSError, http.client.HTTPException) as e:
+            print(f"❌ Erro ao baixar página: {str(e)}")
+            return False
+    
+    def _collect_table_elements(self, keep_handles=False):
+        """Percorre os WebElements da tabela (um comando WebDriver por acesso)
+        
+        Com keep_handles as linhas e os links lidos vão para o cache de cliques (row_handles).
+        """
+        table = self.driver.find_element(By.CSS_SELECTOR, "table")
+        thead = table.find_element(By.TAG_NAME, "thead")
+        headers = [th.text.strip() for th in thead.find_elements(By.TAG_NAME, "th")]
+        
+        tbody = table.find_element(By.TAG_NAME, "tbody")
+        rows = tbody.find_elements(By.TAG_NAME, "tr")
+        if keep_handles:
+            return headers, LazyRows(list(enumerate(rows, 1)), self._read_row_keeping_handles)
+        return headers, LazyRows(rows, self._read_row_elements)
+    
+    @staticmethod
+    def _read_row_elements(row):
+        """Lê textos das células e botões de uma linha (WebElement)"""
+        cell_texts, buttons, _ = ChallengeDOM._read_row_links(row)
+        return cell_texts, buttons
+    
+    @staticmethod
+    def _read_row_links(row):
+        """Como _read_row_elements, devolvendo também os elementos <a> da célula de ação"""
+        cells = row.find_elements(By.TAG_NAME, "td")
+        cell_texts = [cell.text.strip() for cell in cells[:-1]]
+        links = cells[-1].find_elements(By.TAG_NAME, "a")
+        labels = [btn.text.strip() for btn in links]
+        return cell_texts, list(zip(labels, [btn.get_attribute('href') for btn in links])), links
+    
+    def _read_row_keeping_handles(self, item):
+        """Lê a linha (índice, WebElement) e guarda a linha e os links em row_handles"""
+        linha, row = item
+        cell_texts, buttons, links = self._read_row_links(row)
+        self.row_handles.store(linha, row, [(href, link) for (_, href), link in zip(buttons, links)])
+        return cell_texts, buttons
+    
+    def _collect_table_script(self, keep_handles=False):
+        """Coleta toda a tabela com um único execute_script
+        
+        Com keep_handles o mesmo comando devolve os elementos das linhas e dos links, que vão
+        para o cache de cliques (row_handles).
+        """
+        payload = self.driver.execute_script(TABLE_EXTRACTION_SCRIPT, keep_handles)
+        headers, rows = self._parse_table_payload(payload)
+        if keep_handles:
+            for linha, row in enumerate(payload['rows'], 1):
+                hrefs = [href for _, href in row['buttons']]
+                self.row_handles.store(linha, row['element'], list(zip(hrefs, row['links'])))
+        return headers, rows
+    
+    @staticmethod
+    def _parse_table_payload(payload):
+        """Converte o retorno de TABLE_EXTRACTION_SCRIPT em (cabeçalhos, linhas)"""
+        if payload is None:
+            raise NoSuchElementException("Tabela não encontrada na página")
+        
+        rows = []
+        for row in payload['rows']:
+            if row['buttons'] is None:
+                raise IndexError("Linha sem células")
+            rows.append((row['cells'], [tuple(btn) for btn in row['buttons']]))
+        return payload['headers'], rows
+    
+    def _collect_table_html(self):
+        """Lê o page_source uma única vez e analisa a tabela em processo"""
+        return parse_table_html(self.driver.page_source, self.driver.current_url)
+    
+    @staticmethod
+    def _build_row(i, headers, cell_texts, buttons):
+        """Monta o dicionário de uma linha a partir dos textos das células e dos botões"""
+        row_data = {
+            'linha': i,
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        # Mapeia cada célula com seu cabeçalho correspondente
+        for j, text in enumerate(cell_texts):
+            if j < len(headers) - 1:  # Ignora a coluna "Action"
+                row_data[headers[j]] = text
+        
+        # Extrai informações dos botões
+        row_data['botoes_disponiveis'] = [label for label, _ in buttons]
+        row_data['edit_href'] = None
+        row_data['delete_href'] = None
+        
+        for _, href in buttons:
+            if 'edit' in href:
+                row_data['edit_href'] = href
+            elif 'delete' in href:
+                row_data['delete_href'] = href
+        
+        return row_data
+    
+    def _collect_table(self, keep_handles=False):
+        """Coleta cabeçalhos e linhas pelo backend configurado (keep_handles: ver row_handles)"""
+        if self.backend == 'script':
+            return self._collect_table_script(keep_handles)
+        if self.backend == 'html':
+            return self._collect_table_html()
+        if self.backend == 'http':
+            if self.page_html is None and not self._fetch_page():
+                raise ConnectionError("Página indisponível via HTTP")
+            return parse_table_html(self.page_html, self.page_url)
+        return self._collect_table_elements(keep_handles)
+    
+    def _row_builder(self, headers):
+        """Retorna a função que monta cada linha (dict ou CompactRow)"""
+        return self._make_row_builder(headers, self.compact_rows)
+    
+    @staticmethod
+    def _make_row_builder(headers, compact_rows=False):
+        if compact_rows:
+            return RowContext(headers).build
+        return lambda i, cell_texts, buttons: ChallengeDOM._build_row(i, headers, cell_texts, buttons)
+    
+    @instrumented
     def extract_table_data(self):
         """Extrai todos os dados da tabela de forma estruturada"""
         try:
             print("📊 Extraindo dados da tabela...")
+            commands_before = self.command_count
+            self.row_handles.invalidate()
+            headers, rows = self._collect_table(keep_handles=self.cache_row_handles)
+            self._store_rows(headers, rows)
+            self.last_extraction_commands = self.command_count - commands_before
+            print(f"✅ Extração concluída! {len(self.data)} registros coletados.")
+            print(f"🔢 Comandos WebDriver na extração ({self.backend}): {self.last_extraction_commands}")
+            return True
             
-            table = self.driver.find_element(By.CSS_SELECTOR, "table")
-            thead = table.find_element(By.TAG_NAME, "thead")
-            headers = [th.text.strip() for th in thead.find_elements(By.TAG_NAME, "th")]
+        except Exception as e:
+            print(f"❌ Erro ao extrair dados: {str(e)}")
+            return False
+    
+    async def extract_table_data_cdp(self, page):
+        """Versão corrotina de extract_table_data sobre uma aba do backend assíncrono CDP (ver extract_table_cdp)"""
+        try:
+            print("📊 Extraindo dados da tabela (CDP)...")
+            self.headers, self.data = await extract_table_cdp(page, self.compact_rows)
+            print(f"📋 Encontradas {len(self.data)} linhas com {len(self.headers)} colunas: {self.headers}")
+            print(f"✅ Extração concluída! {len(self.data)} registros coletados.")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao extrair dados: {str(e)}")
+            return False
+    
+    def load_html_file(self, filename, base_url=CHALLENGE_URL):
+        """Extrai a tabela de um snapshot HTML salvo em disco (sem navegador)"""
+        try:
+            print(f"📂 Extraindo dados de {filename}...")
+            with open(filename, encoding='utf-8') as f:
+                headers, rows = parse_table_html(f.read(), base_url)
             
-            tbody = table.find_element(By.TAG_NAME, "tbody")
-            rows = tbody.find_elements(By.TAG_NAME, "tr")
+            self._store_rows(headers, rows)
+            print(f"✅ Extração concluída! {len(self.data)} registros coletados.")
+            return True
             
-            print(f"📋 Encontradas {len(rows)} linhas com {len(headers)} colunas: {headers}")
+        except Exception as e:
+            print(f"❌ Erro ao extrair dados do HTML: {str(e)}")
+            return False
+    
+    @instrumented
+    def save_html_snapshot(self, filename=None):
+        """Salva o page_source atual para reextração offline posterior"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_page_{timestamp}.html"
+        
+        try:
+            with open(filename, 'w', encoding='utf-8') as htmlfile:
+                htmlfile.write(self.page_html if self.driver is None else self.driver.page_source)
             
-            self.data = []
-            for i, row in enumerate(rows, 1):
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
-                # Extrai dados das células (exceto a última que contém botões)
-                row_data = {
-                    'linha': i,
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                
-                # Mapeia cada célula com seu cabeçalho correspondente
-                for j, cell in enumerate(cells[:-1]):  # Ignora a última célula (botões)
-                    if j < len(headers) - 1:  # Ignora a coluna "Action"
-                        row_data[headers[j]] = cell.text.strip()
-                
-                # Extrai informações dos botões
-                action_cell = cells[-1]
-                buttons = action_cell.find_elements(By.TAG_NAME, "a")
-                row_data['botoes_disponiveis'] = [btn.text.strip() for btn in buttons]
-                row_data['edit_href'] = None
-                row_data['delete_href'] = None
+            print(f"💾 Snapshot HTML salvo em: {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao salvar snapshot HTML: {str(e)}")
+            return False
+    
+    def _store_rows(self, headers, rows):
+        """Converte as linhas coletadas nos dicionários de self.data"""
+        print(f"📋 Encontradas {len(rows)} linhas com {len(headers)} colunas: {headers}")
+        
+        build_row = self._row_builder(headers)
+        self.headers = headers
+        self.data = []
+        for i, (cell_texts, buttons) in enumerate(rows, 1):
+            row_data = build_row(i, cell_texts, buttons)
+            self.data.append(row_data)
+            print(f"  📝 Linha {i}: {list(row_data.values())[2:-3]}...")  # Mostra principais dados
+    
+    @instrumented
+    def click_button(self, linha, tipo_botao='edit'):
+        """Clica em um botão específico de uma linha
+        
+        Usa os elementos guardados em row_handles (pela extração, com cache_row_handles, ou
+        por um clique anterior); sem cache, localiza só a linha pedida e a guarda. Se a linha
+        foi redesenhada (referência obsoleta), ela é localizada de novo e o clique é repetido
+        uma vez.
+        """
+        if self.driver is None:
+            print("❌ Cliques exigem navegador (indisponível no modo leve/offline)")
+            return False
+        
+        try:
+            print(f"🖱️  Clicando no botão '{tipo_botao}' da linha {linha}...")
+            
+            handle = self.row_handles.get(linha) or self._resolve_row(linha)
+            recovered = False
+            while handle is not None:
+                _, links = handle
+                btn = next((link for href, link in links if href and tipo_botao.lower() in href.lower()), None)
+                if btn is None:
+                    print(f"❌ Botão '{tipo_botao}' não encontrado na linha {linha}")
+                    return False
                 
-                for btn in buttons:
-                    href = btn.get_attribute('href')
-                    if 'edit' in href:
-                        row_data['edit_href'] = href
-                    elif 'delete' in href:
-                        row_data['delete_href'] = href
+                old_url = self.driver.current_url
+                try:
+                    btn.click()
+                except StaleElementReferenceException:
+                    if recovered:
+                        raise
+                    # Só esta linha é descartada e localizada de novo
+                    self.row_handles.invalidate(linha)
+                    self.row_handles.stats['reresolucoes'] += 1
+                    recovered = True
+                    handle = self._resolve_row(linha)
+                    continue
                 
-                self.data.append(row_data)
-                print(f"  📝 Linha {i}: {list(row_data.values())[2:-3]}...")  # Mostra principais dados
+                print(f"✅ Botão '{tipo_botao}' da linha {linha} clicado!")
+                self.readiness.after_click(old_url)  # Aguarda mudança de URL/hash ou DOM estável
+                return True
+            return False
             
-            print(f"✅ Extração concluída! {len(self.data)} registros coletados.")
+        except Exception as e:
+            print(f"❌ Erro ao clicar no botão: {str(e)}")
+            return False
+    
+    def _resolve_row(self, linha):
+        """Localiza só a linha pedida e seus links de ação, guardando em row_handles
+        
+        Retorna (linha, [(href, link), ...]) ou None se a linha não existe.
+        """
+        rows = self.driver.find_elements(By.CSS_SELECTOR, f"table tbody > tr:nth-child({linha})") if linha > 0 else []
+        if not rows:
+            total = len(self.driver.find_elements(By.CSS_SELECTOR, "table tbody > tr"))
+            print(f"❌ Erro: Linha {linha} não existe (máximo: {total})")
+            return None
+        
+        row = rows[0]
+        links = row.find_elements(By.CSS_SELECTOR, "td:last-child a")
+        handle = (row, [(link.get_attribute('href'), link) for link in links])
+        self.row_handles.store(linha, *handle)
+        return handle
+    
+    @instrumented
+    def run_action_plan(self, operations, chunk_size=ACTION_PLAN_CHUNK, filename=None):
+        """Executa uma lista de cliques (linha, ação) em lote, sem o ciclo find/click/espera de click_button
+        
+        Cada lote de até chunk_size operações custa um único execute_script: as linhas e os
+        botões são localizados uma vez e clicados em sequência dentro da página, sem pausas
+        fixas. Um clique que leva a outra página encerra o lote; o executor aguarda a navegação
+        e segue com as operações restantes. Retorna um resultado por operação ({'linha',
+        'acao', 'ok', 'href' ou 'erro'}); com filename grava também o relatório em JSON.
+        """
+        if self.driver is None:
+            print("❌ Cliques exigem navegador (indisponível no modo leve/offline)")
+            return None
+        
+        operations = [_action_operation(item) for item in operations]
+        print(f"🖱️  Executando plano de {len(operations)} ação(ões) em lotes de até {chunk_size}...")
+        results = []
+        started = time.perf_counter()
+        position = 0
+        while position < len(operations):
+            chunk = operations[position:position + chunk_size]
+            old_url = self.driver.current_url
+            try:
+                answers = self.driver.execute_script(ACTION_PLAN_SCRIPT, [list(op) for op in chunk])
+                if not isinstance(answers, list) or not answers:
+                    # Documento descarregado no meio do lote (ou resposta vazia): sem como avançar
+                    raise WebDriverException(f"Resposta inválida do lote: {answers!r}")
+            except Exception as e:
+                print(f"❌ Erro ao executar o plano de ações: {str(e)}")
+                results.extend({'linha': linha, 'acao': acao, 'ok': False, 'erro': str(e)}
+                               for linha, acao in operations[position:])
+                break
+            for (linha, acao), answer in zip(chunk, answers):
+                results.append({'linha': linha, 'acao': acao, **answer})
+            position += len(answers)
+            if answers and answers[-1].get('navegou'):
+                self.readiness.after_click(old_url)  # Aguarda o novo documento antes do próximo lote
+        
+        elapsed = time.perf_counter() - started
+        succeeded = sum(1 for result in results if result['ok'])
+        summary = {
+            'total': len(results),
+            'sucessos': succeeded,
+            'falhas': len(results) - succeeded,
+            'segundos': round(elapsed, 3),
+            'acoes_por_segundo': round(len(results) / elapsed, 1) if elapsed else None
+        }
+        print(f"✅ Plano concluído: {succeeded}/{len(results)} ações em {elapsed:.2f}s "
+              f"({summary['acoes_por_segundo']} ações/s)")
+        failures = [result for result in results if not result['ok']]
+        for result in failures[:10]:
+            print(f"  ❌ Linha {result['linha']} ({result['acao']}): {result['erro']}")
+        if len(failures) > 10:
+            print(f"  ... e mais {len(failures) - 10} falha(s)")
+        
+        if filename:
+            report = {'metadata': {'url': self.driver.current_url,
+                                   'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), **summary},
+                      'resultados': results}
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            print(f"💾 Resultado do plano salvo em: {filename}")
+        return results
+    
+    def start_watch(self):
+        """Instala o MutationObserver na tabela para acompanhar alterações (watch)"""
+        if self.driver is None:
+            print("❌ O modo watch exige navegador (indisponível no modo leve/offline)")
+            return False
+        if not self.data:
+            print("❌ Extraia a tabela antes de acompanhar alterações")
+            return False
+        
+        self.readiness.script_timeout(5)
+        installed = self.driver.execute_async_script(TABLE_WATCH_SCRIPT, 0, True)
+        if installed is None:
+            print("❌ Tabela não encontrada para observar")
+            return False
+        self.watching = True
+        print("👀 Observando alterações da tabela")
+        return True
+    
+    @instrumented
+    def poll_changes(self, timeout=0):
+        """Aplica em self.data as linhas alteradas desde a última consulta e retorna os eventos delta
+        
+        Com timeout > 0 a chamada espera até timeout segundos pela próxima mutação.
+        Custa um único comando WebDriver, que traz apenas as linhas alteradas (o timeout de
+        script só é enviado quando precisa aumentar, ver Readiness.script_timeout).
+        """
+        self.readiness.script_timeout(timeout + 5)
+        payload = self.driver.execute_async_script(TABLE_WATCH_SCRIPT, int(timeout * 1000), False)
+        if payload is None:
+            raise NoSuchElementException("Tabela não encontrada na página")
+        
+        build_row = self._row_builder(self.headers)
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        events = []
+        for row in payload['linhas']:
+            index = row['indice']
+            new_row = build_row(index + 1, row['cells'], [tuple(btn) for btn in row['buttons'] or []])
+            if index >= len(self.data):
+                self.data.append(new_row)
+                events.append({'tipo': 'adicionada', 'linha': index + 1, 'dados': dict(new_row),
+                               'timestamp': timestamp})
+                continue
+            
+            old_row = self.data[index]
+            changes = {key: {'antes': old_row.get(key), 'depois': value}
+                       for key, value in new_row.items()
+                       if key != 'timestamp' and old_row.get(key) != value}
+            if changes:
+                self.data[index] = new_row
+                events.append({'tipo': 'alterada', 'linha': index + 1, 'alteracoes': changes,
+                               'timestamp': timestamp})
+        
+        # Só uma resposta completa informa remoções (linhas além do total atual); linhas
+        # inseridas ou removidas deslocam as posições guardadas no cache de cliques
+        if payload['completo']:
+            self.row_handles.invalidate()
+            for index in range(len(self.data) - 1, payload['total'] - 1, -1):
+                self.data.pop()
+                events.append({'tipo': 'removida', 'linha': index + 1, 'timestamp': timestamp})
+        return events
+    
+    def watch(self, duration=None, on_change=None, timeout=5):
+        """Acompanha a tabela mantendo self.data atualizado até duration segundos (ou Ctrl+C)
+        
+        Cada alteração é entregue a on_change como evento delta (padrão: imprime no terminal).
+        """
+        if not self.start_watch():
+            return False
+        
+        on_change = on_change or self._print_change
+        deadline = None if duration is None else time.monotonic() + duration
+        total_events = 0
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                wait = timeout if deadline is None else max(0, min(timeout, deadline - time.monotonic()))
+                for event in self.poll_changes(wait):
+                    total_events += 1
+                    on_change(event)
+        except KeyboardInterrupt:
+            print("\n⏹️  Watch interrompido")
+        except Exception as e:
+            print(f"❌ Erro no modo watch: {str(e)}")
+            return False
+        
+        print(f"👀 Watch encerrado: {total_events} alteração(ões) aplicadas")
+        return True
+    
+    @staticmethod
+    def _print_change(event):
+        if event['tipo'] == 'alterada':
+            changes = ', '.join(f"{key}: {change['antes']!r} → {change['depois']!r}"
+                                for key, change in event['alteracoes'].items())
+            print(f"  ✏️  Linha {event['linha']}: {changes}")
+        elif event['tipo'] == 'adicionada':
+            print(f"  ➕ Linha {event['linha']} adicionada")
+        else:
+            print(f"  ➖ Linha {event['linha']} removida")
+    
+    @instrumented
+    def stream_table_data(self, filename=None, fmt='jsonl', append=False, keep_in_memory=False):
+        """Extrai a tabela gravando cada linha no arquivo assim que é lida
+        
+        A memória fica constante (self.data só é preenchido com keep_in_memory=True)
+        e as linhas já gravadas sobrevivem a uma falha no meio da extração.
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_data_{timestamp}.{fmt}"
+        
+        writer = row_writer(filename, fmt, append)
+        written = 0
+        try:
+            print(f"📊 Extraindo dados da tabela em streaming para {filename}...")
+            next(writer)
+            headers, rows = self._collect_table()
+            print(f"📋 Encontradas {len(rows)} linhas com {len(headers)} colunas: {headers}")
+            
+            build_row = self._row_builder(headers)
+            if keep_in_memory:
+                self.data = []
+            for i, (cell_texts, buttons) in enumerate(rows, 1):
+                row_data = build_row(i, cell_texts, buttons)
+                written = writer.send(row_data)
+                if keep_in_memory:
+                    self.data.append(row_data)
+            
+            print(f"💾 {written} registros gravados em: {filename}")
             return True
             
         except Exception as e:
-            print(f"❌ Erro ao extrair dados: {str(e)}")
+            print(f"❌ Erro na extração em streaming: {str(e)} ({written} registros já gravados em {filename})")
             return False
+        finally:
+            writer.close()
     
-    def click_button(self, linha, tipo_botao='edit'):
-        """Clica em um botão específico de uma linha"""
+    @instrumented
+    def crawl(self, urls=None, next_selector=None, max_pages=100, filename=None, fmt='jsonl', append=False):
+        """Percorre várias páginas de tabela carregando a página N+1 enquanto extrai a página N
+        
+        Recebe uma lista de URLs ou um seletor CSS do link "próxima página" (a partir de self.url).
+        No navegador a próxima página carrega numa segunda aba; no modo 'http' é baixada numa
+        thread. As linhas vão direto para o arquivo (row_writer), numeradas de forma contínua.
+        """
+        if not urls and not next_selector:
+            urls = [self.url]
+        if next_selector and self.backend == 'http':
+            print("❌ O seletor de próxima página exige navegador; use uma lista de URLs no modo 'http'")
+            return False
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_crawl_{timestamp}.{fmt}"
+        
+        pending = list(urls or [])
+        first_url = pending.pop(0) if pending else self.url
+        
+        def next_url():
+            if next_selector:
+                return self.driver.execute_script(NEXT_PAGE_SCRIPT, next_selector)
+            return pending.pop(0) if pending else None
+        
+        writer = row_writer(filename, fmt, append)
+        loader = None
+        pages = rows_written = 0
+        started = time.perf_counter()
         try:
-            print(f"🖱️  Clicando no botão '{tipo_botao}' da linha {linha}...")
+            next(writer)
+            print(f"🕷️  Iniciando crawler (até {max_pages} páginas) → {filename}")
+            loader = self._http_page_loader() if self.backend == 'http' else self._tab_page_loader()
+            url = next(loader)
+            url = loader.send(first_url)
             
-            tbody = self.driver.find_element(By.TAG_NAME, "tbody")
-            rows = tbody.find_elements(By.TAG_NAME, "tr")
+            while url and pages < max_pages:
+                upcoming = next_url() if pages + 1 < max_pages else None
+                if upcoming:
+                    loader.send(('prefetch', upcoming))
+                
+                headers, rows = self._collect_table()
+                build_row = self._row_builder(headers)
+                for cell_texts, buttons in rows:
+                    rows_written = writer.send(build_row(rows_written + 1, cell_texts, buttons))
+                pages += 1
+                print(f"  📄 Página {pages}: {len(rows)} linhas ({url})")
+                
+                url = loader.send(('activate', upcoming)) if upcoming else None
             
-            if linha > len(rows):
-                print(f"❌ Erro: Linha {linha} não existe (máximo: {len(rows)})")
-                return False
+            elapsed = time.perf_counter() - started
+            per_minute = pages / elapsed * 60 if elapsed else 0.0
+            print(f"✅ Crawler concluído: {pages} páginas, {rows_written} registros em {elapsed:.1f}s "
+                  f"({per_minute:.1f} páginas/min)")
+            return True
             
-            row = rows[linha - 1]
-            action_cell = row.find_elements(By.TAG_NAME, "td")[-1]
-            buttons = action_cell.find_elements(By.TAG_NAME, "a")
+        except Exception as e:
+            print(f"❌ Erro no crawler: {str(e)} ({pages} páginas, {rows_written} registros já gravados)")
+            return False
+        finally:
+            writer.close()
+            if loader is not None:
+                loader.close()
+    
+    def _tab_page_loader(self):
+        """Corrotina de carregamento em duas abas: uma é extraída enquanto a outra carrega"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        main_tab = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        background_tab = self.driver.current_window_handle
+        # O bloqueio de URLs via CDP vale por aba
+        apply_request_blocking(self.driver, self.profile)
+        self.driver.switch_to.window(main_tab)
+        try:
+            url = yield None
+            self.driver.get(url)
+            self._record_first_navigation()
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table")))
+            current_tab = main_tab
             
-            for btn in buttons:
-                if tipo_botao.lower() in btn.get_attribute('href').lower():
-                    btn.click()
-                    print(f"✅ Botão '{tipo_botao}' da linha {linha} clicado!")
-                    time.sleep(1)  # Aguarda possível mudança na página
-                    return True
+            while True:
+                command, url = yield self.driver.current_url
+                other_tab = background_tab if current_tab == main_tab else main_tab
+                if command == 'prefetch':
+                    self.driver.switch_to.window(other_tab)
+                    self.driver.execute_script(START_NAVIGATION_SCRIPT, url)
+                    self.driver.switch_to.window(current_tab)
+                    # Volta ao laço: a página atual é extraída enquanto a outra aba carrega
+                    command, url = yield self.driver.current_url
+                
+                self.driver.switch_to.window(other_tab)
+                WebDriverWait(self.driver, 30, poll_frequency=0.05).until(
+                    lambda d: d.execute_script(PAGE_READY_SCRIPT))
+                current_tab = other_tab
+                self.row_handles.invalidate()  # Elementos guardados são da outra aba
+        finally:
+            self.driver.switch_to.window(background_tab)
+            self.driver.close()
+            self.driver.switch_to.window(main_tab)
+    
+    def _http_page_loader(self):
+        """Corrotina de carregamento via HTTP: a próxima página é baixada numa thread"""
+        def fetch(url):
+            status, final_url, html = self.http_client.get(url)
+            if status != 200:
+                raise ConnectionError(f"HTTP {status} ao carregar {final_url}")
+            return final_url, html
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            url = yield None
+            self.page_url, self.page_html = fetch(url)
+            future = None
             
-            print(f"❌ Botão '{tipo_botao}' não encontrado na linha {linha}")
+            while True:
+                command, url = yield self.page_url
+                if command == 'prefetch':
+                    future = executor.submit(fetch, url)
+                    command, url = yield self.page_url
+                self.page_url, self.page_html = future.result() if future else fetch(url)
+                future = None
+    
+    def save_to_jsonl(self, filename=None, append=False):
+        """Salva os dados extraídos em JSON Lines (um registro por linha)"""
+        if not self.data:
+            print("❌ Nenhum dado para salvar")
             return False
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_data_{timestamp}.jsonl"
+        
+        writer = row_writer(filename, 'jsonl', append)
+        try:
+            next(writer)
+            for row_data in self.data:
+                writer.send(row_data)
             
+            print(f"💾 Dados salvos em: {filename}")
+            return True
         except Exception as e:
-            print(f"❌ Erro ao clicar no botão: {str(e)}")
+            print(f"❌ Erro ao salvar JSONL: {str(e)}")
             return False
+        finally:
+            writer.close()
     
     def save_to_csv(self, filename=None):
         """Salva os dados extraídos em arquivo CSV"""
@@ -158,7 +1349,7 @@ class ChallengeDOM:
         
         try:
             with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(self.data, jsonfile, indent=2, ensure_ascii=False)
+                json.dump(self.data, jsonfile, indent=2, ensure_ascii=False, default=dict)
             
             print(f"💾 Dados salvos em: {filename}")
             return True
@@ -166,6 +1357,72 @@ class ChallengeDOM:
             print(f"❌ Erro ao salvar JSON: {str(e)}")
             return False
     
+    def save_to_parquet(self, filename=None):
+        """Salva os dados extraídos em Parquet (colunar, tipado e comprimido; requer pyarrow)"""
+        if not self.data:
+            print("❌ Nenhum dado para salvar")
+            return False
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_data_{timestamp}.parquet"
+        
+        try:
+            import columnar_store
+            columnar_store.write_table_rows(self.data, filename)
+            print(f"💾 Dados salvos em: {filename}")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao salvar Parquet: {str(e)}")
+            return False
+    
+    def save_to_history(self, history=None):
+        """Registra a extração no histórico SQLite (run_history.db por padrão)"""
+        if not self.data:
+            print("❌ Nenhum dado para salvar")
+            return False
+        
+        from run_history import RunHistory
+        import sqlite3
+        
+        owned = history is None
+        history = history or RunHistory()
+        metadata = {
+            'url': self.page_url or self.url,
+            'backend': self.backend,
+            'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'inicializacao': dict(self.startup),
+            'cache_linhas': dict(self.row_handles.stats)
+        }
+        try:
+            run_id = history.record_table_run(self.data, metadata)
+            print(f"🗃️  Extração #{run_id} registrada em: {history.path}")
+            return True
+        except sqlite3.Error as e:
+            print(f"❌ Erro ao registrar no histórico: {str(e)}")
+            return False
+        finally:
+            if owned:
+                history.close()
+    
+    def save_metrics(self, filename=None):
+        """Salva as métricas de comandos WebDriver (por método e tipo) em formato OpenMetrics"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"challenge_dom_metrics_{timestamp}.prom"
+        
+        try:
+            self.metrics.write_openmetrics(filename)
+            self.metrics.print_summary()
+            stats = self.row_handles.stats
+            print(f"🗂️  Cache de linhas para cliques: {stats['acertos']} acerto(s), {stats['falhas']} falha(s), "
+                  f"{stats['reresolucoes']} re-resolução(ões)")
+            print(f"💾 Métricas salvas em: {filename}")
+            return True
+        except OSError as e:
+            print(f"❌ Erro ao salvar métricas: {str(e)}")
+            return False
+    
     def interactive_mode(self):
         """Modo interativo para explorar a tabela"""
         while True:
@@ -177,12 +1434,24 @@ class ChallengeDOM:
             print("4. Salvar dados em CSV")
             print("5. Salvar dados em JSON")
             print("6. Recarregar página")
+            print("7. Acompanhar alterações (watch, Ctrl+C para parar)")
+            print("8. Salvar dados em Parquet")
+            print("9. Executar plano de ações (arquivo JSON/JSONL/CSV)")
             print("0. Sair")
             print("="*50)
             
             choice = input("Digite sua escolha: ").strip()
             
             if choice == '1':
+                if self.watching:
+                    # Traz só as linhas alteradas desde a última consulta
+                    try:
+                        for event in self.poll_changes():
+                            self._print_change(event)
+                    except WebDriverException as e:
+                        # Página recarregada ou trocada: o observer (ou a tabela) não existe mais
+                        self.watching = False
+                        print(f"❌ Acompanhamento interrompido: {str(e)}")
                 self.show_data_summary()
             elif choice == '2':
                 linha = input("Digite o número da linha (1-10): ").strip()
@@ -205,6 +1474,16 @@ class ChallengeDOM:
             elif choice == '6':
                 self.load_page()
                 self.extract_table_data()
+            elif choice == '7':
+                self.watch()
+            elif choice == '8':
+                self.save_to_parquet()
+            elif choice == '9':
+                filename = input("Arquivo do plano: ").strip()
+                try:
+                    self.run_action_plan(load_action_plan(filename))
+                except (OSError, ValueError, TypeError) as e:
+                    print(f"❌ Plano inválido: {str(e)}")
             elif choice == '0':
                 break
             else:
@@ -224,23 +1503,76 @@ class ChallengeDOM:
     
     def close(self):
         """Fecha o navegador"""
+        if self.http_client is not None:
+            self.http_client.close()
+        if self.driver is None:
+            return
+        if self.pool is not None:
+            # Remove a instrumentação desta instância antes de devolver a sessão
+            self.metrics.uninstrument(self.driver)
+            self.pool.checkin(self.driver)
+            self.driver = None
+            print("♻️  Sessão devolvida ao pool")
+            return
         print("🔒 Fechando navegador...")
         self.driver.quit()
         print("👋 Sessão encerrada!")
 
+async def extract_table_cdp(page, compact_rows=False):
+    """Extrai a tabela de uma aba CDP (cdp_async) sem Selenium; retorna (cabeçalhos, linhas)"""
+    headers, rows = ChallengeDOM._parse_table_payload(await page.execute_script(TABLE_EXTRACTION_SCRIPT))
+    build_row = ChallengeDOM._make_row_builder(headers, compact_rows)
+    return headers, [build_row(i, cell_texts, buttons) for i, (cell_texts, buttons) in enumerate(rows, 1)]
+
+async def crawl_cdp(urls, concurrency=20, compact_rows=False, headless=True):
+    """Extrai a tabela de várias URLs em paralelo numa única thread (backend assíncrono CDP)
+    
+    Mantém até `concurrency` abas abertas; retorna {url: linhas ou exceção}.
+    """
+    from cdp_async import CDPBrowser
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    async with await CDPBrowser.launch(headless=headless) as browser:
+        async def extract(url):
+            async with semaphore:
+                page = await browser.new_page()
+                try:
+                    await page.goto(url)
+                    _, rows = await extract_table_cdp(page, compact_rows)
+                    return rows
+                finally:
+                    await page.close()
+        
+        results = await asyncio.gather(*(extract(url) for url in urls), return_exceptions=True)
+    return dict(zip(urls, results))
+
 def main():
     """Função principal com demo completo"""
+    parser = argparse.ArgumentParser(description="Automação do Challenging DOM")
+    parser.add_argument('--plan', help="executa em lote um plano de ações (JSON, JSONL ou CSV com 'linha' e 'acao') "
+                                       "e encerra, sem o modo interativo")
+    args = parser.parse_args()
+    
     print("🎯 CHALLENGE DOM - Automação Avançada")
     print("=====================================")
     
     # Inicializa a classe
-    challenge = ChallengeDOM(headless=False)
+    challenge = ChallengeDOM(headless=False, backend='script')
     
     try:
+        # O plano é lido enquanto o navegador inicia
+        operations = load_action_plan(args.plan) if args.plan else None
+        
         # Carrega a página
         if not challenge.load_page():
             return
         
+        if operations is not None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            challenge.run_action_plan(operations, filename=f"challenge_dom_actions_{timestamp}.json")
+            return
+        
         # Extrai dados da tabela
         if not challenge.extract_table_data():
             return
@@ -248,13 +1580,13 @@ def main():
         # Demonstração: clica em alguns botões
         print("\n🎬 DEMONSTRAÇÃO: Clicando em botões...")
         challenge.click_button(1, 'edit')
-        time.sleep(2)
         challenge.click_button(3, 'delete')
-        time.sleep(2)
         
         # Salva dados automaticamente
         challenge.save_to_csv()
         challenge.save_to_json()
+        challenge.save_to_history()
+        challenge.save_metrics()
         
         # Modo interativo
         print("\n🎮 Iniciando modo interativo...")
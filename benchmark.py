@@ -0,0 +1,275 @@
+"""
+BENCHMARK DOS SCRAPERS
+======================
+
+Mede ChallengeDOM.extract_table_data e EcommerceMappingDemo.run_all_strategies contra
+o servidor local de fixtures (fixture_server.py), sem acessar sites reais.
+
+Para cada cenário registra:
+- tempo de parede (total e da etapa medida)
+- quantidade de comandos WebDriver (command_metrics, incluindo sessões paralelas)
+- pico de memória do Python (tracemalloc, em execução separada) e heap JS da página
+- tempo de carregamento da página, recursos baixados e bytes transferidos
+- tempo até a primeira navegação e do boot do Chrome em segundo plano
+
+Com --profiles os cenários com navegador rodam em cada perfil de inicialização do
+Chrome (driver_pool.LAUNCH_PROFILES) e o perfil 'default' serve de referência.
+
+Os resultados vão para benchmark_results_<timestamp>.json; use --compare com um
+arquivo anterior para ver regressões entre commits.
+
+Uso:
+    python benchmark.py --rows 10 1000 100000 --backends script html http
+    python benchmark.py --profiles default lean --backends script
+    python benchmark.py --compare benchmark_results_20251007_141309.json
+"""
+
+from contextlib import redirect_stdout
+from datetime import datetime
+from fixture_server import FixtureServer
+from driver_pool import LAUNCH_PROFILES
+import importlib.util
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import json
+import time
+import io
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_activity(filename):
+    """Importa um dos scripts das atividades (os nomes têm hífen e não são importáveis diretamente)"""
+    name = os.path.splitext(filename)[0].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, os.path.join(BASE_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def js_heap_kb(driver):
+    """Heap JS usado pela página (performance.memory do Chrome) em KB"""
+    try:
+        used = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : null")
+        return round(used / 1024, 1) if used else None
+    except Exception:
+        return None
+
+# Tempos da navegação e totais dos recursos da página, em uma única chamada
+PAGE_LOAD_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    dom_pronto_ms: nav ? Math.round(nav.domContentLoadedEventEnd) : null,
+    load_ms: nav && nav.loadEventEnd ? Math.round(nav.loadEventEnd) : null,
+    recursos: resources.length,
+    bytes_transferidos: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0)
+};
+"""
+
+def page_load_stats(driver):
+    """Tempo de carregamento (Navigation Timing) e recursos baixados pela página atual"""
+    try:
+        return driver.execute_script(PAGE_LOAD_SCRIPT) or {}
+    except Exception:
+        return {}
+
+def git_commit():
+    """Commit atual do repositório, para comparar resultados entre versões"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def measure(name, params, scenario, trace_memory=True):
+    """Executa um cenário medindo tempo; o cenário retorna métricas extras
+
+    O tracemalloc deixa o Python bem mais lento, então o pico de memória é medido
+    numa segunda execução, separada da execução cronometrada.
+    """
+    print(f"⏱️  {name} {params}...", end=' ', flush=True)
+    result = {'cenario': name, 'parametros': params, 'ok': True}
+    started = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            extra = scenario()
+        result['segundos_total'] = round(time.perf_counter() - started, 3)
+        result.update(extra)
+
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                with redirect_stdout(io.StringIO()):
+                    scenario()
+                result['memoria_pico_python_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result['ok'] = False
+        result['segundos_total'] = round(time.perf_counter() - started, 3)
+        result['erro'] = str(e)
+
+    print(f"{'✅' if result['ok'] else '❌'} {result['segundos_total']:.2f}s")
+    return result
+
+def squad_scenario(squad, url, backend, profile='default'):
+    """Cenário: carregar e extrair a tabela do clone do Challenging DOM"""
+    def scenario():
+        challenge = squad.ChallengeDOM(headless=True, backend=backend, url=url, profile=profile)
+        try:
+            started = time.perf_counter()
+            if not challenge.load_page() or not challenge.extract_table_data():
+                raise RuntimeError("Falha ao carregar ou extrair a tabela")
+            return {
+                'segundos_medidos': round(time.perf_counter() - started, 3),
+                'linhas_extraidas': len(challenge.data),
+                'comandos_webdriver': challenge.command_count,
+                'heap_js_kb': js_heap_kb(challenge.driver) if challenge.driver else None,
+                'primeira_navegacao_s': challenge.startup.get('primeira_navegacao_s'),
+                'boot_chrome_s': challenge.startup.get('boot_chrome_s'),
+                **(page_load_stats(challenge.driver) if challenge.driver else {})
+            }
+        finally:
+            challenge.close()
+    return scenario
+
+def solo_scenario(solo, url, parallel_sessions, profile='default'):
+    """Cenário: executar as 13 estratégias na página no estilo da Amazon"""
+    def scenario():
+        # Escada e cache só em memória: nada é gravado no diretório atual e cada
+        # iteração começa sem o aprendizado das anteriores
+        demo = solo.EcommerceMappingDemo(headless=True, url=url, profile=profile,
+                                         locator_cache=solo.LocatorCache(), locator_ladder=solo.LocatorLadder())
+        try:
+            if not demo.run_all_strategies(parallel_sessions=parallel_sessions):
+                raise RuntimeError("Falha ao executar as estratégias")
+            return {
+                'segundos_medidos': round(demo.last_run_seconds, 3),
+                'estrategias': len(demo.mapping_results),
+                'comandos_webdriver': demo.metrics.total_commands,
+                'heap_js_kb': js_heap_kb(demo.driver),
+                'primeira_navegacao_s': demo.startup.get('primeira_navegacao_s'),
+                'boot_chrome_s': demo.startup.get('boot_chrome_s'),
+                **page_load_stats(demo.driver)
+            }
+        finally:
+            demo.close()
+    return scenario
+
+def profile_params(params, profile):
+    """Parâmetros do cenário com o perfil (o 'default' fica implícito, como nos resultados antigos)"""
+    return params if profile == 'default' else {**params, 'perfil': profile}
+
+def compare_profiles(results):
+    """Mostra cada perfil de inicialização em relação ao 'default' no mesmo cenário"""
+    def key(result):
+        params = {k: v for k, v in result['parametros'].items() if k != 'perfil'}
+        return result['cenario'], json.dumps(params, sort_keys=True)
+
+    baseline = {key(r): r for r in results if r['ok'] and 'perfil' not in r['parametros']}
+    others = [r for r in results if r['ok'] and 'perfil' in r['parametros'] and key(r) in baseline]
+    if not others:
+        return
+
+    print("\n🪶 PERFIS DE INICIALIZAÇÃO x DEFAULT")
+    print("-" * 60)
+    for result in others:
+        old = baseline[key(result)]
+        print(f"{result['parametros']['perfil']} {result['cenario']} {old['parametros']}: "
+              f"{old['segundos_total']:.2f}s → {result['segundos_total']:.2f}s, "
+              f"DOM pronto {old.get('dom_pronto_ms')} → {result.get('dom_pronto_ms')} ms, "
+              f"heap JS {old.get('heap_js_kb')} → {result.get('heap_js_kb')} KB, "
+              f"{old.get('recursos')} → {result.get('recursos')} recursos "
+              f"({old.get('bytes_transferidos')} → {result.get('bytes_transferidos')} bytes)")
+
+def compare(results, previous_file):
+    """Mostra a variação de tempo e comandos em relação a um resultado anterior"""
+    with open(previous_file, encoding='utf-8') as f:
+        previous = json.load(f)
+    baseline = {(r['cenario'], json.dumps(r['parametros'], sort_keys=True)): r for r in previous['cenarios']}
+
+    print(f"\n📈 COMPARAÇÃO COM {previous_file} (commit {previous['metadata'].get('commit')})")
+    print("-" * 60)
+    for result in results:
+        old = baseline.get((result['cenario'], json.dumps(result['parametros'], sort_keys=True)))
+        if not old or not old['ok'] or not result['ok']:
+            continue
+        time_delta = (result['segundos_medidos'] / old['segundos_medidos'] - 1) * 100 if old['segundos_medidos'] else 0
+        status = "⚠️ " if time_delta > 10 else "✅"
+        print(f"{status} {result['cenario']} {result['parametros']}: "
+              f"{old['segundos_medidos']:.2f}s → {result['segundos_medidos']:.2f}s ({time_delta:+.1f}%), "
+              f"comandos {old.get('comandos_webdriver')} → {result.get('comandos_webdriver')}")
+
+def main():
+    """Executa os cenários de benchmark e salva os resultados em JSON"""
+    parser = argparse.ArgumentParser(description="Benchmark dos scrapers contra fixtures locais")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10, 1000], help="linhas da tabela (10 a 100000)")
+    parser.add_argument('--backends', nargs='+', default=['elements', 'script', 'html', 'http'])
+    parser.add_argument('--max-element-rows', type=int, default=1000,
+                        help="limite de linhas para o backend 'elements' (um comando por célula)")
+    parser.add_argument('--elements', type=int, nargs='+', default=[200], help="blocos da página estilo Amazon")
+    parser.add_argument('--images', type=int, default=50)
+    parser.add_argument('--links', type=int, default=20)
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4], help="sessões para run_all_strategies")
+    parser.add_argument('--profiles', nargs='+', default=['default'], choices=list(LAUNCH_PROFILES),
+                        help="perfis de inicialização do Chrome comparados com o 'default'")
+    parser.add_argument('--skip-squad', action='store_true')
+    parser.add_argument('--skip-solo', action='store_true')
+    parser.add_argument('--no-memory', action='store_true', help="não mede o pico de memória (sem segunda execução)")
+    parser.add_argument('--output', help="arquivo JSON de saída")
+    parser.add_argument('--compare', help="resultado anterior para comparação")
+    args = parser.parse_args()
+
+    print("🏁 BENCHMARK DOS SCRAPERS")
+    print("=" * 60)
+
+    results = []
+    with FixtureServer() as server:
+        if not args.skip_squad:
+            squad = load_activity('atividade-squad.py')
+            for rows in args.rows:
+                url = server.url('/challenging_dom', rows=rows)
+                for backend in args.backends:
+                    if backend == 'elements' and rows > args.max_element_rows:
+                        continue
+                    # O backend 'http' não abre navegador: o perfil não faz diferença
+                    for profile in (['default'] if backend == 'http' else args.profiles):
+                        params = profile_params({'linhas': rows, 'backend': backend}, profile)
+                        results.append(measure('challenge_dom', params, squad_scenario(squad, url, backend, profile),
+                                               not args.no_memory))
+
+        if not args.skip_solo:
+            solo = load_activity('atividade-solo.py')
+            for elements in args.elements:
+                url = server.url('/amazon', elements=elements, images=args.images, links=args.links)
+                for sessions in args.sessions:
+                    for profile in args.profiles:
+                        params = profile_params({'elementos': elements, 'imagens': args.images,
+                                                 'links': args.links, 'sessoes': sessions}, profile)
+                        results.append(measure('ecommerce_mapping', params, solo_scenario(solo, url, sessions, profile),
+                                               not args.no_memory))
+
+    report = {
+        'metadata': {
+            'data_execucao': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'plataforma': platform.platform()
+        },
+        'cenarios': results
+    }
+
+    filename = args.output or f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Resultados salvos em: {filename}")
+
+    compare_profiles(results)
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+BACKEND ASSÍNCRONO VIA CHROME DEVTOOLS PROTOCOL
+===============================================
+
+Alternativa ao Selenium para extrações em alta concorrência: um único processo
+Python (e uma única thread) controla dezenas de abas do Chrome ao mesmo tempo,
+todas multiplexadas em uma conexão WebSocket com o navegador.
+
+- CDPBrowser.launch() inicia um Chrome headless com --remote-debugging-port
+- browser.new_page() cria uma aba com sessão própria (Target.attachToTarget flatten)
+- page.goto(), page.execute_script() (mesma convenção de return/arguments do Selenium)
+  e page.content() são corrotinas
+
+Depende do pacote opcional 'websockets', importado só quando o navegador é iniciado.
+
+Uso:
+    async with await CDPBrowser.launch() as browser:
+        page = await browser.new_page()
+        await page.goto("http://127.0.0.1:8000/challenging_dom?rows=100")
+        title = await page.execute_script("return document.title")
+"""
+
+import asyncio
+import itertools
+import tempfile
+import shutil
+import json
+import os
+
+CHROME_EXECUTABLES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+class CDPError(Exception):
+    """Erro devolvido pelo navegador para um comando CDP"""
+
+def _import_websockets():
+    try:
+        import websockets
+    except ImportError:
+        raise ImportError("O backend CDP assíncrono precisa do pacote 'websockets' "
+                          "(pip install websockets)") from None
+    return websockets
+
+def find_chrome():
+    """Caminho do executável do Chrome/Chromium disponível no PATH"""
+    for name in CHROME_EXECUTABLES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise FileNotFoundError(f"Chrome não encontrado no PATH (procurado: {', '.join(CHROME_EXECUTABLES)})")
+
+class CDPBrowser:
+    """Conexão com um Chrome via DevTools Protocol, compartilhada por todas as abas"""
+
+    def __init__(self, process, connection, user_data_dir):
+        self.process = process
+        self.user_data_dir = user_data_dir
+        self._connection = connection
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._pages = {}
+        self._closed_error = None
+        self._reader = asyncio.ensure_future(self._read_messages())
+
+    @classmethod
+    async def launch(cls, headless=True, chrome_path=None, extra_args=(), timeout=30):
+        """Inicia o Chrome com depuração remota e conecta ao endpoint do navegador"""
+        websockets = _import_websockets()
+        user_data_dir = tempfile.mkdtemp(prefix='cdp-chrome-')
+        args = [
+            chrome_path or find_chrome(),
+            '--remote-debugging-port=0',
+            f'--user-data-dir={user_data_dir}',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            *(['--headless=new'] if headless else []),
+            *extra_args,
+            'about:blank'
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+
+        # O Chrome escreve a porta escolhida e o caminho do WebSocket em DevToolsActivePort
+        port_file = os.path.join(user_data_dir, 'DevToolsActivePort')
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                if os.path.exists(port_file):
+                    with open(port_file, encoding='utf-8') as f:
+                        lines = f.read().split()
+                    if len(lines) >= 2:
+                        break
+                if process.returncode is not None:
+                    raise CDPError(f"Chrome encerrou ao iniciar (código {process.returncode})")
+                if loop.time() > deadline:
+                    raise asyncio.TimeoutError("Chrome não abriu a porta de depuração a tempo")
+                await asyncio.sleep(0.05)
+
+            port, ws_path = lines[0], lines[1]
+            connection = await websockets.connect(f"ws://127.0.0.1:{port}{ws_path}", max_size=None)
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+        return cls(process, connection, user_data_dir)
+
+    async def send(self, method, params=None, session_id=None):
+        """Envia um comando CDP e aguarda a resposta correspondente"""
+        if self._reader.done():
+            # Ninguém mais lê respostas: a espera nunca terminaria
+            raise self._closed_error or ConnectionError("Conexão CDP encerrada")
+        message_id = next(self._ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._connection.send(json.dumps(message))
+            return await future
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def _read_messages(self):
+        """Distribui respostas (por id) e eventos (por sessão) recebidos do navegador"""
+        error = ConnectionError("Conexão CDP encerrada")
+        try:
+            async for raw in self._connection:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self._pending.get(message['id'])
+                    if future is None or future.done():
+                        continue
+                    if 'error' in message:
+                        future.set_exception(CDPError(message['error'].get('message', message['error'])))
+                    else:
+                        future.set_result(message.get('result', {}))
+                else:
+                    page = self._pages.get(message.get('sessionId'))
+                    if page is not None:
+                        page._dispatch(message['method'], message.get('params', {}))
+        except Exception as e:
+            error = ConnectionError(f"Conexão CDP perdida: {e}")
+        finally:
+            self._closed_error = error
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def new_page(self):
+        """Abre uma nova aba com sessão CDP própria"""
+        target = await self.send('Target.createTarget', {'url': 'about:blank'})
+        attached = await self.send('Target.attachToTarget', {'targetId': target['targetId'], 'flatten': True})
+        page = CDPPage(self, target['targetId'], attached['sessionId'])
+        self._pages[page.session_id] = page
+        await page.send('Page.enable')
+        return page
+
+    async def close(self):
+        """Fecha o navegador e remove o perfil temporário"""
+        try:
+            await asyncio.wait_for(self.send('Browser.close'), 5)
+        except (CDPError, ConnectionError, asyncio.TimeoutError):
+            pass
+        await self._connection.close()
+        self._reader.cancel()
+        try:
+            await asyncio.wait_for(self.process.wait(), 10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+class CDPPage:
+    """Aba controlada por corrotinas (equivalente assíncrono do subconjunto do WebDriver usado aqui)"""
+
+    def __init__(self, browser, target_id, session_id):
+        self.browser = browser
+        self.target_id = target_id
+        self.session_id = session_id
+        self.url = 'about:blank'
+        self._waiters = {}
+
+    def send(self, method, params=None):
+        return self.browser.send(method, params, self.session_id)
+
+    def _dispatch(self, method, params):
+        for future in self._waiters.pop(method, []):
+            if not future.done():
+                future.set_result(params)
+
+    def wait_for_event(self, method):
+        """Future resolvida no próximo evento CDP com esse nome nesta aba"""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(method, []).append(future)
+        return future
+
+    async def goto(self, url, timeout=30):
+        """Navega e aguarda o evento load (navegações só de hash não disparam load)"""
+        loaded = self.wait_for_event('Page.loadEventFired')
+        result = await self.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            loaded.cancel()
+            raise CDPError(f"Falha ao navegar para {url}: {result['errorText']}")
+        await asyncio.wait_for(loaded, timeout)
+        self.url = url
+
+    async def evaluate(self, expression):
+        """Avalia uma expressão JS e devolve o valor serializado (promises são aguardadas)"""
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression, 'returnByValue': True, 'awaitPromise': True
+        })
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise CDPError(details.get('exception', {}).get('description') or details.get('text'))
+        return result['result'].get('value')
+
+    async def execute_script(self, script, *args):
+        """Executa um corpo de função com return/arguments, como WebDriver.execute_script"""
+        return await self.evaluate(f"(function() {{\n{script}\n}}).apply(null, {json.dumps(list(args))})")
+
+    async def content(self):
+        """HTML atual do documento (equivalente a page_source)"""
+        return await self.evaluate("document.documentElement.outerHTML")
+
+    async def close(self):
+        self.browser._pages.pop(self.session_id, None)
+        await self.browser.send('Target.closeTarget', {'targetId': self.target_id})
@@ -0,0 +1,204 @@
+"""
+ARMAZENAMENTO COLUNAR (PARQUET)
+===============================
+
+Formato compacto para as tabelas extraídas (ChallengeDOM) e os relatórios de
+mapeamento (EcommerceMappingDemo), no lugar de um CSV/JSON com indent por execução:
+
+- Colunas tipadas (inteiros, booleanos, timestamps, listas de strings de verdade)
+- Strings repetidas (valores das colunas, hrefs, nomes de estratégia) com dicionário
+- Compressão zstd; o leitor carrega só as colunas pedidas, com memory map ou em lotes
+- archive() junta execuções antigas (JSON, CSV ou Parquet) em um único arquivo
+
+Depende do pacote opcional 'pyarrow', importado só quando o formato é usado.
+
+Uso:
+    write_table_rows(challenge.data, 'challenge_dom_data.parquet')
+    table = read_columns('challenge_dom_data.parquet', columns=['Lorem', 'timestamp'])
+    for row in iter_rows('challenge_dom_data.parquet', columns=['linha', 'Ipsum']):
+        ...
+
+    python columnar_store.py archive --output tabelas.parquet challenge_dom_data_*.json challenge_dom_data_*.csv
+    python columnar_store.py show tabelas.parquet --columns Lorem Ipsum --limit 5
+"""
+
+from datetime import datetime
+import argparse
+import json
+import ast
+import csv
+import os
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Linhas por row group: o leitor em lotes e os filtros por coluna trabalham nessa granularidade
+ROW_GROUP_SIZE = 64 * 1024
+
+# Colunas fixas de cada resultado de estratégia; o restante vai para 'detalhes_json'
+MAPPING_COLUMNS = ['metodo', 'estrategia', 'elemento', 'localizador', 'encontrado', 'backend', 'timestamp']
+MAPPING_COUNT_KEYS = ('quantidade_total', 'quantidade_encontrada', 'quantidade', 'encontrados')
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("O armazenamento colunar precisa do pacote 'pyarrow' (pip install pyarrow)") from None
+    return pyarrow, pyarrow.parquet
+
+def _parse_timestamp(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.strptime(value, TIMESTAMP_FORMAT)
+
+def _column(pa, values, timestamp=False):
+    """Array tipado pelo primeiro valor não nulo; strings ficam com dicionário"""
+    if timestamp:
+        return pa.array([_parse_timestamp(value) for value in values], pa.timestamp('s'))
+    sample = next((value for value in values if value is not None), None)
+    if isinstance(sample, bool):
+        return pa.array(values, pa.bool_())
+    if isinstance(sample, int):
+        return pa.array(values, pa.int64())
+    if isinstance(sample, float):
+        return pa.array(values, pa.float64())
+    if isinstance(sample, (list, tuple)):
+        return pa.array([None if value is None else [str(item) for item in value] for value in values],
+                        pa.list_(pa.string()))
+    return pa.array([None if value is None else str(value) for value in values], pa.string()).dictionary_encode()
+
+def table_rows_to_arrow(rows, source=None):
+    """Tabela Arrow das linhas extraídas (dicionários ou CompactRow), na ordem das colunas"""
+    pa, _ = _import_pyarrow()
+    rows = [dict(row) for row in rows]
+    names = list(rows[0]) if rows else []
+    columns = {name: _column(pa, [row.get(name) for row in rows], timestamp=name == 'timestamp') for name in names}
+    if source is not None:
+        columns['arquivo_origem'] = _column(pa, [source] * len(rows))
+    return pa.table(columns)
+
+def mapping_results_to_arrow(results, metadata=None):
+    """Tabela Arrow de um relatório de mapeamento: uma linha por estratégia
+
+    As colunas comuns a todas as estratégias são tipadas; os campos específicos de cada
+    uma (detalhes, amostras, métricas) ficam em 'detalhes_json'.
+    """
+    pa, _ = _import_pyarrow()
+    metadata = metadata or {}
+    columns = {name: _column(pa, [result.get(name) for result in results], timestamp=name == 'timestamp')
+               for name in MAPPING_COLUMNS}
+    columns['encontrado'] = pa.array([bool(result.get('encontrado', False)) for result in results], pa.bool_())
+    columns['quantidade'] = pa.array(
+        [next((result[key] for key in MAPPING_COUNT_KEYS if isinstance(result.get(key), int)), None)
+         for result in results], pa.int64())
+    columns['detalhes_json'] = pa.array(
+        [json.dumps({key: value for key, value in result.items() if key not in MAPPING_COLUMNS},
+                    ensure_ascii=False) for result in results], pa.string())
+    columns['site_testado'] = _column(pa, [metadata.get('site_testado')] * len(results))
+    columns['url'] = _column(pa, [metadata.get('url')] * len(results))
+    columns['data_execucao'] = _column(pa, [metadata.get('data_execucao')] * len(results), timestamp=True)
+    return pa.table(columns)
+
+def write_table(table, filename, compression='zstd'):
+    """Grava a tabela Arrow em Parquet comprimido, com dicionário nas strings repetidas"""
+    _, pq = _import_pyarrow()
+    pq.write_table(table, filename, compression=compression, use_dictionary=True, row_group_size=ROW_GROUP_SIZE)
+    return filename
+
+def write_table_rows(rows, filename, compression='zstd'):
+    return write_table(table_rows_to_arrow(rows), filename, compression)
+
+def write_mapping_report(results, filename, metadata=None, compression='zstd'):
+    return write_table(mapping_results_to_arrow(results, metadata), filename, compression)
+
+def read_columns(filename, columns=None):
+    """Carrega só as colunas pedidas (tabela Arrow), mapeando o arquivo em memória"""
+    _, pq = _import_pyarrow()
+    return pq.read_table(filename, columns=columns, memory_map=True)
+
+def iter_rows(filename, columns=None, batch_size=10000):
+    """Percorre as linhas como dicionários, um lote por vez (memória limitada ao lote)"""
+    _, pq = _import_pyarrow()
+    parquet_file = pq.ParquetFile(filename, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        for row in batch.to_pylist():
+            # Timestamps voltam no mesmo formato texto das linhas extraídas
+            yield {key: value.strftime(TIMESTAMP_FORMAT) if isinstance(value, datetime) else value
+                   for key, value in row.items()}
+
+def read_csv_rows(filename):
+    """Linhas de um CSV antigo do ChallengeDOM (listas gravadas como repr do Python)"""
+    with open(filename, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        for key, value in row.items():
+            if value == '':
+                row[key] = None
+            elif key == 'linha':
+                row[key] = int(value)
+            elif value.startswith('['):
+                row[key] = ast.literal_eval(value)
+    return rows
+
+def _load_run(filename):
+    """('tabela' ou 'mapeamento', tabela Arrow) de um arquivo de execução anterior"""
+    source = os.path.basename(filename)
+    if filename.endswith('.parquet'):
+        table = read_columns(filename)
+        kind = 'mapeamento' if 'detalhes_json' in table.column_names else 'tabela'
+        return kind, table
+    if filename.endswith('.csv'):
+        return 'tabela', table_rows_to_arrow(read_csv_rows(filename), source)
+    with open(filename, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and 'resultados' in data:
+        return 'mapeamento', mapping_results_to_arrow(data['resultados'], data.get('metadata'))
+    return 'tabela', table_rows_to_arrow(data, source)
+
+def archive(filenames, output, compression='zstd'):
+    """Junta vários arquivos de execução do mesmo tipo em um único Parquet"""
+    pa, _ = _import_pyarrow()
+    kinds, tables = set(), []
+    for filename in filenames:
+        kind, table = _load_run(filename)
+        kinds.add(kind)
+        if table.num_rows:
+            tables.append(table)
+    if len(kinds) > 1:
+        raise ValueError("Não misture tabelas do ChallengeDOM e relatórios de mapeamento no mesmo arquivo")
+    if not tables:
+        raise ValueError("Nenhuma linha encontrada nos arquivos informados")
+
+    # Dicionários diferentes por execução são unificados pelo concat (promote_options)
+    table = pa.concat_tables(tables, promote_options='permissive').unify_dictionaries()
+    write_table(table, output, compression)
+    return table.num_rows
+
+def main():
+    """Arquiva execuções antigas ou mostra colunas de um arquivo Parquet"""
+    parser = argparse.ArgumentParser(description="Armazenamento colunar (Parquet) das extrações e relatórios")
+    commands = parser.add_subparsers(dest='command', required=True)
+    archive_parser = commands.add_parser('archive', help="junta arquivos JSON/CSV/Parquet de várias execuções")
+    archive_parser.add_argument('files', nargs='+')
+    archive_parser.add_argument('--output', required=True)
+    show_parser = commands.add_parser('show', help="mostra as primeiras linhas de colunas selecionadas")
+    show_parser.add_argument('file')
+    show_parser.add_argument('--columns', nargs='+')
+    show_parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'archive':
+        before = sum(os.path.getsize(filename) for filename in args.files)
+        rows = archive(args.files, args.output)
+        after = os.path.getsize(args.output)
+        print(f"🗜️  {len(args.files)} arquivo(s), {rows} linhas: {before / 1024:.1f} KB → {after / 1024:.1f} KB "
+              f"em {args.output}")
+        return
+
+    for i, row in enumerate(iter_rows(args.file, args.columns)):
+        if i >= args.limit:
+            break
+        print(row)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+MÉTRICAS DE COMANDOS WEBDRIVER
+==============================
+
+Envolve driver.execute (por onde passam todos os comandos, inclusive os feitos via
+WebElement) para contar e cronometrar cada comando por tipo, atribuindo-o à
+estratégia ou método ativo no momento.
+
+Uso:
+    metrics = CommandMetrics()
+    metrics.instrument(driver)
+    with metrics.scope('strategy_12_by_text_content'):
+        driver.find_elements(By.XPATH, "//a")
+    metrics.write_openmetrics('webdriver_metrics.prom')
+"""
+
+from contextlib import contextmanager
+import functools
+import threading
+import time
+
+NO_SCOPE = 'fora_de_escopo'
+
+def instrumented(method):
+    """Atribui os comandos WebDriver do método ao escopo com o nome dele (usa self.metrics)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.metrics.scope(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class CommandMetrics:
+    """Contagem e tempo dos comandos WebDriver por escopo e por tipo de comando"""
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, driver):
+        """Passa a medir os comandos da sessão (idempotente)"""
+        if getattr(driver.execute, '__self__', None) is self:
+            return driver
+        original_execute = driver.execute
+
+        def measured_execute(driver_command, params=None):
+            started = time.perf_counter()
+            ok = False
+            try:
+                response = original_execute(driver_command, params)
+                ok = True
+                return response
+            finally:
+                self.record(self.current_scope(), driver_command, time.perf_counter() - started, ok)
+
+        measured_execute.__self__ = self
+        measured_execute.__wrapped__ = original_execute
+        driver.execute = measured_execute
+        return driver
+
+    def uninstrument(self, driver):
+        """Devolve o driver.execute original (antes de devolver a sessão a um pool)"""
+        if getattr(driver.execute, '__self__', None) is self:
+            driver.execute = driver.execute.__wrapped__
+
+    def reset(self):
+        """Zera as métricas (ex.: no início de uma nova execução)"""
+        with self._lock:
+            self.stats = {}
+
+    def current_scope(self):
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else NO_SCOPE
+
+    @contextmanager
+    def scope(self, name):
+        """Atribui ao escopo os comandos enviados nesta thread durante o bloco with
+
+        Escopos aninhados não somam duas vezes: o comando conta só para o mais interno.
+        """
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(name)
+        try:
+            yield self
+        finally:
+            stack.pop()
+
+    def record(self, scope, command, seconds, ok=True):
+        with self._lock:
+            entry = self.stats.setdefault(scope, {}).setdefault(
+                command, {'comandos': 0, 'segundos': 0.0, 'max_segundos': 0.0, 'erros': 0})
+            entry['comandos'] += 1
+            entry['segundos'] += seconds
+            entry['max_segundos'] = max(entry['max_segundos'], seconds)
+            entry['erros'] += 0 if ok else 1
+
+    def scope_summary(self, name):
+        """Totais de um escopo com o detalhamento por tipo de comando"""
+        with self._lock:
+            commands = {command: dict(entry) for command, entry in self.stats.get(name, {}).items()}
+        by_type = {
+            command: {
+                'comandos': entry['comandos'],
+                'segundos': round(entry['segundos'], 4),
+                'max_segundos': round(entry['max_segundos'], 4),
+                'erros': entry['erros']
+            }
+            for command, entry in sorted(commands.items(), key=lambda item: -item[1]['comandos'])
+        }
+        return {
+            'comandos': sum(entry['comandos'] for entry in commands.values()),
+            'segundos': round(sum(entry['segundos'] for entry in commands.values()), 4),
+            'por_tipo': by_type
+        }
+
+    def summary(self):
+        """Totais gerais e por escopo, ordenados pelos escopos com mais comandos"""
+        with self._lock:
+            scopes = list(self.stats)
+        per_scope = {name: self.scope_summary(name) for name in scopes}
+        return {
+            'comandos': sum(entry['comandos'] for entry in per_scope.values()),
+            'segundos': round(sum(entry['segundos'] for entry in per_scope.values()), 4),
+            'por_escopo': dict(sorted(per_scope.items(), key=lambda item: -item[1]['comandos']))
+        }
+
+    @property
+    def total_commands(self):
+        with self._lock:
+            return sum(entry['comandos'] for commands in self.stats.values() for entry in commands.values())
+
+    def to_openmetrics(self, prefix='webdriver'):
+        """Exporta as métricas no formato texto OpenMetrics"""
+        families = [
+            ('commands', 'comandos', None, "Comandos WebDriver enviados"),
+            ('command_seconds', 'segundos', 'seconds', "Tempo gasto em comandos WebDriver"),
+            ('command_errors', 'erros', None, "Comandos WebDriver que falharam")
+        ]
+        with self._lock:
+            samples = [(scope, command, dict(entry))
+                       for scope, commands in sorted(self.stats.items())
+                       for command, entry in sorted(commands.items())]
+
+        lines = []
+        for suffix, key, unit, help_text in families:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# TYPE {name} counter")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}")
+            for scope, command, entry in samples:
+                value = f"{entry[key]:.6f}" if unit else entry[key]
+                lines.append(f'{name}_total{{scope="{_escape_label(scope)}",command="{_escape_label(command)}"}} {value}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_openmetrics(self, filename, prefix='webdriver'):
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.to_openmetrics(prefix))
+        return filename
+
+    def print_summary(self, top=5):
+        """Mostra os escopos que mais fizeram viagens ao WebDriver"""
+        summary = self.summary()
+        print(f"\n🔢 Comandos WebDriver: {summary['comandos']} ({summary['segundos']:.2f}s)")
+        for name, entry in list(summary['por_escopo'].items())[:top]:
+            main_types = ', '.join(f"{command}={data['comandos']}"
+                                   for command, data in list(entry['por_tipo'].items())[:3])
+            print(f"   {name}: {entry['comandos']} comandos, {entry['segundos']:.2f}s ({main_types})")
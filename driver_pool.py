@@ -0,0 +1,334 @@
+"""
+POOL DE SESSÕES WEBDRIVER
+=========================
+
+Mantém sessões do Chrome abertas e reutilizáveis entre execuções, evitando o
+custo de inicialização do navegador a cada objeto ChallengeDOM ou
+EcommerceMappingDemo.
+
+Também define os perfis de inicialização do Chrome (LAUNCH_PROFILES): 'default' e
+'lean', que usa pageLoadStrategy eager, desliga imagens e bloqueia fontes, mídia e
+hosts de analytics/beacons via CDP. Um perfil pode ser o nome ou um dicionário próprio.
+
+ChromeBoot inicia o Chrome numa thread de fundo, para o chamador preparar o resto
+(configuração, caches, planos de localizadores) enquanto o navegador sobe. As classes
+do Selenium que criam a sessão só são importadas nessa hora.
+
+Uso:
+    pool = DriverPool(size=2, headless=True, profile='lean')
+    with pool.session() as driver:
+        driver.get("https://the-internet.herokuapp.com/challenging_dom")
+    pool.close()
+"""
+
+from selenium.common.exceptions import WebDriverException
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+
+# Analytics, beacons e rastreadores (padrões de Network.setBlockedURLs)
+TRACKING_URL_PATTERNS = [
+    '*fls-na.amazon.*', '*unagi.amazon.*', '*unagi-na.amazon.*', '*/batch/1/OP/*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*hotjar.com*', '*/beacon*'
+]
+FONT_URL_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+MEDIA_URL_PATTERNS = ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg']
+
+LAUNCH_PROFILES = {
+    'default': {},
+    'lean': {
+        'page_load_strategy': 'eager',
+        'disable_images': True,
+        'disable_fonts': True,
+        'disable_media': True,
+        'blocked_urls': TRACKING_URL_PATTERNS
+    }
+}
+
+def resolve_profile(profile=None):
+    """Configuração de um perfil de inicialização (nome em LAUNCH_PROFILES ou dicionário)"""
+    if profile is None:
+        return LAUNCH_PROFILES['default']
+    if isinstance(profile, dict):
+        return profile
+    try:
+        return LAUNCH_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Perfil de inicialização inválido: {profile} (opções: {list(LAUNCH_PROFILES)})") from None
+
+def blocked_url_patterns(profile=None):
+    """Padrões de URL bloqueados via CDP para o perfil (rastreadores, fontes e mídia)"""
+    settings = resolve_profile(profile)
+    patterns = list(settings.get('blocked_urls', []))
+    if settings.get('disable_fonts'):
+        patterns += FONT_URL_PATTERNS
+    if settings.get('disable_media'):
+        patterns += MEDIA_URL_PATTERNS
+    return patterns
+
+def page_ready_state(profile=None):
+    """readyState que indica página pronta: 'interactive' com pageLoadStrategy eager"""
+    return 'interactive' if resolve_profile(profile).get('page_load_strategy') == 'eager' else 'complete'
+
+def build_chrome_options(headless=False, stealth=False, profile=None):
+    """Monta as opções do Chrome usadas pelas duas atividades"""
+    from selenium.webdriver.chrome.options import Options
+
+    settings = resolve_profile(profile)
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    if stealth:
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+    if settings.get('page_load_strategy'):
+        chrome_options.page_load_strategy = settings['page_load_strategy']
+    if settings.get('disable_images'):
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    if settings.get('disable_media'):
+        chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+        chrome_options.add_argument('--mute-audio')
+    return chrome_options
+
+def apply_request_blocking(driver, profile=None):
+    """Bloqueia via CDP as URLs do perfil na aba atual (repita ao abrir novas abas)"""
+    patterns = blocked_url_patterns(profile)
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except (AttributeError, WebDriverException):
+        print("⚠️  Bloqueio de URLs indisponível neste navegador")
+
+def start_chrome(headless=False, stealth=False, profile=None):
+    """Inicia uma nova sessão do Chrome com o perfil de inicialização indicado"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    driver = webdriver.Chrome(service=Service(), options=build_chrome_options(headless, stealth, profile))
+    apply_request_blocking(driver, profile)
+    return driver
+
+class ChromeBoot:
+    """Sessão do Chrome iniciada numa thread de fundo (result() aguarda e devolve o driver)"""
+
+    def __init__(self, headless=False, stealth=False, profile=None):
+        self.started = time.perf_counter()
+        self.seconds = None
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chrome-boot')
+        self._future = executor.submit(self._boot, headless, stealth, profile)
+        executor.shutdown(wait=False)
+
+    def _boot(self, headless, stealth, profile):
+        driver = start_chrome(headless, stealth, profile)
+        self.seconds = time.perf_counter() - self.started
+        return driver
+
+    def done(self):
+        return self._future.done()
+
+    def result(self, timeout=None):
+        """Aguarda o Chrome ficar pronto; relança o erro se a inicialização falhou"""
+        return self._future.result(timeout)
+
+class PoolExhaustedError(RuntimeError):
+    """Nenhuma sessão do pool ficou livre dentro do timeout de checkout"""
+
+class DriverPool:
+    """Pool de sessões Chrome com aquecimento, health check e reset entre usos"""
+
+    def __init__(self, size=2, headless=False, stealth=False, warm_up=True, checkout_timeout=60, profile=None):
+        if size < 1:
+            raise ValueError("O pool precisa de pelo menos uma sessão")
+
+        self.size = size
+        self.headless = headless
+        self.stealth = stealth
+        self.profile = profile
+        self.checkout_timeout = checkout_timeout
+        self.stats = {'criadas': 0, 'reutilizadas': 0, 'substituidas': 0}
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._checked_out = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if warm_up:
+            self.warm_up()
+
+    def _reserve_slot(self):
+        """Reserva a vaga de uma nova sessão (False com o pool cheio); verificação e reserva sob o mesmo lock"""
+        with self._lock:
+            if self._created >= self.size:
+                return False
+            self._created += 1
+            self.stats['criadas'] += 1
+            return True
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _lend(self, driver):
+        with self._lock:
+            self._checked_out.add(driver)
+        return driver
+
+    def _new_driver(self):
+        """Inicia a sessão de uma vaga já reservada; libera a vaga se a inicialização falhar"""
+        try:
+            return start_chrome(self.headless, self.stealth, self.profile)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def warm_up(self):
+        """Inicia em paralelo as sessões que faltam para completar o pool"""
+        missing = 0
+        while self._reserve_slot():
+            missing += 1
+        if not missing:
+            return
+
+        print(f"🔥 Aquecendo pool com {missing} sessão(ões)...")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._new_driver) for _ in range(missing)]
+        drivers, errors = [], []
+        for future in futures:
+            try:
+                drivers.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            # Nenhum Chrome órfão: encerra as sessões que chegaram a subir antes de relançar
+            for driver in drivers:
+                self._discard(driver)
+            raise errors[0]
+        for driver in drivers:
+            self._idle.put(driver)
+        print(f"✅ Pool pronto com {self.size} sessão(ões)")
+
+    def available(self):
+        """Sessões que um checkout obteria agora sem esperar (ociosas + vagas ainda não criadas)"""
+        with self._lock:
+            return self._idle.qsize() + self.size - self._created
+
+    @staticmethod
+    def is_healthy(driver):
+        """Verifica se a sessão ainda responde a comandos"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def reset(driver):
+        """Limpa cookies, storage e abas extras e volta para about:blank"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            # Storage de todas as origens visitadas (localStorage, IndexedDB, service workers...) e cookies
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': 'all'})
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except (AttributeError, WebDriverException):
+            # Sem CDP só dá para limpar o storage da origem atual
+            try:
+                driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            except WebDriverException:
+                pass
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def _discard(self, driver):
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def checkout(self, timeout=None):
+        """Empresta uma sessão saudável do pool (cria uma nova se houver vaga)
+
+        Levanta PoolExhaustedError se nenhuma sessão for devolvida em timeout segundos
+        (padrão: checkout_timeout).
+        """
+        if self._closed:
+            raise RuntimeError("Pool de sessões já foi fechado")
+
+        timeout = timeout or self.checkout_timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    return self._lend(self._new_driver())
+                try:
+                    driver = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise PoolExhaustedError(
+                        f"Pool esgotado: as {self.size} sessão(ões) continuam emprestadas após {timeout}s"
+                    ) from None
+
+            if self.is_healthy(driver):
+                self._count('reutilizadas')
+                return self._lend(driver)
+
+            print("⚠️  Sessão sem resposta descartada do pool")
+            self._count('substituidas')
+            self._discard(driver)
+
+    def checkin(self, driver):
+        """Devolve a sessão ao pool já limpa para o próximo uso
+
+        Só aceita sessões emprestadas por este pool e ainda não devolvidas (ValueError).
+        """
+        with self._lock:
+            if driver not in self._checked_out:
+                raise ValueError("Sessão não foi emprestada por este pool ou já foi devolvida")
+            self._checked_out.remove(driver)
+
+        if self._closed:
+            self._discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._count('substituidas')
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def session(self):
+        """Empresta uma sessão durante um bloco with"""
+        driver = self.checkout()
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def close(self):
+        """Encerra todas as sessões ociosas do pool"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+        print(f"🔒 Pool de sessões encerrado ({self.stats})")
@@ -0,0 +1,95 @@
+"""
+RETRATO DE ELEMENTOS
+====================
+
+Carrega de uma vez (um único execute_script) tudo o que as estratégias leem de um
+WebElement: tag, texto visível, todos os atributos, retângulo e visibilidade. As
+leituras seguintes vêm da memória, sem novas viagens ao WebDriver.
+
+ElementSnapshot imita a parte de leitura da API do WebElement (tag_name, text,
+get_attribute, location, size, rect, is_displayed); ações (click, send_keys, clear)
+continuam no elemento vivo, disponível em snapshot.element.
+
+Uso:
+    snapshot = ElementSnapshot.capture(driver, driver.find_element(By.ID, "twotabsearchtextbox"))
+    print(snapshot.tag_name, snapshot.get_attribute('placeholder'))
+"""
+
+# Funções JS com a semântica de WebElement.text, get_attribute e is_displayed
+# (compartilhadas com os scripts de avaliação em lote das atividades)
+ELEMENT_HELPERS_JS = """
+const ALIASES = {'class': 'className', 'readonly': 'readOnly'};
+const displayed = (el) => el.checkVisibility
+    ? el.checkVisibility({opacityProperty: true, visibilityProperty: true})
+    : el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const visibleText = (el) => displayed(el) ? (el.innerText || '').trim() : '';
+const attribute = (el, name) => {
+    const lower = name.toLowerCase();
+    if ((lower === 'src' && el.tagName === 'IMG') || (lower === 'href' && el.tagName === 'A')) {
+        const raw = el.getAttribute(lower);
+        return raw ? String(el[lower]) : raw;
+    }
+    let prop;
+    try { prop = el[ALIASES[lower] || name]; } catch (e) {}
+    const value = (prop === undefined || prop === null || typeof prop === 'object' || typeof prop === 'function')
+        ? el.getAttribute(name) : prop;
+    return value === undefined || value === null ? null : String(value);
+};
+"""
+
+# Propriedades lidas mesmo sem o atributo no HTML (ex.: type de um input sem type)
+COMMON_ATTRIBUTES = ['id', 'name', 'class', 'type', 'value', 'placeholder', 'href', 'src', 'alt', 'title']
+
+ELEMENT_SNAPSHOT_SCRIPT = ELEMENT_HELPERS_JS + """
+const [el, extraNames] = arguments;
+const attributes = {};
+const names = Array.from(el.attributes, (attr) => attr.name).concat(extraNames);
+names.forEach((name) => { attributes[name] = attribute(el, name); });
+const rect = el.getBoundingClientRect();
+return {
+    tag_name: el.tagName.toLowerCase(),
+    text: visibleText(el),
+    attributes: attributes,
+    displayed: displayed(el),
+    rect: {x: rect.left + window.scrollX, y: rect.top + window.scrollY, width: rect.width, height: rect.height}
+};
+"""
+
+class ElementSnapshot:
+    """Leitura memorizada de um WebElement, carregada em um único comando"""
+
+    def __init__(self, element, data):
+        self.element = element
+        self.tag_name = data['tag_name']
+        self.text = data['text']
+        self.attributes = data['attributes']
+        self.displayed = data['displayed']
+        rect = data['rect']
+        self.rect = {'x': round(rect['x']), 'y': round(rect['y']),
+                     'height': int(rect['height']), 'width': int(rect['width'])}
+
+    @classmethod
+    def capture(cls, driver, element, extra_attributes=()):
+        """Retrato do elemento com todos os atributos do HTML, os comuns e os extras pedidos"""
+        names = COMMON_ATTRIBUTES + [name for name in extra_attributes if name not in COMMON_ATTRIBUTES]
+        return cls(element, driver.execute_script(ELEMENT_SNAPSHOT_SCRIPT, element, names))
+
+    def get_attribute(self, name):
+        """Valor como WebElement.get_attribute; nomes não carregados são buscados uma vez e guardados"""
+        if name not in self.attributes:
+            self.attributes[name] = self.element.get_attribute(name)
+        return self.attributes[name]
+
+    def data_attributes(self):
+        return {name: value for name, value in self.attributes.items() if name.startswith('data-')}
+
+    @property
+    def location(self):
+        return {'x': self.rect['x'], 'y': self.rect['y']}
+
+    @property
+    def size(self):
+        return {'height': self.rect['height'], 'width': self.rect['width']}
+
+    def is_displayed(self):
+        return self.displayed
@@ -0,0 +1,39 @@
+"""
+TRAVA DE ARQUIVO ENTRE PROCESSOS
+================================
+
+Serializa o ciclo ler-mesclar-gravar de arquivos JSON compartilhados (estatísticas da
+escada de localizadores, cache de localizadores) entre processos, como os workers do
+mapeamento em lote. A trava é um arquivo '<path>.lock' ao lado do arquivo protegido
+(fcntl no POSIX, msvcrt no Windows).
+
+Uso:
+    with file_lock('locator_stats.json'):
+        ...  # relê, mescla e grava o arquivo
+"""
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+@contextmanager
+def file_lock(path):
+    """Trava exclusiva (bloqueante) associada a path durante o bloco"""
+    with open(f"{path}.lock", 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,180 @@
+"""
+SERVIDOR LOCAL DE PÁGINAS DE TESTE
+==================================
+
+Serve cópias locais das páginas usadas pelas atividades, com tamanho configurável,
+para medir os scrapers sem depender do herokuapp nem da Amazon:
+
+- /challenging_dom?rows=N           - clone da tabela do Challenging DOM (10 a 100k linhas)
+- /amazon?elements=N&images=M&links=K - página no estilo da Amazon com os elementos
+                                      procurados pelas 13 estratégias
+- /static/*.jpg, /static/*.woff2     - imagens e fonte da página (bytes de preenchimento)
+- /beacon                            - beacon de analytics disparado pela página
+
+Imagens, fonte e beacon existem para medir o perfil de inicialização 'lean', que os bloqueia.
+
+Uso:
+    python fixture_server.py --port 8000
+
+    with FixtureServer() as server:
+        url = server.url('/challenging_dom', rows=1000)
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, urlencode
+from functools import lru_cache
+import argparse
+import threading
+import time
+
+TABLE_HEADERS = ['Lorem', 'Ipsum', 'Dolor', 'Sit', 'Amet', 'Diceret', 'Action']
+TABLE_VALUES = ['Iuvaret', 'Apeirian', 'Adipisci', 'Definiebas', 'Consequuntur', 'Phaedrum']
+
+# Tamanho e latência dos recursos estáticos (próximos de miniaturas e fontes reais)
+STATIC_ASSETS = {
+    '.jpg': ('image/jpeg', 24 * 1024),
+    '.woff2': ('font/woff2', 48 * 1024)
+}
+STATIC_DELAY = 0.02
+
+@lru_cache(maxsize=16)
+def challenging_dom_page(rows=10):
+    """Gera o HTML do clone do Challenging DOM com a quantidade de linhas pedida"""
+    parts = [
+        '<!DOCTYPE html><html><head><title>The Internet</title></head><body>',
+        '<div class="example"><h3>Challenging DOM</h3><div class="large-10 columns"><table>',
+        '<thead><tr>', ''.join(f'<th>{header}</th>' for header in TABLE_HEADERS), '</tr></thead><tbody>'
+    ]
+    for i in range(rows):
+        cells = ''.join(f'<td>{value}{i}</td>' for value in TABLE_VALUES)
+        parts.append(f'<tr>{cells}<td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>')
+    parts.append('</tbody></table></div></div></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+@lru_cache(maxsize=16)
+def amazon_like_page(elements=200, images=50, links=20):
+    """Gera uma página no estilo da Amazon com elementos, imagens e links configuráveis"""
+    nav_links = ''.join(
+        f'<a href="/amazon/categoria/{i}" class="nav-a nav-link" data-nav-role="link">Categoria {i}</a>'
+        for i in range(links))
+    image_tags = ''.join(
+        f'<img src="/static/produto-{i}.jpg" alt="Amazon produto {i}" width="120" height="120">'
+        for i in range(images))
+    blocks = ''.join(
+        f'<div class="card nav-card" style="display:block" tabindex="0" role="listitem">'
+        f'<h2>Oferta Prime {i}</h2><span>R$ {i},99 - desconto de {i % 50}%</span></div>'
+        for i in range(elements))
+    html = f'''<!DOCTYPE html><html lang="pt-br"><head><title>Amazon.com.br</title>
+<style>@font-face {{ font-family: 'Amazon Ember'; src: url(/static/amazon-ember.woff2) format('woff2'); }}
+body {{ font-family: 'Amazon Ember', Arial, sans-serif; }}</style></head><body>
+<header role="banner" id="navbar">
+  <div id="nav-main" class="nav-main">
+    <span class="nav-line-1">Olá, faça seu login</span>
+    <form role="search" aria-label="Pesquisar">
+      <input type="text" id="twotabsearchtextbox" name="field-keywords" placeholder="Pesquisa Amazon.com.br">
+      <input type="submit" id="nav-search-submit-button" class="nav-input" value="Ir">
+    </form>
+    <nav aria-label="Categorias">{nav_links}</nav>
+  </div>
+</header>
+<main><h1>Livros, Casa e Prime</h1><ul><li>Conta</li><li>Entrar</li></ul>{image_tags}{blocks}</main>
+<footer role="contentinfo"><p>Amazon.com.br</p><a href="/amazon/ajuda">Ajuda</a></footer>
+<script>new Image().src = '/beacon?pagina=home&t=' + Date.now();</script>
+</body></html>'''
+    return html.encode('utf-8')
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Responde às páginas de teste com keep-alive"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = {key: int(values[0]) for key, values in parse_qs(parts.query).items() if values[0].isdigit()}
+
+        if parts.path == '/challenging_dom':
+            body = challenging_dom_page(params.get('rows', 10))
+        elif parts.path == '/amazon':
+            body = amazon_like_page(params.get('elements', 200), params.get('images', 50), params.get('links', 20))
+        elif parts.path.startswith('/static/'):
+            self.send_static(parts.path)
+            return
+        elif parts.path == '/beacon':
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        else:
+            self.send_error(404, "Página de teste inexistente")
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_static(self, path):
+        """Recurso estático com latência simulada; o conteúdo é só preenchimento"""
+        extension = path[path.rfind('.'):]
+        if extension not in STATIC_ASSETS:
+            self.send_error(404, "Recurso estático inexistente")
+            return
+        content_type, size = STATIC_ASSETS[extension]
+        time.sleep(STATIC_DELAY)
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(size))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(bytes(size))
+
+    def log_message(self, format, *args):
+        pass
+
+class FixtureServer:
+    """Servidor de fixtures em uma thread de fundo (use com with)"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path, **params):
+        """Monta a URL de uma página de teste com os parâmetros de tamanho"""
+        host, port = self.httpd.server_address[:2]
+        query = f"?{urlencode(params)}" if params else ''
+        return f"http://{host}:{port}{path}{query}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main():
+    """Sobe o servidor de fixtures em primeiro plano"""
+    parser = argparse.ArgumentParser(description="Servidor local de páginas de teste")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = FixtureServer(args.host, args.port)
+    print(f"🧪 Fixtures em {server.url('/challenging_dom', rows=10)} e {server.url('/amazon')}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor encerrado")
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
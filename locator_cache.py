@@ -0,0 +1,158 @@
+"""
+CACHE DE RESULTADOS DE LOCALIZADORES
+====================================
+
+Guarda o resultado de cada localizador (ou estratégia) por (URL, impressão digital
+estrutural do DOM, localizador). Enquanto a página tiver a mesma estrutura, um novo
+mapeamento reaproveita os resultados em vez de reavaliar os seletores no navegador.
+
+- A impressão digital é um hash de tag, id, classes e número de filhos de todos os
+  elementos, calculado em uma única chamada (DOM_FINGERPRINT_SCRIPT)
+- Cada estrutura de DOM da URL tem entradas próprias: sessões com páginas levemente
+  diferentes (anúncios, personalização) não expulsam as entradas umas das outras;
+  estruturas que deixam de aparecer saem por TTL ou LRU
+- TTL e limite de entradas (LRU); opcionalmente persistido em disco (JSON)
+- save() mescla com o que outros processos gravaram (sob trava de arquivo) em vez de sobrescrever
+
+Uso:
+    cache = LocatorCache(max_entries=512, ttl=600, path='locator_cache.json')
+    fingerprint = dom_fingerprint(driver)
+    result = cache.get(url, fingerprint, 'strategy_7_by_data_attributes')
+"""
+
+from collections import OrderedDict
+from file_lock import file_lock
+import threading
+import json
+import time
+import os
+
+# Hash FNV-1a da estrutura do DOM (ignora textos e valores de campos)
+DOM_FINGERPRINT_SCRIPT = """
+const all = document.getElementsByTagName('*');
+let hash = 0x811c9dc5;
+const mix = (value) => {
+    for (let i = 0; i < value.length; i++) {
+        hash ^= value.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+};
+for (const el of all) {
+    mix(el.tagName);
+    mix(el.id);
+    mix(typeof el.className === 'string' ? el.className : '');
+    mix(String(el.childElementCount));
+}
+return all.length + ':' + hash.toString(16);
+"""
+
+MISSING = object()
+
+def dom_fingerprint(driver):
+    """Impressão digital estrutural da página atual (um comando WebDriver)"""
+    return driver.execute_script(DOM_FINGERPRINT_SCRIPT)
+
+class LocatorCache:
+    """Cache LRU com TTL de resultados de localizadores por URL e estrutura do DOM"""
+
+    def __init__(self, max_entries=1024, ttl=300, path=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.stats = {'acertos': 0, 'falhas': 0, 'expiradas': 0, 'removidas_lru': 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def _key(url, fingerprint, locator):
+        return json.dumps([url, fingerprint, locator], ensure_ascii=False)
+
+    def get(self, url, fingerprint, locator, default=MISSING):
+        """Resultado guardado para o localizador, ou default se ausente/expirado"""
+        key = self._key(url, fingerprint, locator)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['falhas'] += 1
+                return default
+            if self.ttl is not None and time.time() - entry['salvo_em'] > self.ttl:
+                del self._entries[key]
+                self.stats['expiradas'] += 1
+                self.stats['falhas'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats['acertos'] += 1
+            return entry['valor']
+
+    def put(self, url, fingerprint, locator, value):
+        """Guarda o resultado (precisa ser serializável em JSON para o cache em disco)"""
+        key = self._key(url, fingerprint, locator)
+        with self._lock:
+            self._entries[key] = {'url': url, 'salvo_em': time.time(), 'valor': value}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['removidas_lru'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _read(self):
+        """Conteúdo do arquivo do cache, ou None se ilegível"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self):
+        """Carrega as entradas ainda válidas do arquivo do cache"""
+        stored = self._read()
+        if stored is None:
+            print(f"⚠️  Cache de localizadores ilegível, começando vazio: {self.path}")
+            return
+
+        now = time.time()
+        with self._lock:
+            for key, entry in stored.get('entradas', []):
+                if self.ttl is None or now - entry['salvo_em'] <= self.ttl:
+                    self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self):
+        """Mescla o cache com o arquivo e grava em disco (no-op para cache só em memória)
+
+        Entradas gravadas por outros processos desde o load são mantidas; na mesma chave
+        vale a mais recente. Descarta as expiradas.
+        """
+        if not self.path:
+            return
+        with file_lock(self.path):
+            stored = (self._read() or {}) if os.path.exists(self.path) else {}
+            now = time.time()
+            with self._lock:
+                merged = OrderedDict(stored.get('entradas', []))
+                for key, entry in self._entries.items():
+                    if key not in merged or merged[key]['salvo_em'] <= entry['salvo_em']:
+                        merged.pop(key, None)
+                        merged[key] = entry
+                if self.ttl is not None:
+                    for key, entry in list(merged.items()):
+                        if now - entry['salvo_em'] > self.ttl:
+                            del merged[key]
+                while len(merged) > self.max_entries:
+                    merged.popitem(last=False)
+
+                self._entries = merged
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'entradas': list(merged.items())}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
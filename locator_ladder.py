@@ -0,0 +1,147 @@
+"""
+ESCADA ADAPTATIVA DE LOCALIZADORES
+==================================
+
+Tenta uma lista de localizadores candidatos para o mesmo elemento, começando pelos
+que historicamente encontram o elemento mais rápido. Cada tentativa registra sucesso e
+latência por candidato; as estatísticas são persistidas em JSON entre execuções.
+
+A ordem usa a taxa de sucesso estimada (com suavização de Laplace) dividida pela
+latência média: localizadores mortos vão para o fim sem nunca serem descartados.
+
+save() soma as tentativas registradas desde o load às que estão no arquivo, sob uma
+trava de arquivo: processos paralelos (mapeamento em lote) não perdem as contagens uns
+dos outros.
+
+Uso:
+    ladder = LocatorLadder(path='locator_stats.json')
+    element, (by, value), attempts = ladder.find(driver, 'botao_busca', [
+        (By.CSS_SELECTOR, "input[type='submit'][value='Ir']"),
+        (By.ID, "nav-search-submit-button"),
+    ])
+    ladder.save()
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+from file_lock import file_lock
+import threading
+import json
+import time
+import os
+
+class LocatorLadder:
+    """Escada de localizadores ordenada por sucesso e latência observados"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.stats = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def _key(candidate):
+        by, value = candidate
+        return f"{by}={value}"
+
+    @staticmethod
+    def _accumulate(stats, name, key, attempts, successes, seconds):
+        entry = stats.setdefault(name, {}).setdefault(key, {'tentativas': 0, 'sucessos': 0, 'segundos_total': 0.0})
+        entry['tentativas'] += attempts
+        entry['sucessos'] += successes
+        entry['segundos_total'] = round(entry['segundos_total'] + seconds, 6)
+
+    def _observed(self, name, candidate):
+        """(taxa de sucesso suavizada, latência média) do candidato, ou None sem histórico"""
+        entry = self.stats.get(name, {}).get(self._key(candidate))
+        if not entry or not entry['tentativas']:
+            return None
+        return (entry['sucessos'] + 1) / (entry['tentativas'] + 2), entry['segundos_total'] / entry['tentativas']
+
+    def order(self, name, candidates):
+        """Candidatos ordenados por sucessos esperados por segundo gasto (maior primeiro)
+
+        Candidatos sem histórico recebem taxa 50% e a latência média dos demais, entrando
+        depois dos que costumam funcionar e antes dos que costumam falhar. Empates mantêm
+        a ordem declarada.
+        """
+        with self._lock:
+            observed = [self._observed(name, candidate) for candidate in candidates]
+        latencies = [latency for _, latency in filter(None, observed)]
+        typical_latency = sum(latencies) / len(latencies) if latencies else 1.0
+        scores = []
+        for entry in observed:
+            rate, latency = entry or (0.5, typical_latency)
+            scores.append(rate / max(latency, 0.001))
+        ranked = sorted(range(len(candidates)), key=lambda i: (-scores[i], i))
+        return [candidates[i] for i in ranked]
+
+    def record(self, name, candidate, ok, seconds):
+        key = self._key(candidate)
+        with self._lock:
+            # stats orienta a ordem; _pending guarda só o que ainda não foi somado ao arquivo
+            for stats in (self.stats, self._pending):
+                self._accumulate(stats, name, key, 1, 1 if ok else 0, seconds)
+
+    def find(self, driver, name, candidates):
+        """Retorna (elemento, candidato, tentativas) do primeiro localizador que encontrar o elemento
+
+        Usa find_elements (lista vazia em vez de exceção) para cada tentativa e lança
+        NoSuchElementException se nenhum candidato encontrar.
+        """
+        for attempts, candidate in enumerate(self.order(name, candidates), 1):
+            started = time.perf_counter()
+            elements = driver.find_elements(*candidate)
+            self.record(name, candidate, bool(elements), time.perf_counter() - started)
+            if elements:
+                return elements[0], candidate, attempts
+        raise NoSuchElementException(f"Nenhum localizador de '{name}' encontrou o elemento")
+
+    def summary(self, name):
+        """Taxa de sucesso e latência média por candidato de uma escada"""
+        with self._lock:
+            entries = dict(self.stats.get(name, {}))
+        return {
+            key: {
+                'tentativas': entry['tentativas'],
+                'taxa_sucesso': round(entry['sucessos'] / entry['tentativas'], 3) if entry['tentativas'] else None,
+                'latencia_media': round(entry['segundos_total'] / entry['tentativas'], 4) if entry['tentativas'] else None
+            }
+            for key, entry in entries.items()
+        }
+
+    def _read(self):
+        """Estatísticas gravadas no arquivo, ou None se ilegível"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self):
+        stats = self._read()
+        if stats is None:
+            print(f"⚠️  Estatísticas de localizadores ilegíveis, começando do zero: {self.path}")
+            return
+        with self._lock:
+            self.stats = stats
+
+    def save(self):
+        """Soma as tentativas desta instância às do arquivo e grava (no-op sem path)"""
+        if not self.path:
+            return
+        with file_lock(self.path):
+            stored = (self._read() or {}) if os.path.exists(self.path) else {}
+            with self._lock:
+                for name, candidates in self._pending.items():
+                    for key, entry in candidates.items():
+                        self._accumulate(stored, name, key, entry['tentativas'], entry['sucessos'],
+                                         entry['segundos_total'])
+                self._pending = {}
+                self.stats = stored
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(stored, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
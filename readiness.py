@@ -0,0 +1,170 @@
+"""
+ESPERAS POR PRONTIDÃO DA PÁGINA
+===============================
+
+Substitui pausas fixas (time.sleep) por sinais reais do navegador:
+
+1. document.readyState - documento carregado
+2. Rede ociosa - nenhum recurso novo baixado por um intervalo
+3. DOM estável - nenhuma mutação observada por um intervalo
+4. Mudança de URL/hash - navegação disparada por um clique
+
+Cada espera tem limite superior configurável e registra quanto tempo levou.
+"""
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import time
+
+# Resolve quando nenhum recurso novo termina de baixar por idle_ms. Usa PerformanceObserver:
+# contar getEntriesByType('resource') congela no limite do buffer (250 entradas por padrão)
+NETWORK_IDLE_SCRIPT = """
+const [idleMs, timeoutMs, done] = arguments;
+const deadline = Date.now() + timeoutMs;
+let lastChange = Date.now();
+const observer = new PerformanceObserver(() => { lastChange = Date.now(); });
+observer.observe({type: 'resource', buffered: true});
+const finish = (ok) => { observer.disconnect(); done(ok); };
+(function check() {
+    if (Date.now() - lastChange >= idleMs) { return finish(true); }
+    if (Date.now() >= deadline) { return finish(false); }
+    setTimeout(check, 50);
+})();
+"""
+
+# Resolve quando o MutationObserver fica quieto por quietMs
+DOM_QUIET_SCRIPT = """
+const [quietMs, timeoutMs, done] = arguments;
+const deadline = Date.now() + timeoutMs;
+let timer = null;
+const observer = new MutationObserver(() => arm());
+const finish = (ok) => { observer.disconnect(); clearTimeout(timer); clearTimeout(limit); done(ok); };
+const arm = () => { clearTimeout(timer); timer = setTimeout(() => finish(true), quietMs); };
+const limit = setTimeout(() => finish(false), Math.max(0, deadline - Date.now()));
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+arm();
+"""
+
+# Resolve com 'url' se a URL/hash mudar, 'dom' se o DOM estabilizar ou 'timeout'
+AFTER_CLICK_SCRIPT = """
+const [oldUrl, quietMs, timeoutMs, done] = arguments;
+let timer = null;
+let poll = null;
+const observer = new MutationObserver(() => arm());
+const finish = (reason) => {
+    observer.disconnect(); clearTimeout(timer); clearTimeout(limit); clearInterval(poll); done(reason);
+};
+const arm = () => { clearTimeout(timer); timer = setTimeout(() => finish('dom'), quietMs); };
+const checkUrl = () => { if (location.href !== oldUrl) { finish('url'); return true; } return false; };
+const limit = setTimeout(() => finish('timeout'), timeoutMs);
+if (!checkUrl()) {
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+    poll = setInterval(checkUrl, 25);
+    arm();
+}
+"""
+
+class Readiness:
+    """Esperas orientadas a eventos com limite superior e relatório de duração"""
+
+    def __init__(self, driver, timeout=10, network_idle_ms=500, dom_quiet_ms=300, report=None, ready_state='complete'):
+        self.driver = driver
+        self.timeout = timeout
+        self.ready_state = ready_state
+        self.network_idle_ms = network_idle_ms
+        self.dom_quiet_ms = dom_quiet_ms
+        self.report = report if report is not None else []
+        self._script_timeout = None
+
+    def script_timeout(self, seconds):
+        """Garante timeout de execute_async_script de pelo menos seconds
+
+        O valor atual fica guardado aqui: só envia comando quando precisa aumentar, então
+        as esperas seguintes não pagam idas e voltas extras. Os scripts assíncronos têm o
+        próprio limite, o timeout do WebDriver é só o teto de segurança.
+        """
+        if self._script_timeout is None or seconds > self._script_timeout:
+            self.driver.set_script_timeout(seconds)
+            self._script_timeout = seconds
+
+    def _record(self, signal, started, ok):
+        elapsed = time.perf_counter() - started
+        self.report.append({'sinal': signal, 'segundos': round(elapsed, 3), 'ok': ok})
+        status = "✅" if ok else "⚠️ "
+        print(f"   ⏳ {status} Espera '{signal}': {elapsed:.2f}s")
+        return ok
+
+    def _until(self, condition, timeout, poll_frequency):
+        # support.ui carrega selenium.webdriver.remote; importado só na primeira espera
+        from selenium.webdriver.support.ui import WebDriverWait
+        return WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=poll_frequency).until(condition)
+
+    def _run_async(self, script, *args):
+        timeout = args[-1] / 1000
+        try:
+            self.script_timeout(timeout + 5)
+            return bool(self.driver.execute_async_script(script, *args))
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def document_ready(self, timeout=None):
+        """Aguarda document.readyState == ready_state ('interactive' também aceita 'complete')"""
+        accepted = ('interactive', 'complete') if self.ready_state == 'interactive' else ('complete',)
+        started = time.perf_counter()
+        try:
+            self._until(lambda d: d.execute_script("return document.readyState") in accepted, timeout, 0.1)
+            ok = True
+        except TimeoutException:
+            ok = False
+        return self._record('document.readyState', started, ok)
+
+    def network_idle(self, timeout=None):
+        """Aguarda a rede ficar ociosa (sem novos recursos por network_idle_ms)"""
+        started = time.perf_counter()
+        ok = self._run_async(NETWORK_IDLE_SCRIPT, self.network_idle_ms, (timeout or self.timeout) * 1000)
+        return self._record('rede ociosa', started, ok)
+
+    def dom_quiet(self, timeout=None):
+        """Aguarda o DOM ficar sem mutações por dom_quiet_ms"""
+        started = time.perf_counter()
+        ok = self._run_async(DOM_QUIET_SCRIPT, self.dom_quiet_ms, (timeout or self.timeout) * 1000)
+        return self._record('DOM estável', started, ok)
+
+    def url_change(self, old_url, timeout=None):
+        """Aguarda a URL (incluindo o hash) mudar após uma ação"""
+        started = time.perf_counter()
+        try:
+            self._until(lambda d: d.current_url != old_url, timeout, 0.05)
+            ok = True
+        except TimeoutException:
+            ok = False
+        return self._record('mudança de URL', started, ok)
+
+    def page_loaded(self, timeout=None):
+        """Documento completo seguido de rede ociosa"""
+        return self.document_ready(timeout) and self.network_idle(timeout)
+
+    def after_click(self, old_url, timeout=None):
+        """Após um clique: termina na mudança de URL/hash ou quando o DOM estabiliza"""
+        started = time.perf_counter()
+        timeout_ms = (timeout or self.timeout) * 1000
+        try:
+            self.script_timeout(timeout_ms / 1000 + 5)
+            reason = self.driver.execute_async_script(AFTER_CLICK_SCRIPT, old_url, self.dom_quiet_ms, timeout_ms)
+        except WebDriverException:
+            # O documento foi descarregado durante a espera: houve navegação completa
+            self._record('mudança de URL', started, True)
+            return self.document_ready(timeout)
+
+        if reason == 'url':
+            return self._record('mudança de URL', started, True)
+        return self._record('DOM estável', started, reason == 'dom')
+
+    def summary(self):
+        """Resume as esperas registradas por tipo de sinal"""
+        summary = {}
+        for wait in self.report:
+            entry = summary.setdefault(wait['sinal'], {'esperas': 0, 'segundos_total': 0.0, 'falhas': 0})
+            entry['esperas'] += 1
+            entry['segundos_total'] = round(entry['segundos_total'] + wait['segundos'], 3)
+            entry['falhas'] += 0 if wait['ok'] else 1
+        return summary
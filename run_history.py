@@ -0,0 +1,287 @@
+"""
+HISTÓRICO DE EXECUÇÕES (SQLITE)
+===============================
+
+Guarda cada execução (metadata) e cada resultado em um banco SQLite indexado, em vez
+de um arquivo JSON solto por execução. Assim dá para responder, sem abrir arquivo
+por arquivo, perguntas como "quando o localizador twotabsearchtextbox falhou pela
+última vez" ou "qual a taxa de sucesso de cada seletor por semana".
+
+- execucoes: uma linha por execução (mapeamento ou extração de tabela)
+- resultados: uma linha por estratégia de um mapeamento
+- localizadores: uma linha por localizador testado (o da estratégia e os de 'detalhes')
+- linhas: as linhas extraídas de uma tabela
+
+Cada execução é gravada numa única transação (executemany). import_files() traz os
+JSON/CSV antigos para o banco, ignorando arquivos já importados.
+
+Uso:
+    history = RunHistory('run_history.db')
+    history.record_mapping_run(report['metadata'], report['resultados'])
+    history.last_failure('twotabsearchtextbox')
+    history.locator_success_rate('twotabsearchtextbox', period='semana')
+
+    python run_history.py import ecommerce_mapping_results_*.json challenge_dom_data_*.csv
+    python run_history.py taxa --localizador twotabsearchtextbox --periodo mes
+    python run_history.py ultima-falha twotabsearchtextbox
+"""
+
+from columnar_store import read_csv_rows
+from datetime import datetime
+import threading
+import argparse
+import sqlite3
+import json
+import os
+import re
+
+RUN_HISTORY_FILE = "run_history.db"
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    site TEXT,
+    url TEXT,
+    data_execucao TEXT NOT NULL,
+    arquivo_origem TEXT UNIQUE,
+    metadata_json TEXT
+);
+CREATE TABLE IF NOT EXISTS resultados (
+    id INTEGER PRIMARY KEY,
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id) ON DELETE CASCADE,
+    metodo TEXT,
+    estrategia TEXT,
+    elemento TEXT,
+    encontrado INTEGER NOT NULL,
+    dados_json TEXT
+);
+CREATE TABLE IF NOT EXISTS localizadores (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id) ON DELETE CASCADE,
+    resultado_id INTEGER NOT NULL REFERENCES resultados(id) ON DELETE CASCADE,
+    localizador TEXT NOT NULL,
+    encontrado INTEGER NOT NULL,
+    quantidade INTEGER,
+    data_execucao TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS linhas (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id) ON DELETE CASCADE,
+    linha INTEGER,
+    dados_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_execucoes_data ON execucoes(tipo, data_execucao);
+CREATE INDEX IF NOT EXISTS idx_resultados_execucao ON resultados(execucao_id);
+CREATE INDEX IF NOT EXISTS idx_resultados_metodo ON resultados(metodo, estrategia);
+CREATE INDEX IF NOT EXISTS idx_localizadores_data ON localizadores(localizador, data_execucao);
+CREATE INDEX IF NOT EXISTS idx_linhas_execucao ON linhas(execucao_id, linha);
+"""
+
+# Agrupamentos de data_execucao (texto 'AAAA-MM-DD HH:MM:SS') aceitos pelas consultas
+PERIODS = {
+    'dia': "substr(data_execucao, 1, 10)",
+    'semana': "strftime('%Y-S%W', data_execucao)",
+    'mes': "substr(data_execucao, 1, 7)",
+    'total': "'total'"
+}
+
+def _locator_attempts(result):
+    """(localizador, encontrado, quantidade) do resultado e de cada item de 'detalhes'"""
+    count_keys = ('quantidade_encontrada', 'quantidade_total', 'quantidade')
+    if result.get('localizador'):
+        count = next((result[key] for key in count_keys if isinstance(result.get(key), int)), None)
+        yield result['localizador'], bool(result.get('encontrado')), count
+    for item in result.get('detalhes', []):
+        locator = item.get('seletor') or item.get('xpath') or item.get('localizador')
+        if locator:
+            yield locator, bool(item.get('encontrado')), item.get('quantidade')
+
+def _succeeded(result):
+    """Mesmo critério de EcommerceMappingDemo.is_successful (encontrado, encontrados ou algum detalhe)"""
+    return bool(result.get('encontrado', False) or
+                result.get('encontrados', 0) > 0 or
+                any(item.get('encontrado', False) for item in result.get('detalhes', [])))
+
+class RunHistory:
+    """Banco SQLite com o histórico de mapeamentos e extrações"""
+
+    def __init__(self, path=RUN_HISTORY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def _insert_run(self, kind, metadata, run_date, source):
+        cursor = self.connection.execute(
+            "INSERT INTO execucoes (tipo, site, url, data_execucao, arquivo_origem, metadata_json) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, metadata.get('site_testado'), metadata.get('url'), run_date, source,
+             json.dumps(metadata, ensure_ascii=False, default=str)))
+        return cursor.lastrowid
+
+    def record_mapping_run(self, metadata, results, source=None):
+        """Grava um relatório de mapeamento (metadata + resultados) numa única transação"""
+        metadata = metadata or {}
+        run_date = metadata.get('data_execucao') or datetime.now().strftime(TIMESTAMP_FORMAT)
+        with self._lock, self.connection:
+            run_id = self._insert_run('mapeamento', metadata, run_date, source)
+            locators = []
+            for result in results:
+                cursor = self.connection.execute(
+                    "INSERT INTO resultados (execucao_id, metodo, estrategia, elemento, encontrado, dados_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, result.get('metodo'), result.get('estrategia'), result.get('elemento'),
+                     int(_succeeded(result)), json.dumps(result, ensure_ascii=False, default=str)))
+                locators += [(run_id, cursor.lastrowid, locator, int(found), count, run_date)
+                             for locator, found, count in _locator_attempts(result)]
+            self.connection.executemany(
+                "INSERT INTO localizadores (execucao_id, resultado_id, localizador, encontrado, quantidade, "
+                "data_execucao) VALUES (?, ?, ?, ?, ?, ?)", locators)
+        return run_id
+
+    def record_table_run(self, rows, metadata=None, source=None):
+        """Grava as linhas de uma extração de tabela numa única transação"""
+        rows = [dict(row) for row in rows]
+        metadata = {'total_linhas': len(rows), **(metadata or {})}
+        run_date = metadata.get('data_execucao') or datetime.now().strftime(TIMESTAMP_FORMAT)
+        with self._lock, self.connection:
+            run_id = self._insert_run('tabela', metadata, run_date, source)
+            self.connection.executemany(
+                "INSERT INTO linhas (execucao_id, linha, dados_json) VALUES (?, ?, ?)",
+                ((run_id, row.get('linha'), json.dumps(row, ensure_ascii=False, default=str)) for row in rows))
+        return run_id
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self.connection.execute(sql, params).fetchall()]
+
+    def locator_success_rate(self, locator=None, period='dia', since=None):
+        """Tentativas, sucessos e taxa de sucesso por localizador e período ('dia', 'semana', 'mes', 'total')"""
+        if period not in PERIODS:
+            raise ValueError(f"Período inválido: {period} (opções: {list(PERIODS)})")
+        conditions, params = [], []
+        if locator is not None:
+            conditions.append("localizador = ?")
+            params.append(locator)
+        if since is not None:
+            conditions.append("data_execucao >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(
+            f"SELECT localizador, {PERIODS[period]} AS periodo, COUNT(*) AS tentativas, "
+            f"SUM(encontrado) AS sucessos, ROUND(AVG(encontrado), 3) AS taxa_sucesso "
+            f"FROM localizadores {where} GROUP BY localizador, periodo ORDER BY localizador, periodo", params)
+
+    def last_failure(self, locator):
+        """Execução mais recente em que o localizador não encontrou nada (ou None)"""
+        rows = self._query(
+            "SELECT l.data_execucao, e.site, e.url, r.metodo, r.estrategia, e.arquivo_origem "
+            "FROM localizadores l JOIN resultados r ON r.id = l.resultado_id JOIN execucoes e ON e.id = l.execucao_id "
+            "WHERE l.localizador = ? AND l.encontrado = 0 ORDER BY l.data_execucao DESC LIMIT 1", (locator,))
+        return rows[0] if rows else None
+
+    def strategy_success_rate(self, period='dia', since=None):
+        """Taxa de sucesso por estratégia e período"""
+        if period not in PERIODS:
+            raise ValueError(f"Período inválido: {period} (opções: {list(PERIODS)})")
+        where, params = ("WHERE e.data_execucao >= ?", (since,)) if since else ("", ())
+        return self._query(
+            f"SELECT r.estrategia, {PERIODS[period]} AS periodo, "
+            f"COUNT(*) AS execucoes, SUM(r.encontrado) AS sucessos "
+            f"FROM resultados r JOIN execucoes e ON e.id = r.execucao_id {where} "
+            f"GROUP BY r.estrategia, periodo ORDER BY r.estrategia, periodo", params)
+
+    def runs(self, kind=None, limit=20):
+        """Execuções mais recentes (sem as linhas e resultados)"""
+        where, params = ("WHERE tipo = ?", (kind, limit)) if kind else ("", (limit,))
+        return self._query(
+            f"SELECT id, tipo, site, url, data_execucao, arquivo_origem FROM execucoes {where} "
+            f"ORDER BY data_execucao DESC LIMIT ?", params)
+
+    def is_imported(self, source):
+        return bool(self._query("SELECT 1 FROM execucoes WHERE arquivo_origem = ?", (source,)))
+
+    def import_files(self, filenames):
+        """Importa relatórios JSON e tabelas JSON/CSV antigos; retorna quantos arquivos foram importados"""
+        imported = 0
+        for filename in filenames:
+            source = os.path.abspath(filename)
+            if self.is_imported(source):
+                continue
+            try:
+                if filename.endswith('.csv'):
+                    rows = read_csv_rows(filename)
+                    self.record_table_run(rows, _table_metadata(filename, rows), source)
+                else:
+                    with open(filename, encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict) and 'resultados' in data:
+                        self.record_mapping_run(data.get('metadata'), data['resultados'], source)
+                    elif isinstance(data, list):
+                        self.record_table_run(data, _table_metadata(filename, data), source)
+                    else:
+                        print(f"⚠️  Formato não reconhecido, ignorado: {filename}")
+                        continue
+            except (OSError, ValueError, SyntaxError) as e:
+                print(f"⚠️  Erro ao importar {filename}: {e}")
+                continue
+            imported += 1
+        return imported
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _table_metadata(filename, rows):
+    """Data da extração: timestamp do nome do arquivo, da primeira linha ou do arquivo"""
+    match = re.search(r'_(\d{8}_\d{6})\.', os.path.basename(filename))
+    if match:
+        run_date = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").strftime(TIMESTAMP_FORMAT)
+    elif rows and rows[0].get('timestamp'):
+        run_date = rows[0]['timestamp']
+    else:
+        run_date = datetime.fromtimestamp(os.path.getmtime(filename)).strftime(TIMESTAMP_FORMAT)
+    return {'data_execucao': run_date}
+
+def main():
+    """Importa arquivos antigos ou consulta o histórico"""
+    parser = argparse.ArgumentParser(description="Histórico de execuções em SQLite")
+    parser.add_argument('--db', default=RUN_HISTORY_FILE)
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help="importa relatórios/tabelas JSON e CSV existentes")
+    import_parser.add_argument('files', nargs='+')
+    rate_parser = commands.add_parser('taxa', help="taxa de sucesso por localizador ao longo do tempo")
+    rate_parser.add_argument('--localizador')
+    rate_parser.add_argument('--periodo', default='dia', choices=list(PERIODS))
+    rate_parser.add_argument('--desde', help="data mínima (AAAA-MM-DD)")
+    failure_parser = commands.add_parser('ultima-falha', help="última execução em que o localizador falhou")
+    failure_parser.add_argument('localizador')
+    args = parser.parse_args()
+
+    with RunHistory(args.db) as history:
+        if args.command == 'import':
+            imported = history.import_files(args.files)
+            print(f"📥 {imported} arquivo(s) importado(s) para {args.db}")
+        elif args.command == 'taxa':
+            for row in history.locator_success_rate(args.localizador, args.periodo, args.desde):
+                print(f"{row['periodo']}  {row['localizador']}: {row['sucessos']}/{row['tentativas']} "
+                      f"({row['taxa_sucesso'] * 100:.0f}%)")
+        else:
+            failure = history.last_failure(args.localizador)
+            if failure:
+                print(f"❌ Última falha em {failure['data_execucao']} ({failure['site']}, {failure['estrategia']})")
+            else:
+                print(f"✅ Nenhuma falha registrada para {args.localizador}")
+
+if __name__ == "__main__":
+    main()
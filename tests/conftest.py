@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope='session')
+def squad():
+    """Módulo atividade-squad.py (o nome tem hífen; requer selenium instalado)"""
+    pytest.importorskip('selenium')
+    from benchmark import load_activity
+    return load_activity('atividade-squad.py')
+
+@pytest.fixture(scope='session')
+def solo():
+    """Módulo atividade-solo.py (o nome tem hífen; requer selenium instalado)"""
+    pytest.importorskip('selenium')
+    from benchmark import load_activity
+    return load_activity('atividade-solo.py')
+
+@pytest.fixture(scope='session')
+def fixture_server():
+    """Servidor local com as páginas de teste (fixture_server.py)"""
+    from fixture_server import FixtureServer
+    with FixtureServer() as server:
+        yield server
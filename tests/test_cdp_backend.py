@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('websockets')
+
+import cdp_async
+
+@pytest.fixture(scope='module')
+def chrome_path():
+    try:
+        return cdp_async.find_chrome()
+    except FileNotFoundError as e:
+        pytest.skip(f"Chrome indisponível: {e}")
+
+def run_in_page(url, coroutine):
+    """Abre uma aba em um Chrome novo, navega até url e devolve o resultado de coroutine(page)"""
+    async def main():
+        async with await cdp_async.CDPBrowser.launch(headless=True) as browser:
+            page = await browser.new_page()
+            try:
+                await page.goto(url)
+                return await coroutine(page)
+            finally:
+                await page.close()
+    return asyncio.run(main())
+
+def test_page_evaluates_scripts(chrome_path, fixture_server):
+    async def inspect(page):
+        return (await page.evaluate("document.title"),
+                await page.execute_script("return arguments[0] + arguments[1].length", 2, [1, 2, 3]),
+                await page.evaluate("new Promise(resolve => setTimeout(() => resolve('ok'), 10))"),
+                await page.content())
+
+    title, total, awaited, html = run_in_page(fixture_server.url('/amazon', elements=5), inspect)
+    assert title == 'Amazon.com.br'
+    assert (total, awaited) == (5, 'ok')
+    assert 'twotabsearchtextbox' in html
+
+def test_page_raises_cdp_error_on_script_exception(chrome_path, fixture_server):
+    async def fail(page):
+        with pytest.raises(cdp_async.CDPError):
+            await page.execute_script("throw new Error('falhou')")
+        return True
+
+    assert run_in_page(fixture_server.url('/amazon', elements=5), fail)
+
+def test_extract_table_cdp_matches_http_backend(squad, chrome_path, fixture_server):
+    async def extract(page):
+        return await squad.extract_table_cdp(page, compact_rows=True)
+
+    headers, rows = run_in_page(fixture_server.url('/challenging_dom', rows=25), extract)
+    assert headers[:2] == ['Lorem', 'Ipsum']
+    assert len(rows) == 25
+    last = rows[-1]
+    assert (last['linha'], last['Lorem'], last['Ipsum']) == (25, 'Iuvaret24', 'Apeirian24')
+    assert last['botoes_disponiveis'] == ['edit', 'delete']
+    assert last['edit_href'].endswith('#edit')
+
+def test_run_batch_strategies_cdp(solo, chrome_path, fixture_server):
+    url = fixture_server.url('/amazon', elements=20, images=7, links=4)
+    demo = solo.EcommerceMappingDemo(url=url, offline=True, locator_ladder=solo.LocatorLadder())
+
+    async def map_page(page):
+        return await demo.run_batch_strategies_cdp(page, verbose=False)
+
+    results = run_in_page(url, map_page)
+    assert len(results) == len(solo.EcommerceMappingDemo.BATCH_STRATEGIES)
+    assert {result['backend'] for result in results} == {'cdp'}
+    images = results[0]
+    assert (images['estrategia'], images['quantidade_total']) == ('By.TAG_NAME', 7)
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import columnar_store
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLE_JSON = os.path.join(REPO_DIR, 'challenge_dom_data_20251007_141309.json')
+TABLE_CSV = os.path.join(REPO_DIR, 'challenge_dom_data_20251007_141309.csv')
+MAPPING_JSON = os.path.join(REPO_DIR, 'ecommerce_mapping_results_20251007_141648.json')
+
+def test_archive_table_runs_round_trip(tmp_path):
+    output = str(tmp_path / 'tabelas.parquet')
+    assert columnar_store.archive([TABLE_JSON, TABLE_CSV], output) == 20
+
+    rows = list(columnar_store.iter_rows(output, batch_size=3))
+    assert len(rows) == 20
+    first = rows[0]
+    assert (first['linha'], first['Lorem'], first['timestamp']) == (1, 'Iuvaret0', '2025-10-07 14:13:02')
+    assert first['botoes_disponiveis'] == ['edit', 'delete']
+    assert {row['arquivo_origem'] for row in rows} == {os.path.basename(TABLE_JSON), os.path.basename(TABLE_CSV)}
+
+    assert columnar_store.read_columns(output, ['Lorem']).column_names == ['Lorem']
+    # Um Parquet já arquivado pode entrar em um novo arquivo
+    assert columnar_store.archive([output, TABLE_CSV], str(tmp_path / 'todas.parquet')) == 30
+
+def test_archive_mapping_report(tmp_path):
+    output = str(tmp_path / 'mapeamentos.parquet')
+    assert columnar_store.archive([MAPPING_JSON], output) == 13
+
+    rows = list(columnar_store.iter_rows(output, ['estrategia', 'encontrado', 'site_testado']))
+    assert rows[0] == {'estrategia': 'By.ID', 'encontrado': True, 'site_testado': 'Amazon Brasil'}
+
+def test_archive_rejects_mixed_kinds(tmp_path):
+    with pytest.raises(ValueError):
+        columnar_store.archive([TABLE_JSON, MAPPING_JSON], str(tmp_path / 'misturado.parquet'))
+
+def test_cli_archive_and_show(tmp_path, monkeypatch, capsys):
+    output = str(tmp_path / 'tabelas.parquet')
+    monkeypatch.setattr(sys, 'argv', ['columnar_store.py', 'archive', TABLE_CSV, '--output', output])
+    columnar_store.main()
+    assert '10 linhas' in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, 'argv', ['columnar_store.py', 'show', output, '--columns', 'linha', 'Lorem',
+                                      '--limit', '2'])
+    columnar_store.main()
+    assert capsys.readouterr().out.splitlines() == ["{'linha': 1, 'Lorem': 'Iuvaret0'}",
+                                                    "{'linha': 2, 'Lorem': 'Iuvaret1'}"]
@@ -0,0 +1,77 @@
+import pytest
+
+from command_metrics import CommandMetrics, NO_SCOPE, instrumented
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        if driver_command == 'falha':
+            raise RuntimeError(driver_command)
+        return {'value': None}
+
+class Activity:
+    def __init__(self, driver):
+        self.driver = driver
+        self.metrics = CommandMetrics()
+        self.metrics.instrument(driver)
+
+    @instrumented
+    def strategy(self):
+        self.driver.execute('findElements')
+        self.driver.execute('findElements')
+
+def test_commands_count_for_innermost_scope():
+    metrics = CommandMetrics()
+    driver = metrics.instrument(FakeDriver())
+    driver.execute('get')
+    with metrics.scope('externo'):
+        driver.execute('findElement')
+        with metrics.scope('interno'):
+            driver.execute('executeScript')
+            with pytest.raises(RuntimeError):
+                driver.execute('falha')
+
+    assert metrics.scope_summary(NO_SCOPE)['comandos'] == 1
+    assert metrics.scope_summary('externo')['comandos'] == 1
+    inner = metrics.scope_summary('interno')
+    assert inner['comandos'] == 2
+    assert inner['por_tipo']['falha']['erros'] == 1
+    assert metrics.total_commands == 4
+    assert metrics.summary()['comandos'] == 4
+
+def test_instrument_is_idempotent_and_reversible():
+    metrics = CommandMetrics()
+    driver = FakeDriver()
+    metrics.instrument(driver)
+    metrics.instrument(driver)
+    driver.execute('get')
+    assert metrics.total_commands == 1
+
+    metrics.uninstrument(driver)
+    driver.execute('get')
+    assert metrics.total_commands == 1
+    assert not hasattr(driver.execute, '__wrapped__')
+
+def test_instrumented_decorator_uses_method_name():
+    activity = Activity(FakeDriver())
+    activity.strategy()
+
+    assert activity.metrics.scope_summary('strategy')['por_tipo']['findElements']['comandos'] == 2
+
+def test_openmetrics_export(tmp_path):
+    metrics = CommandMetrics()
+    metrics.record('strategy_"1"', 'findElement', 0.25)
+    metrics.record('strategy_"1"', 'findElement', 0.5, ok=False)
+
+    text = metrics.to_openmetrics()
+    lines = text.splitlines()
+    assert lines[-1] == '# EOF' and text.endswith('\n')
+    assert '# TYPE webdriver_commands counter' in lines
+    assert '# UNIT webdriver_command_seconds seconds' in lines
+    labels = '{scope="strategy_\\"1\\"",command="findElement"}'
+    assert f'webdriver_commands_total{labels} 2' in lines
+    assert f'webdriver_command_seconds_total{labels} 0.750000' in lines
+    assert f'webdriver_command_errors_total{labels} 1' in lines
+
+    filename = metrics.write_openmetrics(str(tmp_path / 'metrics.prom'), prefix='teste')
+    with open(filename, encoding='utf-8') as f:
+        assert f.read().startswith('# TYPE teste_commands counter')
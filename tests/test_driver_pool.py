@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import driver_pool
+from driver_pool import DriverPool, PoolExhaustedError
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ['principal']
+        self.switch_to = FakeSwitchTo(self)
+        self.cdp_commands = []
+        self.urls = []
+        self.closed = False
+
+    def execute_script(self, script, *args):
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        return {}
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def quit(self):
+        self.closed = True
+
+@pytest.fixture
+def started(monkeypatch):
+    drivers = []
+    lock = threading.Lock()
+
+    def start_chrome(headless=False, stealth=False, profile=None):
+        with lock:
+            drivers.append(FakeDriver())
+            return drivers[-1]
+
+    monkeypatch.setattr(driver_pool, 'start_chrome', start_chrome)
+    return drivers
+
+def test_checkin_resets_and_reuses_session(started):
+    pool = DriverPool(size=1, warm_up=False)
+    with pool.session() as driver:
+        driver.window_handles.append('aba-extra')
+    assert driver.window_handles == ['principal']
+    assert driver.cdp_commands == ['Storage.clearDataForOrigin', 'Network.clearBrowserCookies']
+    assert driver.urls == ['about:blank']
+
+    assert pool.checkout() is driver
+    assert pool.stats == {'criadas': 1, 'reutilizadas': 1, 'substituidas': 0}
+    pool.checkin(driver)
+    pool.close()
+    assert driver.closed
+
+def test_checkout_raises_when_pool_is_exhausted(started):
+    pool = DriverPool(size=2, warm_up=True)
+    assert len(started) == 2 and pool.available() == 2
+
+    first, second = pool.checkout(), pool.checkout()
+    assert pool.available() == 0
+    with pytest.raises(PoolExhaustedError):
+        pool.checkout(timeout=0.01)
+
+    pool.checkin(first)
+    assert pool.available() == 1
+    assert pool.checkout(timeout=0.01) is first
+    pool.checkin(first)
+    pool.checkin(second)
+    pool.close()
+
+def test_checkin_rejects_foreign_or_repeated_sessions(started):
+    pool = DriverPool(size=1, warm_up=False)
+    driver = pool.checkout()
+    with pytest.raises(ValueError):
+        pool.checkin(FakeDriver())
+    pool.checkin(driver)
+    with pytest.raises(ValueError):
+        pool.checkin(driver)
+    assert pool.available() == 1
+    pool.close()
+
+def test_unhealthy_session_is_replaced(started):
+    pool = DriverPool(size=1, warm_up=True)
+    broken = started[0]
+
+    def execute_script(script, *args):
+        raise driver_pool.WebDriverException("sessão morta")
+
+    broken.execute_script = execute_script
+    driver = pool.checkout()
+
+    assert driver is not broken and broken.closed
+    assert pool.stats == {'criadas': 2, 'reutilizadas': 0, 'substituidas': 1}
+    pool.checkin(driver)
+    pool.close()
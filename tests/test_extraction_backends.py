@@ -0,0 +1,44 @@
+import contextlib
+import io
+
+import pytest
+
+def extract(challenge):
+    """Carrega a página e extrai a tabela sem poluir a saída, fechando a sessão no fim"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            assert challenge.load_page()
+            assert challenge.extract_table_data()
+        finally:
+            challenge.close()
+    return challenge
+
+def test_http_backend_extracts_fixture_table(squad, fixture_server):
+    with contextlib.redirect_stdout(io.StringIO()):
+        challenge = squad.ChallengeDOM(backend='http', url=fixture_server.url('/challenging_dom', rows=25))
+    extract(challenge)
+
+    assert len(challenge.data) == 25
+    assert challenge.headers[:2] == ['Lorem', 'Ipsum']
+    last = challenge.data[-1]
+    assert (last['linha'], last['Lorem'], last['Ipsum']) == (25, 'Iuvaret24', 'Apeirian24')
+    assert last['botoes_disponiveis'] == ['edit', 'delete']
+    assert last['edit_href'].endswith('#edit')
+    assert challenge.command_count == 0
+
+def test_script_backend_command_count_does_not_grow_with_rows(squad, fixture_server):
+    counts = {}
+    for rows in (10, 1000):
+        with contextlib.redirect_stdout(io.StringIO()):
+            challenge = squad.ChallengeDOM(headless=True, backend='script',
+                                           url=fixture_server.url('/challenging_dom', rows=rows))
+            try:
+                challenge.driver  # Aguarda o boot do Chrome
+            except Exception as e:
+                pytest.skip(f"Chrome indisponível: {e}")
+        extract(challenge)
+
+        assert len(challenge.data) == rows
+        counts[rows] = challenge.last_extraction_commands
+
+    assert counts[10] == counts[1000]
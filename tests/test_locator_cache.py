@@ -0,0 +1,64 @@
+import time
+
+from locator_cache import LocatorCache, MISSING
+
+def test_lru_evicts_least_recently_used():
+    cache = LocatorCache(max_entries=2, ttl=None)
+    cache.put('u', 'fp', 'a', 1)
+    cache.put('u', 'fp', 'b', 2)
+    assert cache.get('u', 'fp', 'a') == 1  # 'a' passa a ser a mais recente
+    cache.put('u', 'fp', 'c', 3)
+
+    assert len(cache) == 2
+    assert cache.get('u', 'fp', 'b') is MISSING
+    assert (cache.get('u', 'fp', 'a'), cache.get('u', 'fp', 'c')) == (1, 3)
+    assert cache.stats['removidas_lru'] == 1
+
+def test_ttl_expires_entries(monkeypatch):
+    cache = LocatorCache(ttl=10)
+    cache.put('u', 'fp', 'a', 1)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 11)
+
+    assert cache.get('u', 'fp', 'a', default=None) is None
+    assert len(cache) == 0
+    assert cache.stats['expiradas'] == 1
+
+def test_entries_are_keyed_by_dom_fingerprint():
+    cache = LocatorCache(ttl=None)
+    cache.put('u', 'antes', 'a', 1)
+
+    assert cache.get('u', 'depois', 'a') is MISSING  # DOM mudou: o resultado antigo não vale
+    cache.put('u', 'depois', 'a', 2)
+    assert (cache.get('u', 'antes', 'a'), cache.get('u', 'depois', 'a')) == (1, 2)
+    assert cache.get('outra', 'antes', 'a') is MISSING
+
+def test_save_merges_entries_from_other_processes(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    first = LocatorCache(ttl=None, path=path)
+    second = LocatorCache(ttl=None, path=path)
+    first.put('u', 'fp', 'a', 1)
+    first.put('u', 'fp', 'comum', 'antigo')
+    first.save()
+    second.put('u', 'fp', 'b', 2)
+    second.put('u', 'fp', 'comum', 'novo')
+    second.save()
+
+    reloaded = LocatorCache(ttl=None, path=path)
+    assert len(reloaded) == 3
+    assert reloaded.get('u', 'fp', 'a') == 1
+    assert reloaded.get('u', 'fp', 'b') == 2
+    assert reloaded.get('u', 'fp', 'comum') == 'novo'
+
+def test_save_drops_expired_entries(tmp_path, monkeypatch):
+    path = str(tmp_path / 'cache.json')
+    cache = LocatorCache(ttl=10, path=path)
+    cache.put('u', 'fp', 'velha', 1)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 11)
+    cache.put('u', 'fp', 'nova', 2)
+    cache.save()
+
+    reloaded = LocatorCache(ttl=10, path=path)
+    assert reloaded.get('u', 'fp', 'velha') is MISSING
+    assert reloaded.get('u', 'fp', 'nova') == 2
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.common.exceptions import NoSuchElementException
+
+from locator_ladder import LocatorLadder
+
+CANDIDATES = [('id', 'a'), ('id', 'b'), ('id', 'c')]
+
+class FakeDriver:
+    def __init__(self, present):
+        self.present = present
+        self.calls = []
+
+    def find_elements(self, by, value):
+        self.calls.append((by, value))
+        return ['elemento'] if (by, value) in self.present else []
+
+def test_order_keeps_declared_order_without_history():
+    assert LocatorLadder().order('botao', CANDIDATES) == CANDIDATES
+
+def test_order_prefers_successful_and_fast_candidates():
+    ladder = LocatorLadder()
+    for _ in range(5):
+        ladder.record('botao', ('id', 'a'), False, 0.1)
+        ladder.record('botao', ('id', 'b'), True, 0.5)
+        ladder.record('botao', ('id', 'c'), True, 0.05)
+
+    assert ladder.order('botao', CANDIDATES) == [('id', 'c'), ('id', 'b'), ('id', 'a')]
+    assert ladder.summary('botao')['id=a']['taxa_sucesso'] == 0
+
+def test_unknown_candidate_goes_between_working_and_failing_ones():
+    ladder = LocatorLadder()
+    ladder.record('botao', ('id', 'a'), False, 0.1)
+    ladder.record('botao', ('id', 'c'), True, 0.1)
+
+    assert ladder.order('botao', CANDIDATES) == [('id', 'c'), ('id', 'b'), ('id', 'a')]
+
+def test_find_records_attempts_and_reorders():
+    ladder = LocatorLadder()
+    driver = FakeDriver(present={('id', 'c')})
+
+    element, candidate, attempts = ladder.find(driver, 'botao', CANDIDATES)
+    assert (element, candidate, attempts) == ('elemento', ('id', 'c'), 3)
+
+    driver.calls.clear()
+    assert ladder.find(driver, 'botao', CANDIDATES)[2] == 1
+    assert driver.calls == [('id', 'c')]
+
+    with pytest.raises(NoSuchElementException):
+        ladder.find(FakeDriver(present=set()), 'botao', CANDIDATES)
+
+def test_save_adds_counts_from_other_instances(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    first = LocatorLadder(path=path)
+    second = LocatorLadder(path=path)
+    first.record('botao', ('id', 'a'), True, 0.1)
+    second.record('botao', ('id', 'a'), False, 0.3)
+    second.record('botao', ('id', 'b'), True, 0.2)
+    first.save()
+    second.save()
+    second.save()  # Sem tentativas novas: não soma de novo
+
+    summary = LocatorLadder(path=path).summary('botao')
+    assert summary['id=a'] == {'tentativas': 2, 'taxa_sucesso': 0.5, 'latencia_media': 0.2}
+    assert summary['id=b']['tentativas'] == 1
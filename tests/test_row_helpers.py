@@ -0,0 +1,64 @@
+import csv
+import json
+
+import pytest
+
+HEADERS = ['Lorem', 'Ipsum', 'Lorem', 'Action']
+BUTTONS = [('edit', 'http://x/#edit'), ('delete', 'http://x/#delete')]
+
+def test_compact_row_matches_build_row(squad):
+    for cell_texts in (['a', 'b', 'c', 'acao'], ['a', 'b'], []):
+        expected = squad.ChallengeDOM._build_row(7, HEADERS, cell_texts, BUTTONS)
+        row = squad.RowContext(HEADERS, timestamp=expected['timestamp']).build(7, cell_texts, BUTTONS)
+
+        assert dict(row) == expected
+        assert list(row) == list(expected)
+        assert len(row) == len(expected)
+    with pytest.raises(KeyError):
+        row['Action']
+
+def test_row_writer_appends_jsonl(squad, tmp_path):
+    filename = str(tmp_path / 'linhas.jsonl')
+    context = squad.RowContext(HEADERS, timestamp='2025-10-07 14:13:02')
+    for first, append in ((1, False), (3, True)):
+        writer = squad.row_writer(filename, 'jsonl', append=append)
+        next(writer)
+        assert writer.send(context.build(first, ['a', 'b', 'c'], BUTTONS)) == 1
+        assert writer.send({'linha': first + 1}) == 2
+        writer.close()
+
+    with open(filename, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert [row['linha'] for row in rows] == [1, 2, 3, 4]
+    assert rows[0]['Lorem'] == 'c' and rows[0]['botoes_disponiveis'] == ['edit', 'delete']
+
+def test_row_writer_appends_csv_with_single_header(squad, tmp_path):
+    filename = str(tmp_path / 'linhas.csv')
+    for linha, append in ((1, False), (2, True)):
+        writer = squad.row_writer(filename, 'csv', append=append)
+        next(writer)
+        writer.send({'linha': linha, 'Lorem': f'valor{linha}'})
+        writer.close()
+
+    with open(filename, newline='', encoding='utf-8') as f:
+        assert list(csv.DictReader(f)) == [{'linha': '1', 'Lorem': 'valor1'}, {'linha': '2', 'Lorem': 'valor2'}]
+
+    with pytest.raises(ValueError):
+        next(squad.row_writer(str(tmp_path / 'linhas.xml'), 'xml'))
+
+def test_load_action_plan_formats(squad, tmp_path):
+    expected = [(2, 'edit'), (5, 'delete')]
+    json_plan = tmp_path / 'plano.json'
+    json_plan.write_text(json.dumps([[2, 'edit'], {'linha': '5', 'acao': 'delete'}]), encoding='utf-8')
+    jsonl_plan = tmp_path / 'plano.jsonl'
+    jsonl_plan.write_text('{"linha": 2, "acao": "edit"}\n\n[5, "delete"]\n', encoding='utf-8')
+    csv_plan = tmp_path / 'plano.csv'
+    csv_plan.write_text('linha,acao\n2,edit\n5,delete\n', encoding='utf-8')
+
+    for plan in (json_plan, jsonl_plan, csv_plan):
+        assert squad.load_action_plan(str(plan)) == expected
+
+    missing = tmp_path / 'sem_acao.json'
+    missing.write_text(json.dumps([{'linha': 1}]), encoding='utf-8')
+    with pytest.raises(ValueError):
+        squad.load_action_plan(str(missing))
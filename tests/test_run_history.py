@@ -0,0 +1,76 @@
+import json
+import os
+import sys
+
+import run_history
+from run_history import RunHistory
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = [os.path.join(REPO_DIR, name) for name in (
+    'ecommerce_mapping_results_20251007_141648.json',
+    'challenge_dom_data_20251007_141309.json',
+    'challenge_dom_data_20251007_141309.csv',
+)]
+
+def mapping_report(path, run_date, found):
+    report = {
+        'metadata': {'site_testado': 'Loja', 'url': 'http://loja', 'data_execucao': run_date},
+        'resultados': [
+            {'estrategia': 'By.ID', 'elemento': 'Busca', 'localizador': 'busca', 'encontrado': found},
+            {'estrategia': 'By.CSS_SELECTOR', 'elemento': 'Links', 'encontrado': False, 'detalhes': [
+                {'seletor': 'a.nav', 'encontrado': True, 'quantidade': 3},
+                {'seletor': 'a.velho', 'encontrado': False, 'quantidade': 0},
+            ]},
+        ]
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f)
+    return str(path)
+
+def run_cli(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, 'argv', ['run_history.py', *args])
+    run_history.main()
+    return capsys.readouterr().out
+
+def test_import_sample_files_only_once(tmp_path):
+    with RunHistory(str(tmp_path / 'historico.db')) as history:
+        assert history.import_files(SAMPLE_FILES) == 3
+        assert history.import_files(SAMPLE_FILES) == 0
+
+        runs = history.runs()
+        assert sorted(run['tipo'] for run in runs) == ['mapeamento', 'tabela', 'tabela']
+        assert {run['data_execucao'] for run in runs if run['tipo'] == 'tabela'} == {'2025-10-07 14:13:09'}
+        assert history.is_imported(os.path.abspath(SAMPLE_FILES[0]))
+
+def test_locator_rate_and_last_failure(tmp_path):
+    first = mapping_report(tmp_path / 'primeira.json', '2025-10-01 10:00:00', found=True)
+    second = mapping_report(tmp_path / 'segunda.json', '2025-10-02 10:00:00', found=False)
+    with RunHistory(str(tmp_path / 'historico.db')) as history:
+        assert history.import_files([first, second]) == 2
+
+        total = history.locator_success_rate('busca', period='total')
+        assert total == [{'localizador': 'busca', 'periodo': 'total', 'tentativas': 2, 'sucessos': 1,
+                          'taxa_sucesso': 0.5}]
+        per_day = history.locator_success_rate('busca')
+        assert [(row['periodo'], row['sucessos']) for row in per_day] == [('2025-10-01', 1), ('2025-10-02', 0)]
+        assert [row['localizador'] for row in history.locator_success_rate(since='2025-10-02')] == \
+            ['a.nav', 'a.velho', 'busca']
+
+        failure = history.last_failure('busca')
+        assert (failure['data_execucao'], failure['estrategia']) == ('2025-10-02 10:00:00', 'By.ID')
+        assert failure['arquivo_origem'] == os.path.abspath(second)
+        assert history.last_failure('a.nav') is None
+
+        # A estratégia conta como sucesso se algum seletor dos detalhes encontrou
+        css = [row for row in history.strategy_success_rate(period='total') if row['estrategia'] == 'By.CSS_SELECTOR']
+        assert (css[0]['execucoes'], css[0]['sucessos']) == (2, 2)
+
+def test_cli_import_taxa_and_ultima_falha(tmp_path, monkeypatch, capsys):
+    db = str(tmp_path / 'historico.db')
+    report = mapping_report(tmp_path / 'relatorio.json', '2025-10-03 09:00:00', found=False)
+
+    assert '1 arquivo(s) importado(s)' in run_cli(monkeypatch, capsys, '--db', db, 'import', report)
+    assert '2025-10  a.velho: 0/1 (0%)' in run_cli(monkeypatch, capsys, '--db', db, 'taxa', '--periodo', 'mes')
+    assert 'Última falha em 2025-10-03 09:00:00 (Loja, By.ID)' in \
+        run_cli(monkeypatch, capsys, '--db', db, 'ultima-falha', 'busca')
+    assert 'Nenhuma falha registrada para a.nav' in run_cli(monkeypatch, capsys, '--db', db, 'ultima-falha', 'a.nav')
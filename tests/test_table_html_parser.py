@@ -0,0 +1,30 @@
+ROWS_HTML = """
+<tr><td>a1</td><td>b1</td><td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>
+<tr><td>a2</td><td>b2</td><td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>
+"""
+HEAD_HTML = "<thead><tr><th>Lorem</th><th>Ipsum</th><th>Action</th></tr></thead>"
+
+def test_table_without_tbody_has_same_rows(squad):
+    explicit = squad.parse_table_html(f"<table>{HEAD_HTML}<tbody>{ROWS_HTML}</tbody></table>", "http://x.test/")
+    implicit = squad.parse_table_html(f"<table>{HEAD_HTML}{ROWS_HTML}</table>", "http://x.test/")
+
+    assert implicit == explicit
+    headers, rows = implicit
+    assert headers == ['Lorem', 'Ipsum', 'Action']
+    assert rows[1] == (['a2', 'b2'], [('edit', 'http://x.test/#edit'), ('delete', 'http://x.test/#delete')])
+
+def test_tfoot_rows_are_not_body_rows(squad):
+    html = f"<table>{HEAD_HTML}{ROWS_HTML}<tfoot><tr><td>total</td><td></td><td></td></tr></tfoot></table>"
+    _, rows = squad.parse_table_html(html)
+
+    assert [cells for cells, _ in rows] == [['a1', 'b1'], ['a2', 'b2']]
+
+def test_omitted_cell_and_row_end_tags(squad):
+    explicit = squad.parse_table_html(f"<table>{HEAD_HTML}<tbody>{ROWS_HTML}</tbody></table>", "http://x.test/")
+    omitted = ROWS_HTML.replace('</td>', '').replace('</tr>', '')
+    head = HEAD_HTML.replace('</th>', '').replace('</tr>', '')
+    implicit = squad.parse_table_html(f"<table>{head}<tbody>{omitted}</tbody></table>", "http://x.test/")
+    no_tbody = squad.parse_table_html(f"<table>{head}{omitted}</table>", "http://x.test/")
+
+    assert implicit == explicit
+    assert no_tbody == explicit